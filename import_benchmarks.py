@@ -3,11 +3,21 @@
 
 import json
 import sqlite3
-import gzip
+import zlib
 import base64
 import hashlib
+import math
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Server database path
 DB_PATH = "/opt/lgb/benchmarks.db"
 LOCAL_RESULTS = Path("/home/derbe/benchmark_results")
@@ -32,27 +42,91 @@ STEAM_APP_IDS = {
     "Factorio": 427520,
 }
 
+# Same App IDs keyed by result directory name (spaces stored as underscores)
+STEAM_APP_IDS_BY_DIRNAME = {
+    name.replace(' ', '_'): app_id for name, app_id in STEAM_APP_IDS.items()
+}
+
+# Resolution directory names that are imported
+RESOLUTION_DIRS = frozenset(RES_MAP) | frozenset(RES_MAP.values())
+
+# Frametimes JSON-encoded per compressor write, bounding the encode buffer
+FRAMETIME_CHUNK_SIZE = 4096
+
+# Run files parsed ahead of the SQLite writer, bounding memory held in rows
+MAX_PENDING_RUNS = 64
+
+# GPU model substrings and their short names; "7900 XTX" must precede "7900 XT"
+GPU_SHORT_NAMES = {
+    "7900 XTX": "RX 7900 XTX",
+    "7900 XT": "RX 7900 XT",
+    "7800 XT": "RX 7800 XT",
+    "RTX 4090": "RTX 4090",
+    "RTX 4080": "RTX 4080",
+    "RTX 4070": "RTX 4070",
+}
+GPU_SHORT_RE = re.compile("|".join(re.escape(key) for key in GPU_SHORT_NAMES))
+
+# Connection settings for the bulk import: WAL with synchronous=NORMAL avoids
+# an fsync per commit, and temp storage/page cache stay in memory
+IMPORT_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-131072",
+    "mmap_size=268435456",
+)
+
+# Indexes built after the bulk load: (name, table, CREATE statement)
+INDEXES = (
+    ("idx_games_name", "games",
+     "CREATE UNIQUE INDEX IF NOT EXISTS idx_games_name ON games(name)"),
+    ("idx_systems_hash", "systems",
+     "CREATE UNIQUE INDEX IF NOT EXISTS idx_systems_hash ON systems(system_hash)"),
+    ("idx_benchmark_groups_key", "benchmark_groups",
+     "CREATE UNIQUE INDEX IF NOT EXISTS idx_benchmark_groups_key "
+     "ON benchmark_groups(game_id, system_id, resolution)"),
+    ("idx_runs_group_id", "runs",
+     "CREATE INDEX IF NOT EXISTS idx_runs_group_id ON runs(group_id)"),
+)
+
+# SQL statements, kept as module constants so sqlite3's statement cache
+# prepares each of them only once per import
+INSERT_GAME_SQL = "INSERT INTO games (name, steam_app_id) VALUES (?, ?)"
+SELECT_GAMES_SQL = "SELECT id, name FROM games"
+
+INSERT_SYSTEM_SQL = """
+    INSERT INTO systems (system_hash, os, kernel, gpu, gpu_driver, cpu, ram_gb)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SELECT_SYSTEMS_SQL = "SELECT id, system_hash FROM systems"
+
+INSERT_GROUP_SQL = "INSERT INTO benchmark_groups (game_id, system_id, resolution) VALUES (?, ?, ?)"
+SELECT_GROUPS_SQL = "SELECT id, game_id, system_id, resolution FROM benchmark_groups"
+
+INSERT_RUN_SQL = """
+    INSERT INTO runs (
+        group_id, run_number, timestamp,
+        fps_avg, fps_min, fps_max, fps_median, fps_1low, fps_01low, fps_std_dev,
+        frame_count, duration_seconds,
+        stutter_rating, stutter_index, stutter_event_count,
+        consistency_rating, consistency_score, cv_percent, fps_stability,
+        frametimes_compressed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 def shorten_gpu(model):
     """Shorten GPU name."""
     if not model:
         return "Unknown"
-    if "7900 XTX" in model:
-        return "RX 7900 XTX"
-    if "7900 XT" in model and "XTX" not in model:
-        return "RX 7900 XT"
-    if "7800 XT" in model:
-        return "RX 7800 XT"
+    match = GPU_SHORT_RE.search(model)
+    if match:
+        return GPU_SHORT_NAMES[match.group()]
     if "Iris" in model and "Xe" in model:
         if "TGL" in model:
             return "Iris Xe (TGL)"
         return "Iris Xe"
-    if "RTX 4090" in model:
-        return "RTX 4090"
-    if "RTX 4080" in model:
-        return "RTX 4080"
-    if "RTX 4070" in model:
-        return "RTX 4070"
     parts = model.split("(")[0].strip()
     return parts[:40] if len(parts) > 40 else parts
 
@@ -68,22 +142,69 @@ def shorten_cpu(model):
     return " ".join(model.split()[:4])
 
 
+def load_json(path):
+    """Load a JSON file, using orjson when available."""
+    if orjson is not None:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.dumps() writes NaN/Infinity, which orjson rejects
+            return json.loads(data)
+    with open(path) as f:
+        return json.load(f)
+
+
+def dump_json(data):
+    """Serialize data to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
 def compress_frametimes(frametimes):
-    """Compress frametimes for storage."""
+    """Compress frametimes for storage.
+
+    The server decodes this column as base64-encoded gzip, so the format must
+    stay gzip; level 1 keeps most of the size reduction at a fraction of the CPU.
+    """
+    # Runs saved without frametimes store null
+    if not frametimes:
+        return ""
+
+    # Drop NaN/inf and non-numeric entries, which have no strict JSON encoding
+    frametimes = [
+        ft for ft in frametimes
+        if isinstance(ft, (int, float)) and not isinstance(ft, bool) and math.isfinite(ft)
+    ]
     if not frametimes:
         return ""
-    json_data = json.dumps(frametimes)
-    compressed = gzip.compress(json_data.encode('utf-8'))
-    return base64.b64encode(compressed).decode('ascii')
+
+    # Encode the JSON list chunk by chunk straight into a gzip stream
+    # (wbits=31), so the full JSON text is never held in memory at once
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+    parts = [compressor.compress(b"[")]
+    for start in range(0, len(frametimes), FRAMETIME_CHUNK_SIZE):
+        if start:
+            parts.append(compressor.compress(b","))
+        chunk = dump_json(frametimes[start:start + FRAMETIME_CHUNK_SIZE])
+        parts.append(compressor.compress(chunk[1:-1]))
+    parts.append(compressor.compress(b"]"))
+    parts.append(compressor.flush())
+    return base64.b64encode(b"".join(parts)).decode('ascii')
 
 
 def init_db(cursor):
-    """Initialize database tables."""
+    """Initialize database tables.
+
+    Unique and lookup indexes are created separately by create_indexes(),
+    so a bulk import can fill the tables before building them.
+    """
     # Games table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS games (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
             steam_app_id INTEGER DEFAULT 0
         )
     """)
@@ -92,7 +213,7 @@ def init_db(cursor):
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS systems (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            system_hash TEXT NOT NULL UNIQUE,
+            system_hash TEXT NOT NULL,
             os TEXT,
             kernel TEXT,
             gpu TEXT,
@@ -111,12 +232,11 @@ def init_db(cursor):
             system_id INTEGER NOT NULL,
             resolution TEXT NOT NULL,
             FOREIGN KEY (game_id) REFERENCES games(id),
-            FOREIGN KEY (system_id) REFERENCES systems(id),
-            UNIQUE(game_id, system_id, resolution)
+            FOREIGN KEY (system_id) REFERENCES systems(id)
         )
     """)
 
-    # Runs table
+    # Runs table (frametimes_compressed holds base64 gzip text, as the server expects)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS runs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -146,164 +266,224 @@ def init_db(cursor):
     """)
 
 
-def import_benchmarks():
-    """Import all benchmarks from local results with full data."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+def drop_indexes(cursor):
+    """Drop the indexes managed by create_indexes() ahead of a bulk load."""
+    for name, _table, _sql in INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
 
-    # Initialize tables
-    init_db(cursor)
 
-    # Clear existing data
-    cursor.execute("DELETE FROM runs")
-    cursor.execute("DELETE FROM benchmark_groups")
-    cursor.execute("DELETE FROM systems")
-    cursor.execute("DELETE FROM games")
-    conn.commit()
-    print("Cleared existing data")
+def create_indexes(cursor):
+    """Create unique and lookup indexes after the tables have been filled.
 
-    games_cache = {}
-    systems_cache = {}
-    groups_cache = {}
-    imported_runs = 0
+    Databases created before the indexes were split out still carry inline
+    UNIQUE constraints; their unique indexes are not duplicated.
+    """
+    for name, table, sql in INDEXES:
+        if sql.startswith("CREATE UNIQUE") and any(
+            origin == "u" for _seq, _name, _unique, origin, _partial
+            in cursor.execute(f"PRAGMA index_list({table})").fetchall()
+        ):
+            continue
+        cursor.execute(sql)
+
+
+def read_system(sys_info_path):
+    """Read a system_info.json and return its hash and systems table row."""
+    sys_info = load_json(sys_info_path)
+
+    gpu_info = sys_info.get("gpu", {})
+    cpu_info = sys_info.get("cpu", {})
+    os_info = sys_info.get("os", {})
+
+    gpu = shorten_gpu(gpu_info.get("model", "Unknown"))
+    cpu = shorten_cpu(cpu_info.get("model", "Unknown"))
+    os_name = os_info.get("name", "Linux")
+    kernel = os_info.get("kernel", "").split("-")[0]
+    mesa = gpu_info.get("driver_version", "")
+    ram_gb = int(sys_info.get("ram", {}).get("total_gb", 0))
+
+    # Create system hash
+    system_hash = hashlib.blake2b(
+        f"{os_name}_{gpu}_{cpu}".encode(), digest_size=4
+    ).hexdigest()
+
+    return system_hash, (system_hash, os_name, kernel, gpu, mesa, cpu, ram_gb)
+
+
+def build_run_row(group_id, run_data):
+    """Build a runs table row from a parsed run file."""
+    metrics = run_data.get("metrics", {})
+    fps = metrics.get("fps", {})
+    stutter = metrics.get("stutter", {})
+    frame_pacing = metrics.get("frame_pacing", {})
+
+    # Compress frametimes
+    frametimes_compressed = compress_frametimes(run_data.get("frametimes", []))
+
+    return (
+        group_id,
+        run_data.get("run_number", 1),
+        run_data.get("timestamp", ""),
+        fps.get("average"),
+        fps.get("minimum"),
+        fps.get("maximum"),
+        fps.get("median"),
+        fps.get("1_percent_low"),
+        fps.get("0.1_percent_low"),
+        fps.get("std_dev"),
+        fps.get("frame_count"),
+        fps.get("duration_seconds"),
+        (stutter.get("stutter_rating") or "").capitalize(),
+        stutter.get("stutter_index"),
+        stutter.get("event_count"),
+        (frame_pacing.get("consistency_rating") or "").capitalize(),
+        frame_pacing.get("consistency_score"),
+        frame_pacing.get("cv_percent"),
+        frame_pacing.get("fps_stability"),
+        frametimes_compressed,
+    )
+
+
+def load_run_row(group_id, run_file):
+    """Parse a run file and build its runs table row."""
+    return build_run_row(group_id, load_json(run_file))
+
+
+def iter_run_rows(pool, jobs):
+    """Yield run rows in job order while the pool parses the next files.
+
+    At most MAX_PENDING_RUNS files are in flight, so reading and compressing
+    overlap with inserting without loading every run into memory.
+    """
+    pending = deque()
+    for group_id, run_file in jobs:
+        pending.append(pool.submit(load_run_row, group_id, run_file))
+        if len(pending) >= MAX_PENDING_RUNS:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def scan_results():
+    """Walk the local results once and collect everything to import.
+
+    Returns:
+        Tuple of (games, systems, groups): games maps game name to Steam App ID,
+        systems maps system hash to its table row, and groups maps
+        (game name, system hash, resolution) to the run files of that group.
+    """
+    games = {}
+    systems = {}
+    groups = {}
 
     # Iterate through game directories
-    for game_dir in LOCAL_RESULTS.iterdir():
-        if not game_dir.is_dir():
-            continue
-        if game_dir.name.startswith('.'):
-            continue
-        if game_dir.name in ('recording_session',):
+    # os.scandir yields cached d_type info, avoiding a stat() per entry
+    with os.scandir(LOCAL_RESULTS) as it:
+        game_dirs = [entry for entry in it if entry.is_dir()]
+
+    for game_dir in game_dirs:
+        # Skip hidden and recording session directories
+        name = game_dir.name
+        if name[:1] == '.' or name == 'recording_session' or '_session_' in name:
             continue
-        if '_session_' in game_dir.name:
-            continue
-
-        game_name = game_dir.name.replace('_', ' ')
-        steam_app_id = STEAM_APP_IDS.get(game_name, 0)
 
-        # Get or create game
-        if game_name not in games_cache:
-            cursor.execute("INSERT OR IGNORE INTO games (name, steam_app_id) VALUES (?, ?)",
-                          (game_name, steam_app_id))
-            cursor.execute("SELECT id FROM games WHERE name = ?", (game_name,))
-            games_cache[game_name] = cursor.fetchone()[0]
-
-        game_id = games_cache[game_name]
+        game_name = name.replace('_', ' ')
+        games.setdefault(game_name, STEAM_APP_IDS_BY_DIRNAME.get(name, 0))
 
         # Look for system directories
-        for system_dir in game_dir.iterdir():
-            if not system_dir.is_dir():
-                continue
+        with os.scandir(game_dir.path) as it:
+            system_dirs = [entry for entry in it if entry.is_dir()]
 
+        for system_dir in system_dirs:
             # Read system info
-            sys_info_path = system_dir / "system_info.json"
+            sys_info_path = Path(system_dir.path) / "system_info.json"
             if not sys_info_path.exists():
                 continue
 
-            with open(sys_info_path) as f:
-                sys_info = json.load(f)
-
-            gpu_info = sys_info.get("gpu", {})
-            cpu_info = sys_info.get("cpu", {})
-            os_info = sys_info.get("os", {})
-
-            gpu = shorten_gpu(gpu_info.get("model", "Unknown"))
-            cpu = shorten_cpu(cpu_info.get("model", "Unknown"))
-            os_name = os_info.get("name", "Linux")
-            kernel = os_info.get("kernel", "").split("-")[0]
-            mesa = gpu_info.get("driver_version", "")
-            ram_gb = int(sys_info.get("ram", {}).get("total_gb", 0))
-
-            # Create system hash
-            system_hash = hashlib.md5(f"{os_name}_{gpu}_{cpu}".encode()).hexdigest()[:8]
-
-            # Get or create system
-            if system_hash not in systems_cache:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO systems (system_hash, os, kernel, gpu, gpu_driver, cpu, ram_gb)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (system_hash, os_name, kernel, gpu, mesa, cpu, ram_gb))
-                cursor.execute("SELECT id FROM systems WHERE system_hash = ?", (system_hash,))
-                systems_cache[system_hash] = cursor.fetchone()[0]
-
-            system_id = systems_cache[system_hash]
+            system_hash, system_row = read_system(sys_info_path)
+            systems.setdefault(system_hash, system_row)
 
             # Look for resolution directories
-            for res_dir in system_dir.iterdir():
-                if not res_dir.is_dir():
-                    continue
-                if res_dir.name not in ('FHD', 'WQHD', 'UHD', '1920x1080', '2560x1440', '3840x2160'):
+            with os.scandir(system_dir.path) as it:
+                res_dirs = [entry for entry in it if entry.is_dir()]
+
+            for res_dir in res_dirs:
+                if res_dir.name not in RESOLUTION_DIRS:
                     continue
 
                 resolution = res_dir.name
                 if resolution not in RES_MAP.values():
                     resolution = RES_MAP.get(resolution, resolution)
 
-                # Get or create benchmark group
-                group_key = (game_id, system_id, resolution)
-                if group_key not in groups_cache:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO benchmark_groups (game_id, system_id, resolution)
-                        VALUES (?, ?, ?)
-                    """, group_key)
-                    cursor.execute("""
-                        SELECT id FROM benchmark_groups
-                        WHERE game_id = ? AND system_id = ? AND resolution = ?
-                    """, group_key)
-                    groups_cache[group_key] = cursor.fetchone()[0]
-
-                group_id = groups_cache[group_key]
-
                 # Find all run files
-                for run_file in sorted(res_dir.glob("run_*.json")):
-                    with open(run_file) as f:
-                        run_data = json.load(f)
-
-                    run_number = run_data.get("run_number", 1)
-                    timestamp = run_data.get("timestamp", "")
-                    metrics = run_data.get("metrics", {})
-                    fps = metrics.get("fps", {})
-                    stutter = metrics.get("stutter", {})
-                    frame_pacing = metrics.get("frame_pacing", {})
-                    frametimes = run_data.get("frametimes", [])
-
-                    # Compress frametimes
-                    frametimes_compressed = compress_frametimes(frametimes)
-
-                    cursor.execute("""
-                        INSERT INTO runs (
-                            group_id, run_number, timestamp,
-                            fps_avg, fps_min, fps_max, fps_median, fps_1low, fps_01low, fps_std_dev,
-                            frame_count, duration_seconds,
-                            stutter_rating, stutter_index, stutter_event_count,
-                            consistency_rating, consistency_score, cv_percent, fps_stability,
-                            frametimes_compressed
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        group_id,
-                        run_number,
-                        timestamp,
-                        fps.get("average"),
-                        fps.get("minimum"),
-                        fps.get("maximum"),
-                        fps.get("median"),
-                        fps.get("1_percent_low"),
-                        fps.get("0.1_percent_low"),
-                        fps.get("std_dev"),
-                        fps.get("frame_count"),
-                        fps.get("duration_seconds"),
-                        (stutter.get("stutter_rating") or "").capitalize(),
-                        stutter.get("stutter_index"),
-                        stutter.get("event_count"),
-                        (frame_pacing.get("consistency_rating") or "").capitalize(),
-                        frame_pacing.get("consistency_score"),
-                        frame_pacing.get("cv_percent"),
-                        frame_pacing.get("fps_stability"),
-                        frametimes_compressed,
-                    ))
-                    imported_runs += 1
-
-    conn.commit()
+                with os.scandir(res_dir.path) as it:
+                    run_files = sorted(
+                        Path(entry.path) for entry in it
+                        if entry.name.startswith("run_") and entry.name.endswith(".json")
+                    )
+
+                groups.setdefault((game_name, system_hash, resolution), []).extend(run_files)
+
+    return games, systems, groups
+
+
+def import_benchmarks():
+    """Import all benchmarks from local results with full data."""
+    # Autocommit mode: transactions are managed explicitly below
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    for pragma in IMPORT_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    cursor = conn.cursor()
+
+    # Initialize tables
+    init_db(cursor)
+
+    games, systems, groups = scan_results()
+
+    # Clear existing data and import everything in one transaction
+    cursor.execute("BEGIN")
+    drop_indexes(cursor)
+    cursor.execute("DELETE FROM runs")
+    cursor.execute("DELETE FROM benchmark_groups")
+    cursor.execute("DELETE FROM systems")
+    cursor.execute("DELETE FROM games")
+    print("Cleared existing data")
+
+    # Insert all unique games, systems and groups up front, then read their
+    # ids back in one query each instead of a SELECT per new entity
+    # (executemany discards RETURNING rows, so the ids cannot come from it)
+    cursor.executemany(INSERT_GAME_SQL, games.items())
+    games_cache = {name: game_id for game_id, name in cursor.execute(SELECT_GAMES_SQL)}
+
+    cursor.executemany(INSERT_SYSTEM_SQL, systems.values())
+    systems_cache = {
+        system_hash: system_id for system_id, system_hash in cursor.execute(SELECT_SYSTEMS_SQL)
+    }
+
+    group_keys = {
+        key: (games_cache[key[0]], systems_cache[key[1]], key[2]) for key in groups
+    }
+    cursor.executemany(INSERT_GROUP_SQL, group_keys.values())
+    groups_cache = {
+        (game_id, system_id, resolution): group_id
+        for group_id, game_id, system_id, resolution in cursor.execute(SELECT_GROUPS_SQL)
+    }
+
+    # Parse and compress run files in worker threads (file reads and gzip
+    # release the GIL); SQLite writes stay on this thread
+    jobs = [
+        (groups_cache[group_keys[key]], run_file)
+        for key, run_files in groups.items()
+        for run_file in run_files
+    ]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        # Bind rows straight from the prefetching iterator in a single batch
+        cursor.executemany(INSERT_RUN_SQL, iter_run_rows(pool, jobs))
+        imported_runs = cursor.rowcount
+
+    # Build indexes in one pass over the loaded data
+    create_indexes(cursor)
+    cursor.execute("COMMIT")
     conn.close()
 
     print(f"Imported {len(games_cache)} games, {len(systems_cache)} systems, {len(groups_cache)} groups, {imported_runs} runs")
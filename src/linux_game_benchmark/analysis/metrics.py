@@ -9,20 +9,37 @@ Analyzes MangoHud CSV logs to calculate:
 """
 
 import csv
+import io
+import math
 import statistics
 from pathlib import Path
 from typing import Optional
 
 
+# statistics.mean()/stdev() compute exact fractions and dominate analysis
+# time on long logs; fsum() keeps full float accuracy at C speed.
+def _mean(values: list[float]) -> float:
+    """Arithmetic mean (accurate float summation)."""
+    return math.fsum(values) / len(values)
+
+
+def _stdev(values: list[float]) -> float:
+    """Sample standard deviation (requires at least two values)."""
+    mean = _mean(values)
+    return math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
 class FrametimeAnalyzer:
     """Analyzes frametime data from MangoHud logs."""
 
-    def __init__(self, log_path: Path):
+    def __init__(self, log_path: Path, streaming: bool = False):
         """
         Initialize analyzer with a MangoHud CSV log.
 
         Args:
             log_path: Path to the MangoHud CSV log file.
+            streaming: Only parse complete lines, for a log MangoHud is
+                still writing. Call update() to catch up with new frames.
         """
         self.log_path = Path(log_path)
         self.frametimes: list[float] = []
@@ -40,47 +57,123 @@ class FrametimeAnalyzer:
         self.ram_usage: list[float] = []
         self.resolution: Optional[str] = None
 
-        self._load_data()
+        # Parser state: bytes consumed so far and the data column layout
+        self._offset = 0
+        self._width: Optional[int] = None
+        self._columns: tuple[int, ...] = ()
 
-    def _load_data(self) -> None:
-        """Load and parse MangoHud CSV log."""
-        with open(self.log_path, "r") as f:
-            lines = f.readlines()
+        self.update(final=not streaming)
 
+    @staticmethod
+    def _find_data_start(lines: list[str]) -> Optional[int]:
+        """Index of the data header line, or None if it wasn't found."""
         # Find the FRAME METRICS section (MangoHud format v0.8+)
-        data_start = 0
         for i, line in enumerate(lines):
             if "FRAME METRICS" in line or line.startswith("fps,"):
                 # Next line is the header if this is the section marker
                 if "FRAME METRICS" in line:
-                    data_start = i + 1
-                else:
-                    data_start = i
-                break
+                    return i + 1
+                return i
             # Also try to detect header directly (old format)
             if line.startswith("frametime,") or ",frametime," in line.lower():
-                data_start = i
-                break
+                return i
+        return None
 
-        # Parse CSV from the data section
-        from io import StringIO
-        csv_data = "".join(lines[data_start:])
-        reader = csv.DictReader(StringIO(csv_data))
+    def update(self, final: bool = False) -> bool:
+        """
+        Parse frames appended to the log since the last call.
+
+        Only complete lines are consumed unless final is set, so this can
+        run while MangoHud is still writing and leaves just the tail to
+        parse once the recording stops.
+
+        Args:
+            final: The log is complete; also parse a trailing partial line.
+
+        Returns:
+            True if any lines were consumed.
+        """
+        with open(self.log_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        if not final:
+            data = data[:data.rfind(b"\n") + 1]
+        if not data:
+            return False
+        lines = io.StringIO(data.decode(), newline=None).readlines()
+
+        if self._width is None:
+            data_start = self._find_data_start(lines)
+            if not final and (data_start is None or data_start == len(lines)):
+                # Header not written yet; re-read these lines next time
+                return False
+            if data_start is None:
+                data_start = 0
+            lines = lines[data_start:]
+        self._offset += len(data)
+
+        # Parse CSV from the data section. Column positions are resolved
+        # once from the header instead of building a dict per row.
+        reader = csv.reader(lines)
+        if self._width is None:
+            header = next(reader, None)
+            if header is None:
+                return True
+            self._read_header(header)
+
+        self._parse_rows(reader)
+        return True
+
+    def _read_header(self, header: list[str]) -> None:
+        """Resolve data column positions from the CSV header."""
+        columns = {name: i for i, name in enumerate(header)}
+        width = len(header)
+        # Columns missing from the header read from an always-empty slot
+        # appended to every row
+        missing = width
+
+        def column(candidates: list[str]) -> int:
+            key = self._find_key(columns, candidates)
+            return columns[key] if key is not None else missing
+
+        self._width = width
+        self._columns = (
+            column(["frametime", "Frame Time", "frame_time"]),
+            column(["fps", "FPS"]),
+            column(["gpu_temp", "GPU Temp"]),
+            column(["cpu_temp", "CPU Temp"]),
+            column(["gpu_load", "GPU Load"]),
+            column(["cpu_load", "CPU Load"]),
+            column(["gpu_power", "GPU Power"]),
+            column(["gpu_core_clock", "GPU Core Clock"]),
+            column(["vram", "VRAM", "gpu_vram_used"]),
+            column(["resolution", "Resolution"]),
+        )
+
+    def _parse_rows(self, reader) -> None:
+        """Append the metrics of each CSV data row."""
+        width = self._width
+        (frametime_col, fps_col, gpu_temp_col, cpu_temp_col, gpu_load_col, cpu_load_col, gpu_power_col, gpu_clock_col, vram_col, res_col) = self._columns
+        pad = [""] * width
 
         for row in reader:
+            if len(row) != width:
+                # Short rows (e.g. a truncated last line) lack trailing fields
+                row = (row + pad)[:width]
+            row.append("")
+
             try:
-                # Frametime (preferred) - check various column names
-                frametime_key = self._find_key(row, ["frametime", "Frame Time", "frame_time"])
                 ft = None
                 fps = None
 
-                if frametime_key and row[frametime_key]:
-                    ft = float(row[frametime_key])
+                raw = row[frametime_col]
+                if raw:
+                    ft = float(raw)
 
                 # Also get FPS if available
-                fps_key = self._find_key(row, ["fps", "FPS"])
-                if fps_key and row[fps_key]:
-                    fps = float(row[fps_key])
+                raw = row[fps_col]
+                if raw:
+                    fps = float(raw)
 
                 # Use frametime if available, else calculate from fps
                 if ft is not None and ft > 0:
@@ -95,55 +188,55 @@ class FrametimeAnalyzer:
                         self.frametimes.append(1000.0 / fps)
 
                 # Optional: GPU temp
-                gpu_temp_key = self._find_key(row, ["gpu_temp", "GPU Temp"])
-                if gpu_temp_key and row[gpu_temp_key]:
-                    self.gpu_temps.append(float(row[gpu_temp_key]))
+                raw = row[gpu_temp_col]
+                if raw:
+                    self.gpu_temps.append(float(raw))
 
                 # Optional: CPU temp
-                cpu_temp_key = self._find_key(row, ["cpu_temp", "CPU Temp"])
-                if cpu_temp_key and row[cpu_temp_key]:
-                    self.cpu_temps.append(float(row[cpu_temp_key]))
+                raw = row[cpu_temp_col]
+                if raw:
+                    self.cpu_temps.append(float(raw))
 
                 # Optional: GPU load
-                gpu_load_key = self._find_key(row, ["gpu_load", "GPU Load"])
-                if gpu_load_key and row[gpu_load_key]:
-                    val = float(row[gpu_load_key])
+                raw = row[gpu_load_col]
+                if raw:
+                    val = float(raw)
                     if val > 0:  # Only add if actually reported
                         self.gpu_loads.append(val)
 
                 # Optional: CPU load
-                cpu_load_key = self._find_key(row, ["cpu_load", "CPU Load"])
-                if cpu_load_key and row[cpu_load_key]:
-                    val = float(row[cpu_load_key])
+                raw = row[cpu_load_col]
+                if raw:
+                    val = float(raw)
                     if val > 0:
                         self.cpu_loads.append(val)
 
                 # Optional: GPU power
-                gpu_power_key = self._find_key(row, ["gpu_power", "GPU Power"])
-                if gpu_power_key and row[gpu_power_key]:
-                    val = float(row[gpu_power_key])
+                raw = row[gpu_power_col]
+                if raw:
+                    val = float(raw)
                     if val > 0:
                         self.gpu_power.append(val)
 
                 # Optional: GPU clock
-                gpu_clock_key = self._find_key(row, ["gpu_core_clock", "GPU Core Clock"])
-                if gpu_clock_key and row[gpu_clock_key]:
-                    val = float(row[gpu_clock_key])
+                raw = row[gpu_clock_col]
+                if raw:
+                    val = float(raw)
                     if val > 0:
                         self.gpu_clock.append(val)
 
                 # Optional: VRAM
-                vram_key = self._find_key(row, ["vram", "VRAM", "gpu_vram_used"])
-                if vram_key and row[vram_key]:
-                    self.vram_usage.append(float(row[vram_key]))
+                raw = row[vram_col]
+                if raw:
+                    self.vram_usage.append(float(raw))
 
                 # Optional: Resolution (only need to capture once)
                 if self.resolution is None:
-                    res_key = self._find_key(row, ["resolution", "Resolution"])
-                    if res_key and row[res_key]:
-                        self.resolution = row[res_key]
+                    raw = row[res_col]
+                    if raw:
+                        self.resolution = raw
 
-            except (ValueError, KeyError):
+            except ValueError:
                 continue
 
     def _find_key(self, row: dict, candidates: list[str]) -> Optional[str]:
@@ -241,35 +334,53 @@ class FrametimeAnalyzer:
 
         # Get gameplay frametimes (excluding transition spikes)
         gameplay_ft = self._get_gameplay_frametimes(threshold_ms=50.0)
-        gameplay_fps = [1000.0 / ft for ft in gameplay_ft]
+
+        # Sort once (worst first) and share it between all order statistics
+        ft_sorted = sorted(gameplay_ft, reverse=True)
+        total_time = sum(gameplay_ft)
+        # Ascending FPS, since FPS falls as frametime rises
+        gameplay_fps = [1000.0 / ft for ft in ft_sorted]
 
         # Average FPS (from gameplay frametimes)
-        avg_frametime = statistics.mean(gameplay_ft)
+        avg_frametime = _mean(gameplay_ft)
         avg_fps = 1000.0 / avg_frametime
 
         # 1% Low and 0.1% Low (integral method, gameplay only)
-        low_1 = self._calculate_percentile_low_filtered(gameplay_ft, 1.0)
-        low_01 = self._calculate_percentile_low_filtered(gameplay_ft, 0.1)
+        low_1 = self._calculate_percentile_low_filtered(gameplay_ft, 1.0, ft_sorted, total_time)
+        low_01 = self._calculate_percentile_low_filtered(gameplay_ft, 0.1, ft_sorted, total_time)
 
         return {
             "average": round(avg_fps, 2),
-            "minimum": round(min(gameplay_fps), 2),
-            "maximum": round(max(gameplay_fps), 2),
+            "minimum": round(gameplay_fps[0], 2),
+            "maximum": round(gameplay_fps[-1], 2),
             "median": round(statistics.median(gameplay_fps), 2),
             "1_percent_low": round(low_1, 2),
             "0.1_percent_low": round(low_01, 2),
-            "std_dev": round(statistics.stdev(gameplay_fps), 2) if len(gameplay_fps) > 1 else 0,
+            "std_dev": round(_stdev(gameplay_fps), 2) if len(gameplay_fps) > 1 else 0,
             "frame_count": len(gameplay_ft),
-            "duration_seconds": round(sum(gameplay_ft) / 1000.0, 2),
+            "duration_seconds": round(total_time / 1000.0, 2),
         }
 
-    def _calculate_percentile_low_filtered(self, frametimes: list[float], percentile: float) -> float:
-        """Calculate x% low FPS from filtered frametimes."""
+    def _calculate_percentile_low_filtered(
+        self,
+        frametimes: list[float],
+        percentile: float,
+        frametimes_sorted: Optional[list[float]] = None,
+        total_time: Optional[float] = None,
+    ) -> float:
+        """
+        Calculate x% low FPS from filtered frametimes.
+
+        Callers computing several lows can pass the frametimes already
+        sorted worst-first, and their sum, to skip re-sorting.
+        """
         if not frametimes:
             return 0.0
 
-        frametimes_sorted = sorted(frametimes, reverse=True)
-        total_time = sum(frametimes)
+        if frametimes_sorted is None:
+            frametimes_sorted = sorted(frametimes, reverse=True)
+        if total_time is None:
+            total_time = sum(frametimes)
         target_time = total_time * (percentile / 100.0)
 
         cumulative = 0.0
@@ -314,7 +425,7 @@ class FrametimeAnalyzer:
         if not self.frametimes:
             return {}
 
-        mean_ft = statistics.mean(self.frametimes)
+        mean_ft = _mean(self.frametimes)
 
         # Detect all high-frametime events and classify them
         transition_events = []
@@ -337,14 +448,14 @@ class FrametimeAnalyzer:
         # Calculate gameplay stutter index (excluding transition spikes)
         gameplay_frametimes = self._get_gameplay_frametimes(threshold_ms)
         if gameplay_frametimes and len(gameplay_frametimes) > 1:
-            gameplay_mean = statistics.mean(gameplay_frametimes)
-            gameplay_std = statistics.stdev(gameplay_frametimes)
+            gameplay_mean = _mean(gameplay_frametimes)
+            gameplay_std = _stdev(gameplay_frametimes)
             gameplay_stutter_index = (gameplay_std / gameplay_mean) * 100 if gameplay_mean > 0 else 0
         else:
             gameplay_stutter_index = 0
 
         # Full stutter index (for reference)
-        std_ft = statistics.stdev(self.frametimes) if len(self.frametimes) > 1 else 0
+        std_ft = _stdev(self.frametimes) if len(self.frametimes) > 1 else 0
         full_stutter_index = (std_ft / mean_ft) * 100 if mean_ft > 0 else 0
 
         # Stutter sequences (consecutive bad frames - these are real stutter)
@@ -597,11 +708,11 @@ class FrametimeAnalyzer:
             for i in range(1, len(gameplay_ft))
         ]
 
-        avg_frametime = statistics.mean(gameplay_ft)
+        avg_frametime = _mean(gameplay_ft)
 
         # Consistency score (lower is better)
         # Based on how close frametimes are to each other
-        consistency_score = statistics.mean(deltas) / avg_frametime * 100
+        consistency_score = _mean(deltas) / avg_frametime * 100
 
         # Use pre-calculated FPS metrics if provided, otherwise calculate
         if fps_metrics:
@@ -612,8 +723,8 @@ class FrametimeAnalyzer:
         else:
             # Calculate from gameplay frametimes
             gameplay_fps = [1000.0 / ft for ft in gameplay_ft]
-            avg_fps = statistics.mean(gameplay_fps)
-            std_fps = statistics.stdev(gameplay_fps) if len(gameplay_fps) > 1 else 0
+            avg_fps = _mean(gameplay_fps)
+            std_fps = _stdev(gameplay_fps) if len(gameplay_fps) > 1 else 0
             cv = (std_fps / avg_fps * 100) if avg_fps > 0 else 0
             low_1 = self._calculate_percentile_low_filtered(gameplay_ft, 1.0)
 
@@ -621,7 +732,7 @@ class FrametimeAnalyzer:
         consistency_rating = self._rate_frame_consistency(cv, avg_fps, low_1)
 
         return {
-            "avg_delta_ms": round(statistics.mean(deltas), 2),
+            "avg_delta_ms": round(_mean(deltas), 2),
             "max_delta_ms": round(max(deltas), 2),
             "consistency_score": round(consistency_score, 2),
             "consistency_rating": consistency_rating,
@@ -726,43 +837,43 @@ class FrametimeAnalyzer:
 
         if self.gpu_temps:
             result["gpu_temp"] = {
-                "avg": round(statistics.mean(self.gpu_temps), 1),
+                "avg": round(_mean(self.gpu_temps), 1),
                 "max": round(max(self.gpu_temps), 1),
             }
 
         if self.cpu_temps:
             result["cpu_temp"] = {
-                "avg": round(statistics.mean(self.cpu_temps), 1),
+                "avg": round(_mean(self.cpu_temps), 1),
                 "max": round(max(self.cpu_temps), 1),
             }
 
         if self.gpu_loads:
             result["gpu_load"] = {
-                "avg": round(statistics.mean(self.gpu_loads), 1),
+                "avg": round(_mean(self.gpu_loads), 1),
                 "max": round(max(self.gpu_loads), 1),
             }
 
         if self.cpu_loads:
             result["cpu_load"] = {
-                "avg": round(statistics.mean(self.cpu_loads), 1),
+                "avg": round(_mean(self.cpu_loads), 1),
                 "max": round(max(self.cpu_loads), 1),
             }
 
         if self.gpu_power:
             result["gpu_power"] = {
-                "avg": round(statistics.mean(self.gpu_power), 1),
+                "avg": round(_mean(self.gpu_power), 1),
                 "max": round(max(self.gpu_power), 1),
             }
 
         if self.gpu_clock:
             result["gpu_clock"] = {
-                "avg": round(statistics.mean(self.gpu_clock), 0),
+                "avg": round(_mean(self.gpu_clock), 0),
                 "max": round(max(self.gpu_clock), 0),
             }
 
         if self.vram_usage:
             result["vram"] = {
-                "avg_mb": round(statistics.mean(self.vram_usage), 0),
+                "avg_mb": round(_mean(self.vram_usage), 0),
                 "max_mb": round(max(self.vram_usage), 0),
             }
 
@@ -778,10 +889,10 @@ class FrametimeAnalyzer:
         Returns:
             Dictionary with bottleneck analysis.
         """
-        avg_fps = statistics.mean(self.fps_values) if self.fps_values else 0
-        avg_cpu = statistics.mean(self.cpu_loads) if self.cpu_loads else 0
-        avg_gpu = statistics.mean(self.gpu_loads) if self.gpu_loads else 0
-        avg_gpu_power = statistics.mean(self.gpu_power) if self.gpu_power else 0
+        avg_fps = _mean(self.fps_values) if self.fps_values else 0
+        avg_cpu = _mean(self.cpu_loads) if self.cpu_loads else 0
+        avg_gpu = _mean(self.gpu_loads) if self.gpu_loads else 0
+        avg_gpu_power = _mean(self.gpu_power) if self.gpu_power else 0
 
         # Determine bottleneck
         bottleneck = "unknown"
@@ -5,6 +5,7 @@ from linux_game_benchmark.api.client import (
     UploadResult,
     upload_benchmark,
     check_api_status,
+    cached_api_status,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "UploadResult",
     "upload_benchmark",
     "check_api_status",
+    "cached_api_status",
 ]
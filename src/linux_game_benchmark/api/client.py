@@ -4,8 +4,11 @@ API Client for Linux Game Bench.
 Handles benchmark uploads and API communication.
 """
 
+import json
+import time
 import httpx
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Any, Tuple
 
 from linux_game_benchmark.config.settings import settings
@@ -36,16 +39,37 @@ class UploadResult:
 class BenchmarkAPIClient:
     """Client for Linux Game Bench API."""
 
-    def __init__(self, base_url: Optional[str] = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
         """
         Initialize API client.
 
         Args:
             base_url: API base URL. Defaults to settings.API_BASE_URL.
             timeout: Request timeout in seconds.
+            transport: httpx transport to send requests through (e.g. httpx.MockTransport).
         """
         self.base_url = base_url or settings.API_BASE_URL
         self.timeout = timeout
+        self.transport = transport
+        self._http: Optional[httpx.Client] = None
+
+    @property
+    def http(self) -> httpx.Client:
+        """HTTP client shared by all requests, so connections (and TLS sessions) are reused."""
+        if self._http is None:
+            self._http = httpx.Client(timeout=self.timeout, transport=self.transport)
+        return self._http
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers including auth if logged in."""
@@ -80,18 +104,18 @@ class BenchmarkAPIClient:
             return False, "No auth token"
 
         try:
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(
-                    f"{self.base_url}/auth/me",
-                    headers=auth_header,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return True, data.get("username", "Unknown")
-                elif response.status_code == 401:
-                    return False, "Session expired - please login again"
-                else:
-                    return False, f"Auth check failed ({response.status_code})"
+            response = self.http.get(
+                f"{self.base_url}/auth/me",
+                headers=auth_header,
+                timeout=5.0,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                return True, data.get("username", "Unknown")
+            elif response.status_code == 401:
+                return False, "Session expired - please login again"
+            else:
+                return False, f"Auth check failed ({response.status_code})"
         except Exception as e:
             return False, f"Could not verify auth: {e}"
 
@@ -167,36 +191,35 @@ class BenchmarkAPIClient:
         }
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/benchmark",
-                    json=payload,
-                    headers=self._get_headers(),
-                )
+            response = self.http.post(
+                f"{self.base_url}/benchmark",
+                json=payload,
+                headers=self._get_headers(),
+            )
 
-                if response.status_code == 200 or response.status_code == 201:
-                    data = response.json()
-                    return UploadResult(
-                        success=True,
-                        benchmark_id=data.get("id"),
-                        url=data.get("url"),
-                    )
-                elif response.status_code == 401:
-                    return UploadResult(
-                        success=False,
-                        error="Authentication failed. Please login again."
-                    )
-                elif response.status_code == 429:
-                    return UploadResult(
-                        success=False,
-                        error="Rate limit reached. Please try again later."
-                    )
-                else:
-                    error_detail = response.json().get("detail", response.text)
-                    return UploadResult(
-                        success=False,
-                        error=f"Upload failed ({response.status_code}): {error_detail}"
-                    )
+            if response.status_code == 200 or response.status_code == 201:
+                data = response.json()
+                return UploadResult(
+                    success=True,
+                    benchmark_id=data.get("id"),
+                    url=data.get("url"),
+                )
+            elif response.status_code == 401:
+                return UploadResult(
+                    success=False,
+                    error="Authentication failed. Please login again."
+                )
+            elif response.status_code == 429:
+                return UploadResult(
+                    success=False,
+                    error="Rate limit reached. Please try again later."
+                )
+            else:
+                error_detail = response.json().get("detail", response.text)
+                return UploadResult(
+                    success=False,
+                    error=f"Upload failed ({response.status_code}): {error_detail}"
+                )
 
         except httpx.ConnectError:
             return UploadResult(
@@ -225,16 +248,15 @@ class BenchmarkAPIClient:
             Dict with benchmarks list and count.
         """
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{self.base_url}/game/{steam_app_id}/benchmarks",
-                    headers=self._get_headers(),
-                )
+            response = self.http.get(
+                f"{self.base_url}/game/{steam_app_id}/benchmarks",
+                headers=self._get_headers(),
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": response.text, "count": 0, "benchmarks": []}
+            if response.status_code == 200:
+                return response.json()
+            else:
+                return {"error": response.text, "count": 0, "benchmarks": []}
 
         except Exception as e:
             return {"error": str(e), "count": 0, "benchmarks": []}
@@ -247,11 +269,10 @@ class BenchmarkAPIClient:
             True if API is healthy, False otherwise.
         """
         try:
-            with httpx.Client(timeout=5.0) as client:
-                # Use base URL without /api/v1 for health check
-                base = self.base_url.replace("/api/v1", "")
-                response = client.get(f"{base}/health")
-                return response.status_code == 200
+            # Use base URL without /api/v1 for health check
+            base = self.base_url.replace("/api/v1", "")
+            response = self.http.get(f"{base}/health", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -263,18 +284,23 @@ class BenchmarkAPIClient:
             New version string if available, None otherwise.
         """
         try:
-            with httpx.Client(timeout=3.0) as client:
-                response = client.get(f"{self.base_url}/version")
-                if response.status_code == 200:
-                    latest = response.json().get("version")
-                    if latest and _is_newer_version(latest, settings.CLIENT_VERSION):
-                        return latest
+            response = self.http.get(f"{self.base_url}/version", timeout=3.0)
+            if response.status_code == 200:
+                latest = response.json().get("version")
+                if latest and _is_newer_version(latest, settings.CLIENT_VERSION):
+                    return latest
         except Exception:
             pass  # Silently fail - don't block user
         return None
 
 
 # Convenience functions
+@lru_cache(maxsize=None)
+def _shared_client(base_url: str) -> BenchmarkAPIClient:
+    """API client reused by the convenience functions, per API URL."""
+    return BenchmarkAPIClient(base_url=base_url)
+
+
 def upload_benchmark(
     steam_app_id: int,
     game_name: str,
@@ -289,9 +315,10 @@ def upload_benchmark(
     """
     Upload a benchmark result.
 
-    Convenience function that creates a client and uploads.
+    Convenience function that uploads through the shared client, so
+    consecutive uploads in a session reuse the same connection.
     """
-    client = BenchmarkAPIClient()
+    client = _shared_client(settings.API_BASE_URL)
     return client.upload_benchmark(
         steam_app_id=steam_app_id,
         game_name=game_name,
@@ -307,13 +334,43 @@ def upload_benchmark(
 
 def check_api_status() -> bool:
     """Check if the API is reachable."""
-    client = BenchmarkAPIClient()
+    client = _shared_client(settings.API_BASE_URL)
     return client.health_check()
 
 
+API_STATUS_CACHE_FILE = settings.CACHE_DIR / "api_status.json"
+API_STATUS_TTL_SECONDS = 60
+
+
+def cached_api_status() -> bool:
+    """
+    Check if the API is reachable, reusing a recent successful probe.
+
+    A successful health check is remembered per API URL for
+    API_STATUS_TTL_SECONDS. Failures are never cached, so an outage is
+    re-checked on the next call.
+    """
+    url = settings.API_BASE_URL
+    try:
+        cached = json.loads(API_STATUS_CACHE_FILE.read_text())
+        if cached.get("url") == url and cached.get("ok") and time.time() - cached.get("ts", 0) < API_STATUS_TTL_SECONDS:
+            return True
+    except (json.JSONDecodeError, IOError, AttributeError, TypeError, ValueError):
+        pass
+
+    ok = check_api_status()
+    if ok:
+        try:
+            API_STATUS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            API_STATUS_CACHE_FILE.write_text(json.dumps({"url": url, "ts": time.time(), "ok": True}))
+        except IOError:
+            pass  # Caching is best-effort
+    return ok
+
+
 def check_for_updates() -> Optional[str]:
     """Check if a newer client version is available."""
-    client = BenchmarkAPIClient()
+    client = _shared_client(settings.API_BASE_URL)
     return client.check_for_updates()
 
 
@@ -324,5 +381,5 @@ def verify_auth() -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, username or error message)
     """
-    client = BenchmarkAPIClient()
+    client = _shared_client(settings.API_BASE_URL)
     return client.verify_auth()
@@ -27,7 +27,6 @@ from linux_game_benchmark.steam.launch_options import (
     get_launch_options,
 )
 from linux_game_benchmark.benchmark.storage import BenchmarkStorage
-from linux_game_benchmark.analysis.report_generator import generate_overview_report
 
 
 class BenchmarkType(Enum):
@@ -65,6 +64,7 @@ class BenchmarkResult:
     end_time: Optional[datetime] = None
     duration_seconds: float = 0.0
     metrics: dict = field(default_factory=dict)
+    frametimes: list[float] = field(default_factory=list)
     error: Optional[str] = None
 
 
@@ -104,6 +104,15 @@ class BenchmarkRunner:
         self.mangohud = MangoHudManager(output_dir=self.output_dir)
         self.launcher: Optional[GameLauncher] = None
         self._current_session: Optional[BenchmarkSession] = None
+        self._storage: Optional[BenchmarkStorage] = None
+        self._mangohud_manager: Optional[MangoHudConfigManager] = None
+
+    @property
+    def storage(self) -> BenchmarkStorage:
+        """Lazy-load benchmark storage (shared by all sessions of this runner)."""
+        if self._storage is None:
+            self._storage = BenchmarkStorage()
+        return self._storage
 
     def _log(self, message: str) -> None:
         """Log a status message."""
@@ -240,7 +249,7 @@ class BenchmarkRunner:
             # Restore original MangoHud config
             try:
                 self._log("Restoring original MangoHud config...")
-                if hasattr(self, '_mangohud_manager'):
+                if self._mangohud_manager is not None:
                     self._mangohud_manager.restore_config()
             except Exception as e:
                 self._log(f"Warning: Could not restore MangoHud config: {e}")
@@ -263,20 +272,9 @@ class BenchmarkRunner:
         # Regenerate overview report automatically
         try:
             self._log("Regenerating overview report...")
-            storage = BenchmarkStorage()
-            all_games = storage.get_all_games()
-
-            if all_games:
-                all_games_data = {}
-                for game_name in all_games:
-                    systems_data = storage.get_all_systems_data(game_name)
-                    if systems_data:
-                        all_games_data[game_name] = systems_data
-
-                if all_games_data:
-                    output_path = storage.base_dir / "index.html"
-                    generate_overview_report(all_games_data, output_path)
-                    self._log(f"Overview report updated: {output_path}")
+            output_path = self.storage.regenerate_overview_report(raise_errors=True)
+            if output_path:
+                self._log(f"Overview report updated: {output_path}")
         except Exception as e:
             self._log(f"Warning: Could not regenerate overview report: {e}")
 
@@ -422,6 +420,8 @@ class BenchmarkRunner:
                 try:
                     analyzer = FrametimeAnalyzer(log_path)
                     result.metrics = analyzer.analyze()
+                    # Keep the parsed frametimes so callers don't re-read the CSV
+                    result.frametimes = analyzer.frametimes
                     self._log(f"Captured {validation['rows']} frames")
                 except Exception as e:
                     result.error = f"Analysis error: {e}"
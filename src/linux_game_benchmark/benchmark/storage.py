@@ -14,6 +14,7 @@ all systems is kept and can be viewed/compared in the reports.
 import hashlib
 import json
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
@@ -42,8 +43,8 @@ class SystemFingerprint:
             "os_name": self.os_name,
         }
 
-    def hash(self) -> str:
-        """Generate a hash of the system configuration (excludes OS name for stability)."""
+    @cached_property
+    def _hash(self) -> str:
         # Hash based on hardware, not OS name (so same HW = same hash)
         data = json.dumps({
             "gpu_model": self.gpu_model,
@@ -53,6 +54,10 @@ class SystemFingerprint:
         }, sort_keys=True)
         return hashlib.sha256(data.encode()).hexdigest()[:8]
 
+    def hash(self) -> str:
+        """Generate a hash of the system configuration (excludes OS name for stability)."""
+        return self._hash
+
     def get_system_id(self) -> str:
         """Get a readable system identifier like 'CachyOS_c21b11a6'."""
         os_clean = self.os_name.replace(" ", "").replace("/", "-")[:20]
@@ -122,6 +127,14 @@ class BenchmarkStorage:
         self.base_dir = base_dir or Path.home() / "benchmark_results"
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self._current_system_id: Optional[str] = None
+        # get_all_resolutions() results, keyed by (game_id, system_id), and
+        # load_all() aggregates, keyed by game_id. Cleared whenever a run is saved.
+        self._resolutions_cache: dict[tuple, dict[str, list[dict]]] = {}
+        self._aggregated_cache: dict[Union[int, str], dict[str, dict]] = {}
+        # Fingerprints saved by this instance: (game_id, system_id) -> (hash, system info JSON)
+        self._saved_fingerprints: dict[tuple[str, str], tuple[str, str]] = {}
+        # Parsed game_info.json files: path -> (mtime_ns, data)
+        self._game_info_cache: dict[Path, tuple[int, dict]] = {}
 
     def get_game_dir(self, game_id: Union[int, str]) -> Path:
         """
@@ -239,20 +252,43 @@ class BenchmarkStorage:
         return None
 
     def save_fingerprint(self, game_id: Union[int, str], fp: SystemFingerprint, system_info: dict) -> None:
-        """Save system fingerprint and full system info."""
+        """
+        Save system fingerprint and full system info.
+
+        Skips the write when both files already hold the same data, so
+        repeated sessions on an unchanged system don't rewrite them. Within
+        one storage instance, saving the same data again does no disk I/O.
+        """
         system_id = fp.get_system_id()
         self._current_system_id = system_id
-        system_dir = self.get_system_dir(game_id, system_id)
+        info_text = json.dumps(system_info, indent=2)
+        key = (str(game_id), system_id)
+        if self._saved_fingerprints.get(key) == (fp.hash(), info_text):
+            return
 
-        # Save fingerprint
+        system_dir = self.get_system_dir(game_id, system_id)
+        fp_file = system_dir / "fingerprint.json"
+        info_file = system_dir / "system_info.json"
         fp_data = fp.to_dict()
         fp_data["hash"] = fp.hash()
         fp_data["system_id"] = system_id
+
+        try:
+            stored = json.loads(fp_file.read_text())
+            stored.pop("saved_at", None)
+            if stored == fp_data and info_file.read_text() == info_text:
+                self._saved_fingerprints[key] = (fp_data["hash"], info_text)
+                return
+        except (json.JSONDecodeError, IOError):
+            pass
+
+        # Save fingerprint
         fp_data["saved_at"] = datetime.now().isoformat()
-        (system_dir / "fingerprint.json").write_text(json.dumps(fp_data, indent=2))
+        fp_file.write_text(json.dumps(fp_data, indent=2))
 
         # Save full system info
-        (system_dir / "system_info.json").write_text(json.dumps(system_info, indent=2))
+        info_file.write_text(info_text)
+        self._saved_fingerprints[key] = (fp_data["hash"], info_text)
 
     def save_run(
         self,
@@ -311,6 +347,8 @@ class BenchmarkStorage:
 
         run_file = res_dir / f"run_{run_num:03d}.json"
         run_file.write_text(json.dumps(run_data, indent=2))
+        self._resolutions_cache.clear()
+        self._aggregated_cache.clear()
 
         # Copy log file if provided
         if log_path and log_path.exists():
@@ -321,50 +359,84 @@ class BenchmarkStorage:
 
         return run_file
 
+    def _read_runs(self, res_dir: Path, system_id: Optional[str]) -> list[dict]:
+        """
+        Read all run files from a resolution folder.
+
+        system_id is stamped on each run; None keeps the stored value
+        (legacy folders), defaulting to "legacy".
+        """
+        runs = []
+        if res_dir.is_dir():
+            for run_file in sorted(res_dir.glob("run_*.json")):
+                run_data = json.loads(run_file.read_text())
+                if system_id is None:
+                    run_data["system_id"] = run_data.get("system_id", "legacy")
+                else:
+                    run_data["system_id"] = system_id
+                runs.append(run_data)
+        return runs
+
+    def _list_system_dirs(self, game_dir: Path) -> list[Path]:
+        """List the (non-archive) system folders of a game."""
+        return [d for d in game_dir.iterdir() if d.is_dir() and not d.name.startswith("archive")]
+
     def get_runs(self, game_id: Union[int, str], resolution: str, system_id: Optional[str] = None) -> list[dict]:
         """Get all runs for a game at a specific resolution, optionally for a specific system."""
         game_dir = self.get_game_dir(game_id)
         res_folder = RESOLUTION_MAP.get(resolution, "OTHER")
 
-        runs = []
-
         if system_id:
             # Get runs for specific system
-            res_dir = game_dir / system_id / res_folder
-            if res_dir.exists():
-                for run_file in sorted(res_dir.glob("run_*.json")):
-                    run_data = json.loads(run_file.read_text())
-                    run_data["system_id"] = system_id
-                    runs.append(run_data)
-        else:
-            # Get runs for all systems
-            for system_dir in game_dir.iterdir():
-                if system_dir.is_dir() and not system_dir.name.startswith("archive"):
-                    res_dir = system_dir / res_folder
-                    if res_dir.exists():
-                        for run_file in sorted(res_dir.glob("run_*.json")):
-                            run_data = json.loads(run_file.read_text())
-                            run_data["system_id"] = system_dir.name
-                            runs.append(run_data)
-
-            # Also check legacy structure (resolution folders directly in game dir)
-            legacy_res_dir = game_dir / res_folder
-            if legacy_res_dir.exists() and legacy_res_dir.is_dir():
-                for run_file in sorted(legacy_res_dir.glob("run_*.json")):
-                    run_data = json.loads(run_file.read_text())
-                    run_data["system_id"] = run_data.get("system_id", "legacy")
-                    runs.append(run_data)
+            return self._read_runs(game_dir / system_id / res_folder, system_id)
+
+        # Get runs for all systems
+        runs = []
+        for system_dir in self._list_system_dirs(game_dir):
+            runs.extend(self._read_runs(system_dir / res_folder, system_dir.name))
+
+        # Also check legacy structure (resolution folders directly in game dir)
+        runs.extend(self._read_runs(game_dir / res_folder, None))
 
         return runs
 
     def get_all_resolutions(self, game_id: Union[int, str], system_id: Optional[str] = None) -> dict[str, list[dict]]:
         """Get all runs for all resolutions, optionally for a specific system."""
-        result = {}
-        for resolution, folder in RESOLUTION_MAP.items():
-            runs = self.get_runs(game_id, resolution, system_id)
-            if runs:
-                result[resolution] = runs
-        return result
+        key = (game_id, system_id)
+        result = self._resolutions_cache.get(key)
+        if result is None:
+            game_dir = self.get_game_dir(game_id)
+            # List the game folder once for all resolutions
+            system_dirs = None if system_id else self._list_system_dirs(game_dir)
+            result = {}
+            for resolution, folder in RESOLUTION_MAP.items():
+                if system_dirs is None:
+                    runs = self._read_runs(game_dir / system_id / folder, system_id)
+                else:
+                    runs = []
+                    for system_dir in system_dirs:
+                        runs.extend(self._read_runs(system_dir / folder, system_dir.name))
+                    runs.extend(self._read_runs(game_dir / folder, None))
+                if runs:
+                    result[resolution] = runs
+            self._resolutions_cache[key] = result
+        return dict(result)
+
+    def load_all(self, game_id: Union[int, str]) -> tuple[dict[str, list[dict]], dict[str, dict]]:
+        """
+        Load all runs of a game and their per-resolution aggregates.
+
+        Aggregates are computed once per game until the next save_run().
+
+        Returns:
+            Tuple of (runs per resolution, aggregated metrics per resolution)
+        """
+        runs_data = self.get_all_resolutions(game_id)
+        aggregated = self._aggregated_cache.get(game_id)
+        if aggregated is None:
+            aggregated = {res: self.aggregate_runs(runs) for res, runs in runs_data.items()}
+            self._aggregated_cache[game_id] = aggregated
+        return runs_data, dict(aggregated)
 
     def get_all_systems_data(self, game_id: Union[int, str]) -> dict[str, dict]:
         """
@@ -523,14 +595,9 @@ class BenchmarkStorage:
             Display name string
         """
         game_dir = self.get_game_dir(game_id)
-        info_file = game_dir / "game_info.json"
-
-        if info_file.exists():
-            try:
-                data = json.loads(info_file.read_text())
-                return data.get("display_name", game_dir.name)
-            except (json.JSONDecodeError, KeyError):
-                pass
+        data = self._load_game_info(game_dir / "game_info.json")
+        if data is not None:
+            return data.get("display_name", game_dir.name)
 
         # Fallback: convert folder name to readable format
         folder_name = game_dir.name
@@ -538,12 +605,35 @@ class BenchmarkStorage:
             return f"Steam App {folder_name.replace('steam_', '')}"
         return folder_name.replace("_", " ")
 
-    def regenerate_overview_report(self) -> Optional[Path]:
+    def _load_game_info(self, info_file: Path) -> Optional[dict]:
+        """Parse a game_info.json file, reusing the last parse while its mtime is unchanged."""
+        try:
+            mtime_ns = info_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._game_info_cache.get(info_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            data = json.loads(info_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        self._game_info_cache[info_file] = (mtime_ns, data)
+        return data
+
+    def regenerate_overview_report(self, raise_errors: bool = False) -> Optional[Path]:
         """
         Regenerate the overview report with all games.
 
+        Args:
+            raise_errors: Re-raise report generation errors instead of returning None
+
         Returns:
-            Path to generated report, or None if failed
+            Path to generated report, or None if there was nothing to report or it failed
         """
         try:
             # Import here to avoid circular imports
@@ -566,5 +656,7 @@ class BenchmarkStorage:
             generate_overview_report(all_games_data, output_path)
             return output_path
         except Exception:
+            if raise_errors:
+                raise
             # Silently fail - report generation is not critical
             return None
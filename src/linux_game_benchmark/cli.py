@@ -10,16 +10,125 @@ Commands:
     lgb report     - Generate report from benchmark results
 """
 
+import json
+import os
 import re
+import shutil
+import time
 import typer
+from dataclasses import dataclass
+from functools import lru_cache
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from typing import Dict, Optional
+from rich.text import Text
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Optional
 from pathlib import Path
 
 from linux_game_benchmark import __version__
 
+if TYPE_CHECKING:
+    from linux_game_benchmark.benchmark.storage import BenchmarkStorage
+
+
+# Display color for stutter/consistency ratings
+_RATING_COLOR = MappingProxyType({
+    "excellent": "green",
+    "good": "green",
+    "moderate": "yellow",
+    "poor": "red",
+})
+
+# Resolution prompt choices and --resolution aliases
+_RESOLUTION_MAP = MappingProxyType({
+    "1": "1280x720",
+    "2": "1920x1080",
+    "3": "2560x1440",
+    "4": "3440x1440",
+    "5": "3840x2160",
+})
+_RESOLUTION_NAMES = MappingProxyType({
+    "hd": "1280x720",
+    "fhd": "1920x1080",
+    "wqhd": "2560x1440",
+    "uwqhd": "3440x1440",
+    "uhd": "3840x2160",
+})
+_RESOLUTION_LABELS = MappingProxyType({
+    "1": "HD    (1280×720)",
+    "2": "FHD   (1920×1080)",
+    "3": "WQHD  (2560×1440)",
+    "4": "UWQHD (3440×1440)",
+    "5": "UHD   (3840×2160)",
+})
+
+# Prompt menus, parsed from markup once at import and keyed by the
+# highlighted default choice ("" renders the resolution menu without a highlight)
+_RES_MENU = MappingProxyType({
+    default: Text.from_markup("\n".join(
+        ["\n[bold]Which resolution was used?[/bold]"]
+        + [
+            f"  [bold green][{key}] {label}[/bold green]" if key == default
+            else f"  [{key}] {label}"
+            for key, label in _RESOLUTION_LABELS.items()
+        ]
+    ))
+    for default in ("", *_RESOLUTION_LABELS)
+})
+_CONTINUE_MENU = MappingProxyType({
+    "c": Text.from_markup("\n[bold][[green]C[/green]]ontinue / [E]nd[/bold]"),
+    "e": Text.from_markup("\n[bold][C]ontinue / [[green]E[/green]]nd[/bold]"),
+})
+_UPLOAD_MENU = MappingProxyType({
+    "y": Text.from_markup("\n[bold]Upload to community database? [[green]Y[/green]/n][/bold]"),
+    "n": Text.from_markup("\n[bold]Upload to community database? [Y/[green]n[/green]][/bold]"),
+})
+
+# Static text blocks of the benchmark session, printed with one call each
+_SESSION_BANNER = Text.from_markup(
+    "\n[bold cyan]╔══════════════════════════════════════════╗[/bold cyan]\n"
+    "[bold cyan]║           BENCHMARK SESSION              ║[/bold cyan]\n"
+    "[bold cyan]╚══════════════════════════════════════════╝[/bold cyan]\n"
+)
+_SESSION_CONTROLS = Text.from_markup(
+    "[bold yellow]Controls:[/bold yellow]\n"
+    "  [bold red]Shift+F2[/bold red] → START recording\n"
+    "  [bold red]Shift+F2[/bold red] → STOP recording\n"
+)
+_LAUNCH_HINTS = Text.from_markup(
+    "[green]Game launch initiated![/green]\n"
+    "\n[bold yellow]Once the game is running, press [bold red]Shift+F2[/bold red] to start recording[/bold yellow]\n"
+    "[dim]Red dot in overlay = recording. Press Shift+F2 again to stop.[/dim]\n"
+    "[dim]Press [bold cyan]Shift+F3[/bold cyan] to toggle HUD visibility.[/dim]\n"
+)
+_LOGIN_TIP = Text.from_markup(
+    "[dim]Tip: Login for extra features (track your benchmarks, better compare, edit settings)[/dim]\n"
+    "[dim]Register: https://linuxgamebench.com/register.html[/dim]"
+)
+
+
+@dataclass(slots=True)
+class _Recording:
+    """A recording processed during a benchmark session."""
+    log_path: Path
+    resolution: str
+    metrics: dict
+    frametimes: list[float]
+    comment: str = ""
+
+
+# Patterns used by the hardware name normalizers below
+_RYZEN_RE = re.compile(r'Ryzen\s*(\d)\s*(\d{4}X3D|\d{4}X|\d{4})', re.I)
+_INTEL_CORE_RE = re.compile(r'(i[3579]-\d{4,5}\w*)', re.I)
+_INTEL_ULTRA_RE = re.compile(r'Ultra\s*(\d)\s*(\d{3}\w*)', re.I)
+_KERNEL_RE = re.compile(r'^(\d+\.\d+\.\d+(?:-\d+)?)')
+_OS_SUFFIX_RE = re.compile(r'\s*\([^)]+\)\s*$')
+_RESOLUTION_ALIASES = MappingProxyType({
+    "HD": "1280x720", "FHD": "1920x1080",
+    "WQHD": "2560x1440", "UWQHD": "3440x1440", "UHD": "3840x2160"
+})
+
 
 # Helper functions for normalizing hardware names before upload
 def _short_gpu(name: str) -> str:
@@ -313,15 +422,15 @@ def _short_cpu(name: str) -> str:
     if not name:
         return "Unknown"
     # AMD Ryzen: "AMD Ryzen 7 9800X3D 8-Core Processor" → "Ryzen 7 9800X3D"
-    m = re.search(r'Ryzen\s*(\d)\s*(\d{4}X3D|\d{4}X|\d{4})', name, re.I)
+    m = _RYZEN_RE.search(name)
     if m:
         return f"Ryzen {m.group(1)} {m.group(2)}"
     # Intel Core: "Intel Core i7-13700K" → "i7-13700K"
-    m = re.search(r'(i[3579]-\d{4,5}\w*)', name, re.I)
+    m = _INTEL_CORE_RE.search(name)
     if m:
         return m.group(1)
     # Intel Core Ultra: "Intel Core Ultra 7 155H" → "Ultra 7 155H"
-    m = re.search(r'Ultra\s*(\d)\s*(\d{3}\w*)', name, re.I)
+    m = _INTEL_ULTRA_RE.search(name)
     if m:
         return f"Ultra {m.group(1)} {m.group(2)}"
     # Fallback: truncate to 30 chars
@@ -335,7 +444,7 @@ def _short_kernel(kernel: str) -> str:
     # "6.18.3-2-MANJARO" → "6.18.3-2"
     # "6.18.2-cachyos" → "6.18.2"
     # "6.8.0-51-generic" → "6.8.0-51"
-    match = re.match(r'^(\d+\.\d+\.\d+(?:-\d+)?)', kernel)
+    match = _KERNEL_RE.match(kernel)
     if match:
         return match.group(1)
     return kernel
@@ -347,18 +456,14 @@ def _short_os(os_name: str) -> str:
         return "Unknown"
     # "CachyOS Linux (KDE Plasma)" → "CachyOS Linux"
     # "Fedora Linux 40 (Workstation Edition)" → "Fedora Linux 40"
-    return re.sub(r'\s*\([^)]+\)\s*$', '', os_name).strip()
+    return _OS_SUFFIX_RE.sub('', os_name).strip()
 
 
 def _normalize_resolution(res: str) -> str:
     """Normalize resolution to pixel format."""
     if not res:
         return "1920x1080"
-    mapping = {
-        "HD": "1280x720", "FHD": "1920x1080",
-        "WQHD": "2560x1440", "UWQHD": "3440x1440", "UHD": "3840x2160"
-    }
-    return mapping.get(res.upper(), res)
+    return _RESOLUTION_ALIASES.get(res.upper(), res)
 
 
 def _select_gpu_for_benchmark(system_info: dict, console: "Console", log_gpu: str = None) -> dict:
@@ -498,6 +603,25 @@ app = typer.Typer(
 )
 console = Console()
 
+# Detected once: batch runs (e.g. stdin redirected from /dev/null) take
+# prompt defaults instead of blocking on input.
+_INTERACTIVE = sys.stdin is not None and sys.stdin.isatty()
+
+
+def _confirm(message: str, default: bool = True) -> bool:
+    """typer.confirm(), or the default when not running interactively."""
+    if not _INTERACTIVE:
+        return default
+    return typer.confirm(message, default=default)
+
+
+def _prompt(message: str, default: str = "") -> str:
+    """typer.prompt(), or the default when not running interactively."""
+    if not _INTERACTIVE:
+        return default
+    return typer.prompt(message, default=default)
+
+
 # Show game settings panel after --help
 def _show_help_panel_on_exit():
     """Show game settings panel if --help was used."""
@@ -1045,6 +1169,16 @@ def scan(
         "-s",
         help="Path to Steam installation (auto-detected if not specified)",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore the cached scan and re-read all game manifests",
+    ),
+    catalog: bool = typer.Option(
+        False,
+        "--catalog",
+        help="Also download Steam's app list for offline game name search",
+    ),
 ) -> None:
     """
     Scan Steam library for installed games.
@@ -1057,7 +1191,7 @@ def scan(
 
     try:
         scanner = SteamLibraryScanner(steam_path)
-        games = scanner.scan()
+        games = scanner.scan(refresh=refresh)
 
         console.print(f"\n[green]Found {len(games)} installed games.[/green]")
 
@@ -1066,11 +1200,23 @@ def scan(
         if builtin:
             console.print(f"[cyan]{len(builtin)} games have builtin benchmarks.[/cyan]")
 
+        if catalog:
+            from linux_game_benchmark.steam import app_catalog
+
+            if app_catalog.refresh_catalog():
+                console.print("[green]Steam app catalog updated.[/green]")
+            else:
+                console.print("[yellow]Could not download the Steam app catalog.[/yellow]")
+
     except Exception as e:
         console.print(f"[red]Error scanning Steam library: {e}[/red]")
         raise typer.Exit(1)
 
 
+# Game type label indexed by requires_proton
+_GAME_TYPES = ("Native", "Proton")
+
+
 @app.command()
 def list_games(
     proton_only: bool = typer.Option(
@@ -1102,11 +1248,12 @@ def list_games(
         console.print("Run 'lgb scan' first to scan your Steam library.")
         raise typer.Exit(1)
 
-    # Apply filters
-    if proton_only:
-        games = [g for g in games if g.get("requires_proton")]
-    if native_only:
-        games = [g for g in games if not g.get("requires_proton")]
+    # Apply filters and sort in a single pass
+    def keep(game: dict) -> bool:
+        requires_proton = bool(game.get("requires_proton"))
+        return (not proton_only or requires_proton) and (not native_only or not requires_proton)
+
+    games = sorted((g for g in games if keep(g)), key=lambda g: g.get("name") or "")
 
     if not games:
         console.print("[yellow]No games found matching the criteria.[/yellow]")
@@ -1118,46 +1265,62 @@ def list_games(
     table.add_column("Name", style="white")
     table.add_column("Type", style="green")
 
-    for game in sorted(games, key=lambda x: x.get("name", "")):
-        game_type = "Proton" if game.get("requires_proton") else "Native"
+    for game in games:
         table.add_row(
             str(game.get("app_id", "?")),
             game.get("name", "Unknown"),
-            game_type,
+            _GAME_TYPES[bool(game.get("requires_proton"))],
         )
 
     console.print(table)
     console.print(f"\nTotal: {len(games)} games")
 
 
+def _which(tool: str) -> Optional[str]:
+    """shutil.which() memoized per process and PATH value."""
+    return _which_cached(tool, os.environ.get("PATH"))
+
+
+@lru_cache(maxsize=None)
+def _which_cached(tool: str, path: Optional[str]) -> Optional[str]:
+    """Look up a tool on the given PATH (None = default search path)."""
+    return shutil.which(tool, path=path)
+
+
+def _mangohud_env_conf() -> Path:
+    """Path of the environment.d file that enables MangoHud globally."""
+    return Path.home() / ".config" / "environment.d" / "mangohud.conf"
+
+
+@lru_cache(maxsize=1)
+def _read_mangohud_conf() -> Optional[bytes]:
+    """Read the environment.d MangoHud config once (None if missing)."""
+    try:
+        return _mangohud_env_conf().read_bytes()
+    except OSError:
+        return None
+
+
 def _check_mangohud_global_config() -> bool:
     """Check if MangoHud is globally enabled."""
-    env_dir = Path.home() / ".config" / "environment.d"
-    mangohud_conf = env_dir / "mangohud.conf"
-
-    if mangohud_conf.exists():
-        content = mangohud_conf.read_text()
-        if "MANGOHUD=1" in content:
-            return True
-    return False
+    data = _read_mangohud_conf()
+    return data is not None and b"MANGOHUD=1" in data
 
 
 def _enable_mangohud_globally() -> bool:
     """Enable MangoHud globally via environment.d."""
-    env_dir = Path.home() / ".config" / "environment.d"
-    mangohud_conf = env_dir / "mangohud.conf"
+    mangohud_conf = _mangohud_env_conf()
 
     try:
-        env_dir.mkdir(parents=True, exist_ok=True)
-
-        # Append or create
-        if mangohud_conf.exists():
-            content = mangohud_conf.read_text()
-            if "MANGOHUD=1" not in content:
-                with open(mangohud_conf, "a") as f:
-                    f.write("\nMANGOHUD=1\n")
-        else:
-            mangohud_conf.write_text("MANGOHUD=1\n")
+        mangohud_conf.parent.mkdir(parents=True, exist_ok=True)
+
+        # Append to the existing content (already read) or create
+        data = _read_mangohud_conf()
+        if data is None:
+            mangohud_conf.write_bytes(b"MANGOHUD=1\n")
+        elif b"MANGOHUD=1" not in data:
+            mangohud_conf.write_bytes(data + b"\nMANGOHUD=1\n")
+        _read_mangohud_conf.cache_clear()
 
         return True
     except Exception as e:
@@ -1174,7 +1337,6 @@ def check() -> None:
     Automatically enables MangoHud globally if not configured.
     """
     from linux_game_benchmark.mangohud.manager import check_mangohud_installation
-    import shutil
 
     console.print("[bold]Checking system requirements...[/bold]\n")
 
@@ -1192,7 +1354,7 @@ def check() -> None:
             console.print("[yellow]MangoHud Global:[/yellow] Not enabled")
             console.print("  MangoHud needs to be enabled globally for benchmarks to work.")
 
-            if typer.confirm("  Enable MangoHud globally now?", default=True):
+            if _confirm("  Enable MangoHud globally now?", default=True):
                 if _enable_mangohud_globally():
                     console.print("[green]  ✓ MangoHud enabled globally![/green]")
                     console.print("[yellow]  → Log out and back in (or reboot) for changes to take effect.[/yellow]")
@@ -1204,7 +1366,7 @@ def check() -> None:
         all_good = False
 
     # Steam
-    steam_path = shutil.which("steam")
+    steam_path = _which("steam")
     if steam_path:
         console.print(f"[green]Steam:[/green] {steam_path}")
     else:
@@ -1216,7 +1378,7 @@ def check() -> None:
     optional_tools = ["glxinfo"]  # Nice to have
 
     for tool in required_tools:
-        if shutil.which(tool):
+        if _which(tool):
             console.print(f"[green]{tool}:[/green] Available")
         else:
             console.print(f"[red]{tool}:[/red] Not installed (required for GPU detection)")
@@ -1225,7 +1387,7 @@ def check() -> None:
             all_good = False
 
     for tool in optional_tools:
-        if shutil.which(tool):
+        if _which(tool):
             console.print(f"[green]{tool}:[/green] Available")
         else:
             console.print(f"[yellow]{tool}:[/yellow] Not found (optional)")
@@ -1238,6 +1400,22 @@ def check() -> None:
         raise typer.Exit(1)
 
 
+def _info_panel(rows: list[tuple[str, object]], title: str, border_style: str) -> Panel:
+    """
+    Build a "Label: value" panel from plain values.
+
+    Uses Text.assemble instead of markup so hardware strings are shown
+    verbatim and never parsed as Rich markup.
+    """
+    parts = []
+    for label, value in rows:
+        if parts:
+            parts.append("\n")
+        parts.append((f"{label}:", "bold"))
+        parts.append(f" {value}")
+    return Panel(Text.assemble(*parts), title=title, border_style=border_style)
+
+
 @app.command()
 def info() -> None:
     """
@@ -1256,38 +1434,30 @@ def info() -> None:
         raise typer.Exit(1)
 
     # OS Info
-    os_panel = Panel(
-        f"""[bold]OS:[/bold] {info.get('os', {}).get('name', 'Unknown')}
-[bold]Kernel:[/bold] {info.get('os', {}).get('kernel', 'Unknown')}
-[bold]Desktop:[/bold] {info.get('os', {}).get('desktop', 'Unknown')}
-[bold]Display Server:[/bold] {info.get('os', {}).get('display_server', 'Unknown')}""",
-        title="System",
-        border_style="blue",
-    )
-    console.print(os_panel)
+    os_info = info.get("os", {})
+    console.print(_info_panel([
+        ("OS", os_info.get("name", "Unknown")),
+        ("Kernel", os_info.get("kernel", "Unknown")),
+        ("Desktop", os_info.get("desktop", "Unknown")),
+        ("Display Server", os_info.get("display_server", "Unknown")),
+    ], title="System", border_style="blue"))
 
     # GPU Info
     gpu = info.get("gpu", {})
-    gpu_panel = Panel(
-        f"""[bold]Model:[/bold] {gpu.get('model', 'Unknown')}
-[bold]VRAM:[/bold] {gpu.get('vram_mb', 0)} MB
-[bold]Driver:[/bold] {gpu.get('driver', 'Unknown')} {gpu.get('driver_version', '')}
-[bold]Vulkan:[/bold] {gpu.get('vulkan_version', 'Unknown')}""",
-        title="GPU",
-        border_style="green",
-    )
-    console.print(gpu_panel)
+    console.print(_info_panel([
+        ("Model", gpu.get("model", "Unknown")),
+        ("VRAM", f"{gpu.get('vram_mb', 0)} MB"),
+        ("Driver", f"{gpu.get('driver', 'Unknown')} {gpu.get('driver_version', '')}"),
+        ("Vulkan", gpu.get("vulkan_version", "Unknown")),
+    ], title="GPU", border_style="green"))
 
     # CPU Info
     cpu = info.get("cpu", {})
-    cpu_panel = Panel(
-        f"""[bold]Model:[/bold] {cpu.get('model', 'Unknown')}
-[bold]Cores:[/bold] {cpu.get('cores', 0)} ({cpu.get('threads', 0)} threads)
-[bold]Frequency:[/bold] {cpu.get('base_clock_mhz', 0)} MHz (base)""",
-        title="CPU",
-        border_style="yellow",
-    )
-    console.print(cpu_panel)
+    console.print(_info_panel([
+        ("Model", cpu.get("model", "Unknown")),
+        ("Cores", f"{cpu.get('cores', 0)} ({cpu.get('threads', 0)} threads)"),
+        ("Frequency", f"{cpu.get('base_clock_mhz', 0)} MHz (base)"),
+    ], title="CPU", border_style="yellow"))
 
     # RAM Info
     ram = info.get("ram", {})
@@ -1385,6 +1555,32 @@ def gpu(
         console.print(f"\n[green]✓ Set {selected['display_name']} as default GPU[/green]")
 
 
+def _generate_session_report(storage: "BenchmarkStorage", target_game: dict, system_info: dict) -> None:
+    """
+    Generate the multi-resolution HTML report after a benchmark session.
+
+    The report generator is only imported here, so sessions that end without
+    recordings never load it.
+    """
+    from linux_game_benchmark.analysis.report_generator import generate_multi_resolution_report
+
+    steam_app_id = target_game["app_id"]
+    all_resolutions, resolution_data = storage.load_all(steam_app_id)
+    if not all_resolutions:
+        return
+
+    report_path = storage.get_report_path(steam_app_id)
+    generate_multi_resolution_report(
+        game_name=target_game["name"],
+        app_id=steam_app_id,
+        system_info=system_info,
+        resolution_data=resolution_data,
+        output_path=report_path,
+        runs_data=all_resolutions,
+    )
+    console.print(f"[bold]Report:[/bold] {report_path}")
+
+
 @app.command()
 def benchmark(
     game: str = typer.Argument(
@@ -1564,17 +1760,23 @@ def benchmark(
     # Require latest version for upload functionality
     require_latest_version()
 
-    import time
+    from rich.live import Live
     from linux_game_benchmark.steam.library_scanner import SteamLibraryScanner
     from linux_game_benchmark.benchmark.game_launcher import GameLauncher
+    from linux_game_benchmark.benchmark.validation import BenchmarkValidator
     from linux_game_benchmark.mangohud.config_manager import MangoHudConfigManager
+    from linux_game_benchmark.mangohud.log_watcher import LogWatcher
     from linux_game_benchmark.mangohud.manager import check_mangohud_installation
     from linux_game_benchmark.analysis.metrics import FrametimeAnalyzer
     from linux_game_benchmark.benchmark.storage import BenchmarkStorage, SystemFingerprint
-    from linux_game_benchmark.analysis.report_generator import generate_multi_resolution_report
-    from linux_game_benchmark.system.hardware_info import get_system_info, detect_discrete_gpu_pci
+    from linux_game_benchmark.config.preferences import preferences
+    from linux_game_benchmark.games.registry import GameRegistry
+    from linux_game_benchmark.system.hardware_info import (
+        get_system_info,
+        detect_discrete_gpu_pci,
+        detect_sched_ext,
+    )
     from linux_game_benchmark.steam.launch_options import set_launch_options, restore_launch_options
-    from linux_game_benchmark.api import upload_benchmark, check_api_status
 
     # Check MangoHud
     mangohud_info = check_mangohud_installation()
@@ -1604,15 +1806,11 @@ def benchmark(
         raise typer.Exit(1)
 
     # Header
-    console.print(f"\n[bold cyan]╔══════════════════════════════════════════╗[/bold cyan]")
-    console.print(f"[bold cyan]║           BENCHMARK SESSION              ║[/bold cyan]")
-    console.print(f"[bold cyan]╚══════════════════════════════════════════╝[/bold cyan]\n")
+    console.print(_SESSION_BANNER)
     console.print(f"[bold]Game:[/bold] {target_game['name']}")
     console.print(f"[bold]App ID:[/bold] {target_game['app_id']}\n")
 
-    console.print("[bold yellow]Controls:[/bold yellow]")
-    console.print("  [bold red]Shift+F2[/bold red] → START recording")
-    console.print("  [bold red]Shift+F2[/bold red] → STOP recording\n")
+    console.print(_SESSION_CONTROLS)
 
     # Setup
     system_info = get_system_info()
@@ -1671,50 +1869,26 @@ def benchmark(
     storage.save_fingerprint(steam_app_id, fp, system_info)
 
     # Register game
-    from linux_game_benchmark.games.registry import GameRegistry
     registry = GameRegistry(base_dir=storage.base_dir)
     registry.get_or_create(steam_app_id=steam_app_id, display_name=target_game["name"])
 
     # Track processed logs and recordings
-    processed_logs = set()
-    for existing in output_dir.glob("*.csv"):
-        if "_summary" not in existing.name:
-            processed_logs.add(existing.name)
-
-    recordings = []  # Store all recording data for final upload
-    active_recording = None  # Track currently recording file
-
-    def get_new_logs():
-        """Find new completed log files."""
-        new_logs = []
-        for log_file in output_dir.glob("*.csv"):
-            if "_summary" not in log_file.name and log_file.name not in processed_logs:
-                size1 = log_file.stat().st_size
-                time.sleep(0.5)
-                size2 = log_file.stat().st_size
-                if size1 == size2 and size1 > 1000:
-                    new_logs.append(log_file)
-        return new_logs
-
-    def get_active_recording():
-        """Find actively growing log file (recording in progress)."""
-        for log_file in output_dir.glob("*.csv"):
-            if "_summary" not in log_file.name and log_file.name not in processed_logs:
-                size1 = log_file.stat().st_size
-                if size1 > 0:
-                    time.sleep(0.3)
-                    size2 = log_file.stat().st_size
-                    if size2 > size1:  # File is growing = active recording
-                        return log_file
-        return None
+    log_watcher = LogWatcher(output_dir, skip_existing=True)
+
+    recordings: list[_Recording] = []  # Store all recording data for final upload
+    # Logs parsed while MangoHud writes them, so only the tail is left at the end
+    streaming_analyzers: dict[Path, FrametimeAnalyzer] = {}
 
     def monitor_recording(log_path: Path) -> None:
         """Monitor active recording with live timer until complete."""
-        from rich.live import Live
-        from rich.text import Text
-        from linux_game_benchmark.benchmark.validation import BenchmarkValidator
-
         console.print(f"\n[bold red]● Recording started![/bold red]")
+        analyzer = streaming_analyzers.get(log_path)
+        if analyzer is None:
+            try:
+                analyzer = FrametimeAnalyzer(log_path, streaming=True)
+                streaming_analyzers[log_path] = analyzer
+            except (OSError, ValueError):
+                pass  # Parsed in one go once the recording is complete
         start_time = time.time()
         last_size = 0
         stable_count = 0
@@ -1762,9 +1936,15 @@ def benchmark(
                         stable_count += 1
                     else:
                         stable_count = 0
+                        if analyzer is not None:
+                            analyzer.update()
                     last_size = size
                 except FileNotFoundError:
                     break
+                except ValueError:
+                    # Undecodable data - drop the partial parse
+                    streaming_analyzers.pop(log_path, None)
+                    analyzer = None
                 time.sleep(0.25)  # Fast polling - MangoHud writes every frame
 
         # Immediate feedback
@@ -1785,23 +1965,33 @@ def benchmark(
         """Process a recording. Returns False if user wants to end session."""
         # Capture sched-ext scheduler NOW while game is still running
         # (scheduler might only be active during gaming)
-        from linux_game_benchmark.system.hardware_info import detect_sched_ext
         scheduler = detect_sched_ext()
 
         console.print(f"\n[bold green]═══ Recording complete! ═══[/bold green]")
 
         try:
-            analyzer = FrametimeAnalyzer(log_path)
+            analyzer = streaming_analyzers.pop(log_path, None)
+            if analyzer is not None:
+                analyzer.update(final=True)
+            else:
+                analyzer = FrametimeAnalyzer(log_path)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Could not read recording: {e}[/red]")
+            return True  # Continue session
+        if not analyzer.frametimes:
+            console.print("[yellow]Recording contains no frame data - skipped.[/yellow]")
+            return True  # Continue session
+
+        try:
             metrics = analyzer.analyze()
             fps = metrics.get("fps", {})
             frame_pacing = metrics.get("frame_pacing", {})
             stutter = metrics.get("stutter", {})
 
             # Get frametimes for validation and upload
-            frametimes = analyzer.frametimes if hasattr(analyzer, 'frametimes') else []
+            frametimes = analyzer.frametimes
 
             # === VALIDATION: Check if benchmark data is valid ===
-            from linux_game_benchmark.benchmark.validation import BenchmarkValidator
             validator = BenchmarkValidator()
             validation = validator.validate(
                 frametimes=frametimes,
@@ -1816,10 +2006,12 @@ def benchmark(
             seconds = int(duration_sec % 60)
             frames = fps.get('frame_count', 0)
 
-            console.print(f"\n  [bold]Recorded:[/bold] {minutes}m {seconds}s, {frames} frames")
-            console.print(f"  [bold]AVG FPS:[/bold] {fps.get('average', 0):.1f}")
-            console.print(f"  [bold]1% Low:[/bold] {fps.get('1_percent_low', 0):.1f}")
-            console.print(f"  [bold]0.1% Low:[/bold] {fps.get('0.1_percent_low', 0):.1f}")
+            console.print(
+                f"\n  [bold]Recorded:[/bold] {minutes}m {seconds}s, {frames} frames\n"
+                f"  [bold]AVG FPS:[/bold] {fps.get('average', 0):.1f}\n"
+                f"  [bold]1% Low:[/bold] {fps.get('1_percent_low', 0):.1f}\n"
+                f"  [bold]0.1% Low:[/bold] {fps.get('0.1_percent_low', 0):.1f}"
+            )
 
             # Show validation status
             can_upload = validation.valid
@@ -1832,19 +2024,15 @@ def benchmark(
                     console.print(f"  [yellow]⚠ {issue.message}[/yellow]")
 
             # 1. Resolution (CLI param or interactive prompt)
-            from linux_game_benchmark.config.preferences import preferences
             default_res = preferences.resolution
 
-            resolution_map = {"1": "1280x720", "2": "1920x1080", "3": "2560x1440", "4": "3440x1440", "5": "3840x2160"}
-            resolution_names = {"hd": "1280x720", "fhd": "1920x1080", "wqhd": "2560x1440", "uwqhd": "3440x1440", "uhd": "3840x2160"}
-
             if resolution:
                 # CLI --resolution provided, skip interactive prompt
                 res_lower = resolution.lower().strip()
-                if res_lower in resolution_names:
-                    selected_resolution = resolution_names[res_lower]
-                elif res_lower in resolution_map:
-                    selected_resolution = resolution_map[res_lower]
+                if res_lower in _RESOLUTION_NAMES:
+                    selected_resolution = _RESOLUTION_NAMES[res_lower]
+                elif res_lower in _RESOLUTION_MAP:
+                    selected_resolution = _RESOLUTION_MAP[res_lower]
                 elif "x" in res_lower:
                     # Direct pixel format like 1920x1080
                     selected_resolution = resolution
@@ -1854,24 +2042,17 @@ def benchmark(
                 console.print(f"\n[dim]Resolution: {selected_resolution}[/dim]")
             else:
                 # Interactive prompt
-                console.print(f"\n[bold]Which resolution was used?[/bold]")
-                for key, label in [("1", "HD    (1280×720)"), ("2", "FHD   (1920×1080)"),
-                                   ("3", "WQHD  (2560×1440)"), ("4", "UWQHD (3440×1440)"),
-                                   ("5", "UHD   (3840×2160)")]:
-                    if key == default_res:
-                        console.print(f"  [bold green][{key}] {label}[/bold green]")
-                    else:
-                        console.print(f"  [{key}] {label}")
+                console.print(_RES_MENU.get(default_res, _RES_MENU[""]))
                 try:
-                    res_choice = typer.prompt(f"Resolution [1-5]", default=default_res).strip()
-                except:
+                    res_choice = _prompt("Resolution [1-5]", default=default_res).strip()
+                except (typer.Abort, EOFError):
                     res_choice = default_res
-                selected_resolution = resolution_map.get(res_choice, resolution_map.get(default_res, "1920x1080"))
+                selected_resolution = _RESOLUTION_MAP.get(res_choice, _RESOLUTION_MAP.get(default_res, "1920x1080"))
 
             # 2. Ask for comment
             try:
-                comment = typer.prompt("Comment (optional, Enter to skip)", default="").strip()
-            except:
+                comment = _prompt("Comment (optional, Enter to skip)", default="").strip()
+            except (typer.Abort, EOFError):
                 comment = ""
 
             # 2b. GPU selection for multi-GPU systems (use log GPU as intelligent default)
@@ -1897,38 +2078,44 @@ def benchmark(
             console.print(f"[dim]Saved locally[/dim]")
 
             # Store for reference
-            recordings.append({
-                "metrics": metrics,
-                "log_path": log_path,
-                "frametimes": frametimes,
-                "resolution": selected_resolution,
-                "comment": comment,
-            })
+            recordings.append(_Recording(
+                log_path=log_path,
+                resolution=selected_resolution,
+                metrics=metrics,
+                frametimes=frametimes,
+                comment=comment,
+            ))
 
             # 4. Ask if user wants to upload (only if validation passed)
             if not can_upload:
                 console.print(f"\n[dim]Upload skipped due to validation errors.[/dim]")
                 upload_choice = "n"
+            elif not _INTERACTIVE:
+                # Batch run: skip the upload (and its API round-trips) entirely
+                console.print(f"\n[dim]Upload skipped (non-interactive session).[/dim]")
+                upload_choice = "n"
             else:
                 default_upload = preferences.upload
-                if default_upload == "y":
-                    console.print(f"\n[bold]Upload to community database? [[green]Y[/green]/n][/bold]")
-                else:
-                    console.print(f"\n[bold]Upload to community database? [Y/[green]n[/green]][/bold]")
+                console.print(_UPLOAD_MENU["y" if default_upload == "y" else "n"])
                 try:
                     upload_choice = typer.prompt(f"Upload?", default=default_upload).strip().lower()
-                except:
+                except (typer.Abort, EOFError):
                     upload_choice = default_upload
 
             if upload_choice in ["y", "yes", "j", "ja", ""] and can_upload:
-                # Show login hint if not logged in (upload works without login)
-                from linux_game_benchmark.api.auth import get_auth_header
-                if not get_auth_header():
-                    console.print("[dim]Tip: Login for extra features (track your benchmarks, better compare, edit settings)[/dim]")
-                    console.print("[dim]Register: https://linuxgamebench.com/register.html[/dim]")
+                # Show login hint if not logged in (upload works without login).
+                # Without an auth file there is no session to load or refresh.
+                from linux_game_benchmark.config.settings import settings
+                has_session = False
+                if settings.get_auth_file().exists():
+                    from linux_game_benchmark.api.auth import get_auth_header
+                    has_session = bool(get_auth_header())
+                if not has_session:
+                    console.print(_LOGIN_TIP)
 
                 # Upload (works with or without login)
-                if check_api_status():
+                from linux_game_benchmark.api import upload_benchmark, cached_api_status
+                if cached_api_status():
                     # Compress MangoHud log for storage
                     import gzip
                     import base64
@@ -1944,38 +2131,41 @@ def benchmark(
                     # game_settings already built at function start from CLI parameters
 
                     # Calculate payload size for user feedback
-                    import json as json_module
                     payload_data = {
                         "steam_app_id": steam_app_id,
                         "game_name": target_game["name"],
                         "resolution": _normalize_resolution(selected_resolution),
                         "frametimes": frametimes,
                     }
-                    payload_size = len(json_module.dumps(payload_data))
+                    payload_size = len(json.dumps(payload_data))
                     if mangohud_log_compressed:
                         payload_size += len(mangohud_log_compressed)
                     size_kb = payload_size / 1024
                     size_str = f"{size_kb:.0f} KB" if size_kb < 1024 else f"{size_kb/1024:.1f} MB"
 
-                    # Upload with spinner
-                    from rich.status import Status
-                    with Status(f"[bold green]Uploading {size_str}...[/bold green]", console=console) as status:
-                        result = upload_benchmark(
+                    # Normalized hardware info for the upload
+                    sys_gpu = selected_system_info.get("gpu", {})
+                    sys_os = selected_system_info.get("os", {})
+                    upload_system_info = {
+                        "gpu": _short_gpu(sys_gpu.get("model")),
+                        "cpu": _short_cpu(selected_system_info.get("cpu", {}).get("model")),
+                        "os": _short_os(sys_os.get("name", "Linux")),
+                        "kernel": _short_kernel(sys_os.get("kernel")),
+                        "gpu_driver": sys_gpu.get("driver_version"),
+                        "vulkan": sys_gpu.get("vulkan_version"),
+                        "ram_gb": int(selected_system_info.get("ram", {}).get("total_gb", 0)),
+                        "scheduler": scheduler,
+                        "gpu_device_id": sys_gpu.get("device_id"),
+                        "gpu_lspci_raw": sys_gpu.get("lspci_raw"),
+                    }
+
+                    def upload():
+                        """Upload this recording (first attempt and login retry)."""
+                        return upload_benchmark(
                             steam_app_id=steam_app_id,
                             game_name=target_game["name"],
                             resolution=_normalize_resolution(selected_resolution),
-                            system_info={
-                                "gpu": _short_gpu(selected_system_info.get("gpu", {}).get("model")),
-                                "cpu": _short_cpu(selected_system_info.get("cpu", {}).get("model")),
-                                "os": _short_os(selected_system_info.get("os", {}).get("name", "Linux")),
-                                "kernel": _short_kernel(selected_system_info.get("os", {}).get("kernel")),
-                                "gpu_driver": selected_system_info.get("gpu", {}).get("driver_version"),
-                                "vulkan": selected_system_info.get("gpu", {}).get("vulkan_version"),
-                                "ram_gb": int(selected_system_info.get("ram", {}).get("total_gb", 0)),
-                                "scheduler": scheduler,
-                                "gpu_device_id": selected_system_info.get("gpu", {}).get("device_id"),
-                                "gpu_lspci_raw": selected_system_info.get("gpu", {}).get("lspci_raw"),
-                            },
+                            system_info=upload_system_info,
                             metrics={
                                 "fps_avg": fps.get('average', 0),
                                 "fps_min": fps.get('minimum', 0),
@@ -1991,6 +2181,11 @@ def benchmark(
                             comment=comment if comment else None,
                             game_settings=game_settings if game_settings else None,
                         )
+
+                    # Upload with spinner
+                    from rich.status import Status
+                    with Status(f"[bold green]Uploading {size_str}...[/bold green]", console=console) as status:
+                        result = upload()
                     if result.success:
                         console.print(f"[bold green]✓ Uploaded![/bold green]")
                         if result.url:
@@ -2039,37 +2234,7 @@ def benchmark(
                                     console.print("[dim]Uploading anonymously...[/dim]")
                                 else:
                                     console.print("[dim]Retrying upload...[/dim]")
-                                result = upload_benchmark(
-                                    steam_app_id=steam_app_id,
-                                    game_name=target_game["name"],
-                                    resolution=_normalize_resolution(selected_resolution),
-                                    system_info={
-                                        "gpu": _short_gpu(selected_system_info.get("gpu", {}).get("model")),
-                                        "cpu": _short_cpu(selected_system_info.get("cpu", {}).get("model")),
-                                        "os": _short_os(selected_system_info.get("os", {}).get("name", "Linux")),
-                                        "kernel": _short_kernel(selected_system_info.get("os", {}).get("kernel")),
-                                        "gpu_driver": selected_system_info.get("gpu", {}).get("driver_version"),
-                                        "vulkan": selected_system_info.get("gpu", {}).get("vulkan_version"),
-                                        "ram_gb": int(selected_system_info.get("ram", {}).get("total_gb", 0)),
-                                        "scheduler": scheduler,
-                                        "gpu_device_id": selected_system_info.get("gpu", {}).get("device_id"),
-                                        "gpu_lspci_raw": selected_system_info.get("gpu", {}).get("lspci_raw"),
-                                    },
-                                    metrics={
-                                        "fps_avg": fps.get('average', 0),
-                                        "fps_min": fps.get('minimum', 0),
-                                        "fps_1low": fps.get('1_percent_low', 0),
-                                        "fps_01low": fps.get('0.1_percent_low', 0),
-                                        "stutter_rating": stutter_rating,
-                                        "consistency_rating": consistency_rating,
-                                        "duration_seconds": fps.get('duration_seconds', 0),
-                                        "frame_count": fps.get('frame_count', 0),
-                                    },
-                                    frametimes=frametimes,
-                                    mangohud_log_compressed=mangohud_log_compressed,
-                                    comment=comment if comment else None,
-                                    game_settings=game_settings if game_settings else None,
-                                )
+                                result = upload()
                                 if result.success:
                                     if upload_anonymous:
                                         console.print(f"[bold green]✓ Uploaded anonymously![/bold green]")
@@ -2092,13 +2257,10 @@ def benchmark(
 
         # 5. Ask to continue or end
         default_cont = preferences.continue_session
-        if default_cont == "c":
-            console.print(f"\n[bold][[green]C[/green]]ontinue / [E]nd[/bold]")
-        else:
-            console.print(f"\n[bold][C]ontinue / [[green]E[/green]]nd[/bold]")
+        console.print(_CONTINUE_MENU["c" if default_cont == "c" else "e"])
         try:
             continue_choice = typer.prompt(f"Choice", default=default_cont).strip().lower()
-        except:
+        except (typer.Abort, EOFError):
             return default_cont == "c"
 
         if continue_choice in ["e", "end", "q", "quit"]:
@@ -2120,36 +2282,35 @@ def benchmark(
             console.print("[red]Failed to launch game[/red]")
             raise typer.Exit(1)
 
-        console.print(f"[green]Game launch initiated![/green]")
-        console.print(f"\n[bold yellow]Once the game is running, press [bold red]Shift+F2[/bold red] to start recording[/bold yellow]")
-        console.print(f"[dim]Red dot in overlay = recording. Press Shift+F2 again to stop.[/dim]")
-        console.print(f"[dim]Press [bold cyan]Shift+F3[/bold cyan] to toggle HUD visibility.[/dim]\n")
+        console.print(_LAUNCH_HINTS)
 
         # Monitor for recordings (no PID check - user ends session manually)
         session_active = True
         while session_active:
-            # First check for active recording (file growing)
-            active = get_active_recording()
-            if active and active.name not in processed_logs:
+            # Wakes up as soon as MangoHud writes a log (or after 0.5s)
+            log_watcher.wait(timeout=0.5)
+            active, new_logs = log_watcher.poll()
+
+            # Active recording (file growing)
+            if active:
                 monitor_recording(active)  # Shows live timer until complete
+                log_watcher.refresh(active)
+                continue
 
-            # Then check for completed recordings
-            new_logs = get_new_logs()
+            # Completed recordings
             for log_path in new_logs:
-                processed_logs.add(log_path.name)
+                log_watcher.mark_processed(log_path)
                 session_active = process_recording(log_path)
                 if not session_active:
                     break
 
-            time.sleep(0.5)
-
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled[/yellow]")
     finally:
         mangohud_manager.restore_config()
         try:
             restore_launch_options(steam_app_id)
-        except:
+        except Exception:
             pass
 
     # End of session summary
@@ -2157,21 +2318,7 @@ def benchmark(
         console.print("\n[yellow]No recordings captured.[/yellow]")
     else:
         console.print(f"\n[bold cyan]═══ Session ended: {len(recordings)} recording(s) processed ═══[/bold cyan]")
-
-        # Generate report
-        all_resolutions = storage.get_all_resolutions(steam_app_id)
-        if all_resolutions:
-            resolution_data = {res: storage.aggregate_runs(runs) for res, runs in all_resolutions.items()}
-            report_path = storage.get_report_path(steam_app_id)
-            generate_multi_resolution_report(
-                game_name=target_game["name"],
-                app_id=steam_app_id,
-                system_info=system_info,
-                resolution_data=resolution_data,
-                output_path=report_path,
-                runs_data=all_resolutions,
-            )
-            console.print(f"[bold]Report:[/bold] {report_path}")
+        _generate_session_report(storage, target_game, system_info)
 
 
 @app.command()
@@ -2217,13 +2364,13 @@ def analyze(
 
         # Stutter events
         rating = stutter.get('stutter_rating', 'unknown')
-        rating_color = {'excellent': 'green', 'good': 'green', 'moderate': 'yellow', 'poor': 'red'}.get(rating, 'white')
+        rating_color = _RATING_COLOR.get(rating, 'white')
         console.print(f"  Stutter:       [{rating_color}]{rating}[/{rating_color}] ({stutter.get('gameplay_stutter_count', 0)} events)")
 
         # Frame consistency
         if frame_pacing:
             cons_rating = frame_pacing.get('consistency_rating', 'unknown')
-            cons_color = {'excellent': 'green', 'good': 'green', 'moderate': 'yellow', 'poor': 'red'}.get(cons_rating, 'white')
+            cons_color = _RATING_COLOR.get(cons_rating, 'white')
             cv = frame_pacing.get('cv_percent', 0)
             console.print(f"  Consistency:   [{cons_color}]{cons_rating}[/{cons_color}] (CV: {cv:.1f}%)")
 
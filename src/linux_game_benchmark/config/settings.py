@@ -14,6 +14,9 @@ class Settings:
     # Config directory (XDG compliant)
     CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "lgb"
 
+    # Cache directory (XDG compliant) for data that can be rebuilt at any time
+    CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "lgb"
+
     # Auth file path
     AUTH_FILE = CONFIG_DIR / "auth.json"
 
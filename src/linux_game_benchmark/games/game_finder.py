@@ -5,6 +5,7 @@ Searches for Steam games only. Non-Steam games are not supported.
 This ensures consistent game identification via Steam App ID.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable
 from rich.console import Console
 from rich.table import Table
@@ -19,6 +20,10 @@ from linux_game_benchmark.steam.app_id_finder import (
 )
 
 
+# Background library scans, shared by all finders
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lgb-library-scan")
+
+
 class NoSteamGameFoundError(Exception):
     """Raised when no Steam game could be found for the query."""
 
@@ -49,6 +54,7 @@ class GameFinder:
         console: Optional[Console] = None,
         on_status: Optional[Callable[[str], None]] = None,
         registry: Optional[GameRegistry] = None,
+        prefetch: bool = True,
     ):
         """
         Initialize the game finder.
@@ -57,21 +63,57 @@ class GameFinder:
             console: Rich console for output (optional)
             on_status: Callback for status messages (optional)
             registry: GameRegistry instance (optional, creates new if None)
+            prefetch: Scan the local library in the background right away
         """
         self.console = console or Console()
         self.on_status = on_status
         self.registry = registry
         self._steam_scanner: Optional[SteamLibraryScanner] = None
         self._local_games_cache: Optional[list[dict]] = None
+        # Lower-cased names parallel to _local_games_cache, built once
+        self._local_names_lower: Optional[list[str]] = None
+        # Start each finder with fresh scores so long sessions don't grow stale entries
+        similarity.cache_clear()
+        # Library scan running while the user is still typing a query
+        self._scan_future: Optional[Future] = (
+            _EXECUTOR.submit(self._prefetch_local) if prefetch else None
+        )
 
     def _log(self, message: str) -> None:
         """Log a status message."""
         if self.on_status:
             self.on_status(message)
 
+    @staticmethod
+    def _prefetch_local() -> tuple[Optional[SteamLibraryScanner], list[dict], list[str]]:
+        """Create the scanner and scan the library (runs in a worker thread)."""
+        try:
+            scanner = SteamLibraryScanner()
+        except FileNotFoundError:
+            return None, [], []
+        try:
+            games = scanner.scan()
+        except Exception:
+            games = []
+        return scanner, games, [game.get("name", "").lower() for game in games]
+
+    def _collect_prefetch(self) -> None:
+        """Take over the background scan's results, waiting if it is still running."""
+        future, self._scan_future = self._scan_future, None
+        if future is None:
+            return
+        scanner, games, names_lower = future.result()
+        if self._steam_scanner is None:
+            self._steam_scanner = scanner
+        if self._local_games_cache is None and scanner is not None:
+            self._local_games_cache = games
+            self._local_names_lower = names_lower
+
     @property
     def steam_scanner(self) -> Optional[SteamLibraryScanner]:
         """Lazy-load Steam scanner."""
+        if self._steam_scanner is None:
+            self._collect_prefetch()
         if self._steam_scanner is None:
             try:
                 self._steam_scanner = SteamLibraryScanner()
@@ -82,6 +124,8 @@ class GameFinder:
     @property
     def local_games(self) -> list[dict]:
         """Get cached list of locally installed games."""
+        if self._local_games_cache is None:
+            self._collect_prefetch()
         if self._local_games_cache is None:
             if self.steam_scanner:
                 try:
@@ -92,6 +136,13 @@ class GameFinder:
                 self._local_games_cache = []
         return self._local_games_cache
 
+    @property
+    def local_names_lower(self) -> list[str]:
+        """Lower-cased names of local_games, in the same order."""
+        if self._local_names_lower is None:
+            self._local_names_lower = [game.get("name", "").lower() for game in self.local_games]
+        return self._local_names_lower
+
     def find(
         self,
         query: str,
@@ -186,9 +237,16 @@ class GameFinder:
 
     def _find_by_app_id(self, app_id: int) -> Optional[GameInfo]:
         """Find game by Steam App ID."""
-        # Check local first
-        if self.steam_scanner:
-            local = self.steam_scanner.get_game_by_id(app_id)
+        # Check local first, reading just the manifest instead of waiting for a running scan
+        if self._scan_future is not None and not self._scan_future.done():
+            try:
+                scanner = SteamLibraryScanner()
+            except FileNotFoundError:
+                scanner = None
+        else:
+            scanner = self.steam_scanner
+        if scanner:
+            local = scanner.get_game_by_id_fast(app_id)
             if local:
                 return GameInfo.from_steam_local(local)
 
@@ -201,28 +259,39 @@ class GameFinder:
         )
 
     def _search_local(self, query: str) -> Optional[GameInfo]:
-        """Search local Steam library."""
+        """
+        Search local Steam library.
+
+        Only names containing the query are candidates. For those, the
+        character ratio is 2 * len(query) / (len(query) + len(name)),
+        so names too long to reach the threshold are skipped before any
+        string comparison and the score needs no matcher at all.
+        """
         query_lower = query.lower()
+        query_len = len(query_lower)
+        # score >= 0.6  <=>  len(name) <= 7/3 * len(query)
+        max_len_x3 = query_len * 7
 
-        best_match: Optional[dict] = None
+        best_index: Optional[int] = None
         best_score = 0.0
 
-        for game in self.local_games:
-            game_name = game.get("name", "").lower()
-
+        for i, game_name in enumerate(self.local_names_lower):
             # Exact match
             if query_lower == game_name:
-                return GameInfo.from_steam_local(game)
+                return GameInfo.from_steam_local(self.local_games[i])
 
             # Partial match
+            name_len = len(game_name)
+            if name_len * 3 > max_len_x3:
+                continue
             if query_lower in game_name:
-                score = similarity(query, game.get("name", ""))
+                score = 2 * query_len / (query_len + name_len)
                 if score > best_score:
                     best_score = score
-                    best_match = game
+                    best_index = i
 
-        if best_match and best_score >= 0.6:
-            result = GameInfo.from_steam_local(best_match)
+        if best_index is not None and best_score >= 0.6:
+            result = GameInfo.from_steam_local(self.local_games[best_index])
             result.similarity_score = best_score
             return result
 
@@ -4,6 +4,7 @@ Game data models for the game finder system.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -17,7 +18,17 @@ class GameSource(Enum):
     MANUAL = "manual"  # Manually entered by user
 
 
-@dataclass
+# Human-readable source names, built once instead of per get_display_source() call
+_SOURCE_NAMES = MappingProxyType({
+    GameSource.STEAM_LOCAL: "Steam (installiert)",
+    GameSource.STEAM_STORE: "Steam Store",
+    GameSource.IGDB: "IGDB",
+    GameSource.STEAMGRIDDB: "SteamGridDB",
+    GameSource.MANUAL: "Manuell",
+})
+
+
+@dataclass(slots=True)
 class GameInfo:
     """
     Unified game information from various sources.
@@ -62,14 +73,7 @@ class GameInfo:
 
     def get_display_source(self) -> str:
         """Get human-readable source name."""
-        source_names = {
-            GameSource.STEAM_LOCAL: "Steam (installiert)",
-            GameSource.STEAM_STORE: "Steam Store",
-            GameSource.IGDB: "IGDB",
-            GameSource.STEAMGRIDDB: "SteamGridDB",
-            GameSource.MANUAL: "Manuell",
-        }
-        return source_names.get(self.source, str(self.source))
+        return _SOURCE_NAMES.get(self.source, str(self.source))
 
     @classmethod
     def from_steam_local(cls, steam_game: dict) -> "GameInfo":
@@ -0,0 +1,192 @@
+"""
+MangoHud Log Watcher.
+
+Detects MangoHud CSV logs appearing in a log directory and tells apart
+recordings in progress from completed ones.
+
+Uses watchfiles (inotify) when installed, so the caller wakes up as soon
+as MangoHud writes to a log. Without it, falls back to plain polling.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+try:
+    from watchfiles import watch
+except ImportError:
+    watch = None
+
+
+class LogWatcher:
+    """Tracks MangoHud CSV logs in a directory by size, without blocking sleeps."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        ignore: Iterable[str] = (),
+        stable_seconds: float = 0.5,
+        min_size: int = 1000,
+        idle_seconds: float = 5.0,
+        skip_existing: bool = False,
+    ):
+        """
+        Initialize log watcher.
+
+        Args:
+            log_dir: Directory MangoHud writes its logs to.
+            ignore: Log file names that should never be reported.
+            stable_seconds: How long a log must stop growing to count as complete.
+            min_size: Minimum size in bytes of a completed log.
+            idle_seconds: Longest wait() without changes when watchfiles is used.
+            skip_existing: Never report logs already present in log_dir.
+        """
+        self.log_dir = log_dir
+        self.stable_seconds = stable_seconds
+        self.min_size = min_size
+        self.idle_seconds = idle_seconds
+        # Logs are keyed by inode, so new logs are a plain set difference
+        self.processed: set[int] = set()
+        # inode -> (last seen size, monotonic time the size last changed)
+        self._sizes: dict[int, tuple[int, float]] = {}
+        # Stable logs at or under min_size; still polled, but they don't keep wait() awake
+        self._small: set[int] = set()
+        self._changes = None
+        # Directory listing (inode -> name), refreshed only when the directory mtime changes
+        self._dir_mtime_ns: Optional[int] = None
+        self._logs: dict[int, str] = {}
+
+        for name in ignore:
+            try:
+                self.processed.add(os.stat(log_dir / name).st_ino)
+            except FileNotFoundError:
+                pass
+        if skip_existing:
+            self.processed.update(self._list_logs())
+
+    def _inode(self, log_path: Path) -> Optional[int]:
+        """Look up the inode of a log, also after it was deleted."""
+        try:
+            return os.stat(log_path).st_ino
+        except FileNotFoundError:
+            for inode, name in self._logs.items():
+                if name == log_path.name:
+                    return inode
+            return None
+
+    def mark_processed(self, log_path: Path) -> None:
+        """Stop reporting a log file."""
+        inode = self._inode(log_path)
+        if inode is not None:
+            self.processed.add(inode)
+            self._sizes.pop(inode, None)
+
+    def refresh(self, log_path: Path) -> None:
+        """Record a log's current size, e.g. after watching it grow elsewhere."""
+        try:
+            stat = os.stat(log_path)
+        except FileNotFoundError:
+            inode = self._inode(log_path)
+            if inode is not None:
+                self._sizes.pop(inode, None)
+            return
+        self._sizes[stat.st_ino] = (stat.st_size, time.monotonic())
+
+    def wait(self, timeout: float = 0.5) -> None:
+        """
+        Block until the caller should poll() again.
+
+        Without watchfiles this simply sleeps for timeout seconds. With
+        watchfiles it returns as soon as a log changes, after timeout
+        seconds while a log is waiting to become stable, and otherwise
+        only every idle_seconds as a safety net, so an idle session does
+        no polling at all in between. The timeout of the first call is
+        used for the lifetime of the watcher.
+        """
+        if watch is None:
+            time.sleep(timeout)
+            return
+
+        if self._changes is None:
+            self._changes = watch(
+                self.log_dir,
+                watch_filter=lambda change, path: path.endswith(".csv"),
+                debounce=100,
+                rust_timeout=int(timeout * 1000),
+                yield_on_timeout=True,
+                recursive=False,
+            )
+
+        deadline = time.monotonic() + self.idle_seconds
+        while True:
+            changes = next(self._changes)
+            if changes or self._sizes.keys() - self._small or time.monotonic() >= deadline:
+                return
+
+    def _list_logs(self) -> dict[int, str]:
+        """
+        Map inodes of candidate logs to their names, re-reading the directory only when it changed.
+
+        Growing files don't touch the directory mtime, but new logs do.
+        """
+        try:
+            mtime_ns = os.stat(self.log_dir).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        # Directory timestamps are coarse; a change within the last second
+        # could share the cached mtime, so don't trust it yet.
+        if mtime_ns != self._dir_mtime_ns or time.time_ns() - mtime_ns < 1_000_000_000:
+            with os.scandir(self.log_dir) as entries:
+                self._logs = {
+                    entry.inode(): entry.name for entry in entries
+                    if entry.name.endswith(".csv")
+                    and not entry.name.startswith(".")
+                    and "_summary" not in entry.name
+                }
+            self._dir_mtime_ns = mtime_ns
+            # Forget deleted logs so a reused inode counts as a new log
+            self.processed.intersection_update(self._logs)
+            for inode in self._sizes.keys() - self._logs.keys():
+                del self._sizes[inode]
+        return self._logs
+
+    def poll(self) -> tuple[Optional[Path], list[Path]]:
+        """
+        Check all unprocessed logs once.
+
+        Returns:
+            Tuple of (log that grew since the last poll or None, completed logs)
+        """
+        now = time.monotonic()
+        growing = None
+        completed = []
+
+        logs = self._list_logs()
+        stats = {}
+        for inode in logs.keys() - self.processed:
+            try:
+                stats[inode] = os.stat(self.log_dir / logs[inode])
+            except FileNotFoundError:
+                self._sizes.pop(inode, None)
+
+        # Report logs in the order they were last written to
+        for inode in sorted(stats, key=lambda i: stats[i].st_mtime_ns):
+            log_file = self.log_dir / logs[inode]
+            size = stats[inode].st_size
+
+            last = self._sizes.get(inode)
+            if last is None or size != last[0]:
+                if last is not None and size > last[0] and growing is None:
+                    growing = log_file
+                self._sizes[inode] = (size, now)
+                self._small.discard(inode)
+            elif now - last[1] >= self.stable_seconds:
+                if size > self.min_size:
+                    completed.append(log_file)
+                else:
+                    # MangoHud may only have flushed its header so far
+                    self._small.add(inode)
+
+        return growing, completed
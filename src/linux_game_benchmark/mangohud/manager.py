@@ -8,6 +8,7 @@ import os
 import shutil
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -397,9 +398,20 @@ def check_mangohud_installation() -> dict:
     """
     Check MangoHud installation status.
 
+    The result is computed once per process and PATH value, since it runs
+    `mangohud --version` in a subprocess.
+
     Returns:
         Dictionary with installation info.
     """
+    info = _check_mangohud_installation(os.environ.get("PATH", ""))
+    # Copy so callers can't modify the cached result
+    return {**info, "config_paths": list(info["config_paths"])}
+
+
+@lru_cache(maxsize=None)
+def _check_mangohud_installation(path: str) -> dict:
+    """Uncached MangoHud installation check (path is only the cache key)."""
     info = {
         "installed": MangoHudManager.is_installed(),
         "version": None,
@@ -0,0 +1,126 @@
+"""
+Steam App Catalog.
+
+Keeps a local copy of Steam's full app list (app id -> name) so game
+names can be matched without a Store search request per query.
+
+Matching needs rapidfuzz; without it, or before the catalog has been
+downloaded, callers should fall back to the Steam Store search.
+"""
+
+import json
+import time
+from typing import Optional
+
+import requests
+
+from linux_game_benchmark.config.settings import settings
+from linux_game_benchmark.utils.files import write_atomic
+
+try:
+    from rapidfuzz import fuzz, process, utils
+except ImportError:
+    process = None
+
+CATALOG_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
+CATALOG_FILE = settings.CACHE_DIR / "steam_applist.json"
+CATALOG_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Loaded catalog: (app ids, names), index-aligned
+_catalog: Optional[tuple[list[int], list[str]]] = None
+
+
+def _parse_app_list(data: dict) -> tuple[list[int], list[str]]:
+    """Split a GetAppList response into index-aligned id and name lists."""
+    ids = []
+    names = []
+    for app in data.get("applist", {}).get("apps", []):
+        name = app.get("name", "").strip()
+        if name:
+            ids.append(app["appid"])
+            names.append(name)
+    return ids, names
+
+
+def refresh_catalog() -> bool:
+    """
+    Download the app list from Steam and store it in the cache.
+
+    Returns:
+        True if the catalog was downloaded
+    """
+    global _catalog
+
+    try:
+        response = requests.get(CATALOG_URL, timeout=30)
+        if response.status_code != 200:
+            return False
+        ids, names = _parse_app_list(response.json())
+    except Exception:
+        return False
+    if not ids:
+        return False
+
+    _catalog = (ids, names)
+    try:
+        CATALOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(CATALOG_FILE, json.dumps({"ts": time.time(), "ids": ids, "names": names}))
+    except IOError:
+        pass  # Caching is best-effort
+    return True
+
+
+def load_catalog() -> Optional[tuple[list[int], list[str]]]:
+    """
+    Load the cached app list.
+
+    Returns:
+        Tuple of (app ids, names), or None if there is no fresh cached catalog
+    """
+    global _catalog
+
+    if _catalog is not None:
+        return _catalog
+
+    try:
+        data = json.loads(CATALOG_FILE.read_text())
+        if time.time() - data["ts"] >= CATALOG_TTL_SECONDS:
+            return None
+        ids, names = data["ids"], data["names"]
+    except (json.JSONDecodeError, IOError, KeyError, TypeError):
+        return None
+    if len(ids) != len(names):
+        return None
+
+    _catalog = (ids, names)
+    return _catalog
+
+
+def search(query: str, limit: int = 5) -> Optional[list[dict]]:
+    """
+    Fuzzy-match a game name against the local catalog.
+
+    Args:
+        query: The game name to search for
+        limit: Maximum number of matches
+
+    Returns:
+        List of dicts with 'appid' and 'name' keys, best match first,
+        or None if rapidfuzz or the catalog is not available
+    """
+    if process is None:
+        return None
+    catalog = load_catalog()
+    if catalog is None:
+        return None
+
+    ids, names = catalog
+    results = process.extract(
+        query,
+        names,
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+        limit=limit,
+        score_cutoff=60,
+    )
+    return [{"appid": ids[index], "name": name} for name, _, index in results]
@@ -1,17 +1,153 @@
 """Find Steam App IDs by game name."""
 
+import json
 import requests
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 from difflib import SequenceMatcher
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 import re
 
+from linux_game_benchmark.config.settings import settings
+from linux_game_benchmark.steam import app_catalog
+from linux_game_benchmark.utils.files import write_atomic
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
 # Cache for Steam app details to avoid repeated API calls
 _app_details_cache: dict[int, dict] = {}
 
+# Keep-alive session shared by all Store requests, sized for get_steam_app_details_many()
+STORE_MAX_WORKERS = 8
+_session = requests.Session()
+_session.mount(
+    "https://", HTTPAdapter(pool_connections=STORE_MAX_WORKERS, pool_maxsize=STORE_MAX_WORKERS)
+)
+
+# Guards _app_details_cache and the Store cache across threads
+_cache_lock = threading.Lock()
+
+# Steam Store responses persisted across runs
+STORE_CACHE_FILE = settings.CACHE_DIR / "steam_store.json"
+STORE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# In-memory copy of STORE_CACHE_FILE, loaded on first use
+_store_cache: Optional[dict] = None
+
+
+# Names at least this long are compared by their word sets
+TOKEN_SET_MIN_LENGTH = 20
+
+# Score for a name whose words are a strict subset of the other's. Kept below
+# GameFinder's auto-select threshold (0.95): "Cyberpunk 2077" and
+# "Cyberpunk 2077: Phantom Liberty" are related, but not the same game.
+TOKEN_SET_SUBSET_SCORE = 0.9
+
+
+def _ratio(a: str, b: str) -> float:
+    """2 * matched characters / total characters (0-1)."""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
 
+def _token_set_ratio(a: str, b: str) -> float:
+    """
+    Compare two names by their sets of words (0-1).
+
+    Same scheme as rapidfuzz's token_set_ratio: shared words are compared
+    against shared words plus each side's extra words. Unlike it, a name
+    that only adds words to the other scores TOKEN_SET_SUBSET_SCORE, not 1.0.
+    """
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if tokens_a == tokens_b:
+        return 1.0
+    if tokens_a & tokens_b and (tokens_a <= tokens_b or tokens_b <= tokens_a):
+        return TOKEN_SET_SUBSET_SCORE
+    if fuzz is not None:
+        return fuzz.token_set_ratio(a, b) / 100.0
+
+    common = " ".join(sorted(tokens_a & tokens_b))
+    with_a = f"{common} {' '.join(sorted(tokens_a - tokens_b))}".strip()
+    with_b = f"{common} {' '.join(sorted(tokens_b - tokens_a))}".strip()
+    scores = [_ratio(with_a, with_b)]
+    if common:
+        scores += [_ratio(common, with_a), _ratio(common, with_b)]
+    return max(scores)
+
+
+@lru_cache(maxsize=4096)
 def similarity(a: str, b: str) -> float:
-    """Calculate string similarity (0-1)."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    """
+    Calculate string similarity (0-1).
+
+    Names are compared character by character, unless both reach
+    TOKEN_SET_MIN_LENGTH; then words are compared as sets, so edition and
+    bundle suffixes on long Steam names don't drag the score down.
+    Uses rapidfuzz's C++ matchers when installed, otherwise difflib.
+    Results are memoized, since the same query is scored against the
+    same names repeatedly while a game is being picked.
+    """
+    a, b = a.lower(), b.lower()
+    if len(a) < TOKEN_SET_MIN_LENGTH or len(b) < TOKEN_SET_MIN_LENGTH:
+        return _ratio(a, b)
+    return _token_set_ratio(a, b)
+
+
+def _read_store_cache() -> dict:
+    """Read the Store cache file, treating unreadable files as empty."""
+    try:
+        cache = json.loads(STORE_CACHE_FILE.read_text())
+    except (json.JSONDecodeError, IOError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _store_get(url: str, params: dict) -> Optional[dict]:
+    """
+    GET a Steam Store API endpoint, reusing responses from the last day.
+
+    Successful JSON responses are cached per URL and parameters for
+    STORE_CACHE_TTL_SECONDS, in memory and on disk. Errors are not
+    cached and propagate.
+
+    Returns:
+        Parsed JSON response, or None if the request failed
+    """
+    global _store_cache
+
+    key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    now = time.time()
+    with _cache_lock:
+        if _store_cache is None:
+            # Drop expired entries once, when the file is loaded
+            _store_cache = {
+                k: e for k, e in _read_store_cache().items()
+                if isinstance(e, dict) and now - e.get("ts", 0) < STORE_CACHE_TTL_SECONDS
+            }
+        entry = _store_cache.get(key)
+    if isinstance(entry, dict) and now - entry.get("ts", 0) < STORE_CACHE_TTL_SECONDS:
+        return entry.get("data")
+
+    response = _session.get(url, params=params, timeout=10)
+    if response.status_code != 200:
+        return None
+    data = response.json()
+
+    with _cache_lock:
+        _store_cache[key] = {"ts": now, "data": data}
+        try:
+            STORE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(STORE_CACHE_FILE, json.dumps(_store_cache))
+        except IOError:
+            pass  # Caching is best-effort
+    return data
 
 
 def get_steam_app_details(app_id: int) -> Optional[dict]:
@@ -30,18 +166,17 @@ def get_steam_app_details(app_id: int) -> Optional[dict]:
         Dictionary with app details or None if not found
     """
     # Check cache first
-    if app_id in _app_details_cache:
-        return _app_details_cache[app_id]
+    with _cache_lock:
+        if app_id in _app_details_cache:
+            return _app_details_cache[app_id]
 
     try:
         url = f"https://store.steampowered.com/api/appdetails"
         params = {"appids": app_id, "l": "english"}
-        response = requests.get(url, params=params, timeout=10)
-
-        if response.status_code != 200:
+        data = _store_get(url, params)
+        if data is None:
             return None
 
-        data = response.json()
         app_data = data.get(str(app_id), {})
 
         if not app_data.get("success"):
@@ -50,13 +185,34 @@ def get_steam_app_details(app_id: int) -> Optional[dict]:
         details = app_data.get("data", {})
 
         # Cache the result
-        _app_details_cache[app_id] = details
+        with _cache_lock:
+            _app_details_cache[app_id] = details
         return details
 
     except Exception:
         return None
 
 
+def get_steam_app_details_many(app_ids: Iterable[int]) -> dict[int, Optional[dict]]:
+    """
+    Get details for several Steam apps at once.
+
+    The Store API only accepts one app per appdetails request, so the
+    requests run concurrently over the shared keep-alive session.
+
+    Args:
+        app_ids: The Steam App IDs
+
+    Returns:
+        Dictionary mapping each App ID to its details, or None if not found
+    """
+    app_ids = list(dict.fromkeys(app_ids))
+    if not app_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(STORE_MAX_WORKERS, len(app_ids))) as executor:
+        return dict(zip(app_ids, executor.map(get_steam_app_details, app_ids)))
+
+
 def get_header_image_url(app_id: int) -> str:
     """
     Get the header image URL for a Steam app.
@@ -121,12 +277,10 @@ def find_steam_app_id(game_name: str, min_similarity: float = 0.7) -> Optional[i
             "l": "english",
             "cc": "US"
         }
-        response = requests.get(url, params=params, timeout=10)
-
-        if response.status_code != 200:
+        data = _store_get(url, params)
+        if data is None:
             return None
 
-        data = response.json()
         items = data.get("items", [])
 
         if not items:
@@ -137,7 +291,9 @@ def find_steam_app_id(game_name: str, min_similarity: float = 0.7) -> Optional[i
         best_item = items[0]
         item_name = best_item.get("name", "")
 
-        score = similarity(game_name, item_name)
+        # Accept on the character ratio only, so a DLC or sequel that merely
+        # contains the searched name is never taken for the game itself
+        score = _ratio(game_name.lower(), item_name.lower())
         if score >= min_similarity:
             return best_item.get("id")
 
@@ -151,9 +307,18 @@ def get_multiple_matches(game_name: str, limit: int = 5) -> list[dict]:
     """
     Get multiple potential matches for a game name.
 
+    Searches the local app catalog when it is available and falls back
+    to the Steam Store search otherwise.
+
     Returns:
         List of dicts with 'appid', 'name', and 'similarity' keys
     """
+    local = app_catalog.search(game_name, limit)
+    if local is not None:
+        for match in local:
+            match["similarity"] = similarity(game_name, match["name"])
+        return local
+
     try:
         # Use Steam Store search
         url = "https://store.steampowered.com/api/storesearch/"
@@ -162,12 +327,10 @@ def get_multiple_matches(game_name: str, limit: int = 5) -> list[dict]:
             "l": "english",
             "cc": "US"
         }
-        response = requests.get(url, params=params, timeout=10)
-
-        if response.status_code != 200:
+        data = _store_get(url, params)
+        if data is None:
             return []
 
-        data = response.json()
         items = data.get("items", [])
 
         # Convert to our format with similarity scores
@@ -6,9 +6,93 @@ Modifies Steam's localconfig.vdf to set launch options for games.
 
 import re
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from linux_game_benchmark.utils.files import write_atomic
+
+# VDF tokens: quoted string, brace, comment, conditional ([$WIN32]) or bare word
+_VDF_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])|//[^\n]*|\[[^\]\n]*\]|([^\s{}"]+)')
+_VDF_ESCAPE_RE = re.compile(r"\\(.)")
+
+# Key path of the per-app settings in localconfig.vdf (compared lower-cased)
+_APPS_PATH = ("software", "valve", "steam", "apps")
+
+
+@dataclass
+class _LaunchOptionSpans:
+    """Positions in localconfig.vdf needed to read or edit an app's launch options."""
+    apps_end: Optional[int] = None  # Closing brace of the apps section
+    app_end: Optional[int] = None  # Closing brace of the app's block
+    value: Optional[tuple[int, int]] = None  # LaunchOptions value token
+
+
+def _locate_launch_options(content: str, app_id: int) -> _LaunchOptionSpans:
+    """
+    Find an app's launch options in VDF text.
+
+    Walks the tokens once, tracking the key path, and stops as soon as
+    the app's block (or the apps section, if the app has no block) is
+    closed. Brace-matching regexes over the whole file are not needed.
+    """
+    app = str(app_id)
+    spans = _LaunchOptionSpans()
+    path: list[str] = []
+    key: Optional[str] = None
+
+    for match in _VDF_TOKEN_RE.finditer(content):
+        quoted, brace, bare = match.groups()
+        if brace == "{":
+            path.append(key.lower() if key is not None else "")
+            key = None
+        elif brace == "}":
+            if path and path[-1] == app and tuple(path[-5:-1]) == _APPS_PATH:
+                spans.app_end = match.start()
+                return spans
+            if tuple(path[-4:]) == _APPS_PATH:
+                spans.apps_end = match.start()
+                return spans
+            if path:
+                path.pop()
+            key = None
+        elif quoted is not None or bare is not None:
+            if key is None:
+                key = quoted if quoted is not None else bare
+                continue
+            if (
+                key.lower() == "launchoptions"
+                and path and path[-1] == app
+                and tuple(path[-5:-1]) == _APPS_PATH
+            ):
+                spans.value = match.span()
+            key = None
+
+    return spans
+
+
+def _read_launch_options(content: str, app_id: int) -> Optional[str]:
+    """Launch options of an app in VDF text, or None if it has none."""
+    spans = _locate_launch_options(content, app_id)
+    if spans.value is None:
+        return None
+    start, end = spans.value
+    token = content[start:end]
+    if token.startswith('"'):
+        token = token[1:-1]
+    return _VDF_ESCAPE_RE.sub(r"\1", token)
+
+
+def _insert_before_brace(content: str, brace: int, lines: list[str]) -> str:
+    """Insert lines into a VDF block, one level deeper than its closing brace."""
+    line_start = content.rfind("\n", 0, brace) + 1
+    indent = content[line_start:brace]
+    if indent.strip():
+        # Brace shares its line with other tokens
+        return content[:brace] + " ".join(lines) + " " + content[brace:]
+    block = "".join(f"{indent}\t{line}\n" for line in lines)
+    return content[:line_start] + block + content[line_start:]
+
 
 def find_localconfig() -> Optional[Path]:
     """Find Steam's localconfig.vdf file."""
@@ -36,16 +120,7 @@ def get_launch_options(app_id: int) -> Optional[str]:
     if not config_path:
         return None
 
-    content = config_path.read_text()
-
-    # Look for LaunchOptions in the apps section
-    # Pattern: "apps" { ... "<app_id>" { ... "LaunchOptions" "<options>" ... } ... }
-    pattern = rf'"apps"[^{{]*\{{[^}}]*"{app_id}"[^{{]*\{{[^}}]*"LaunchOptions"\s+"([^"]*)"'
-    match = re.search(pattern, content, re.DOTALL)
-
-    if match:
-        return match.group(1)
-    return None
+    return _read_launch_options(config_path.read_text(), app_id)
 
 
 def set_launch_options(app_id: int, options: str, backup: bool = True) -> bool:
@@ -58,7 +133,7 @@ def set_launch_options(app_id: int, options: str, backup: bool = True) -> bool:
         backup: Create backup before modifying
 
     Returns:
-        True if successful
+        True if successful, False if the config has no apps section
     """
     config_path = find_localconfig()
     if not config_path:
@@ -70,69 +145,29 @@ def set_launch_options(app_id: int, options: str, backup: bool = True) -> bool:
         shutil.copy2(config_path, backup_path)
 
     content = config_path.read_text()
-
-    # Check if app entry exists in "apps" section under "Software" -> "Valve" -> "Steam"
-    # VDF structure is nested, we need to find the right place
-
-    # First, try to find existing LaunchOptions for this app
-    # Pattern to find the app block
-    app_pattern = rf'("{app_id}"\s*\{{[^}}]*)\}}'
-
-    def replace_or_add_launch_options(match):
-        block = match.group(1)
-        # Check if LaunchOptions already exists
-        if '"LaunchOptions"' in block:
-            # Replace existing
-            block = re.sub(
-                r'"LaunchOptions"\s+"[^"]*"',
-                f'"LaunchOptions"\t\t"{options}"',
-                block
-            )
-        else:
-            # Add new LaunchOptions before closing brace
-            block = block.rstrip() + f'\n\t\t\t\t\t\t"LaunchOptions"\t\t"{options}"\n\t\t\t\t\t'
-        return block + "}"
-
-    # Find the apps section and modify
-    new_content = content
-
-    # Look for the app in the Apps section (capital A)
-    apps_section_pattern = r'("Apps"\s*\{)(.*?)(\n\s*\})'
-    apps_match = re.search(apps_section_pattern, content, re.DOTALL | re.IGNORECASE)
-
-    if apps_match:
-        apps_content = apps_match.group(2)
-
-        # Check if our app exists
-        app_entry_pattern = rf'("{app_id}"\s*\{{)(.*?)(\}})'
-        app_match = re.search(app_entry_pattern, apps_content, re.DOTALL)
-
-        if app_match:
-            app_block = app_match.group(2)
-            if '"LaunchOptions"' in app_block:
-                # Replace existing
-                new_app_block = re.sub(
-                    r'"LaunchOptions"\s+"[^"]*"',
-                    f'"LaunchOptions"\t\t"{options}"',
-                    app_block
-                )
-            else:
-                # Add LaunchOptions
-                new_app_block = app_block.rstrip() + f'\n\t\t\t\t\t\t"LaunchOptions"\t\t"{options}"\n\t\t\t\t\t'
-
-            new_apps_content = apps_content.replace(
-                app_match.group(0),
-                app_match.group(1) + new_app_block + app_match.group(3)
-            )
-            new_content = content.replace(apps_content, new_apps_content)
-        else:
-            # App doesn't exist in Apps section, need to add it
-            new_app_entry = f'\n\t\t\t\t\t"{app_id}"\n\t\t\t\t\t{{\n\t\t\t\t\t\t"LaunchOptions"\t\t"{options}"\n\t\t\t\t\t}}'
-            new_apps_content = apps_content + new_app_entry
-            new_content = content.replace(apps_content, new_apps_content)
+    spans = _locate_launch_options(content, app_id)
+    value = options.replace("\\", "\\\\").replace('"', '\\"')
+
+    if spans.value is not None:
+        # Replace existing
+        start, end = spans.value
+        new_content = content[:start] + f'"{value}"' + content[end:]
+    elif spans.app_end is not None:
+        # Add LaunchOptions to the app's block
+        new_content = _insert_before_brace(content, spans.app_end, [f'"LaunchOptions"\t\t"{value}"'])
+    elif spans.apps_end is not None:
+        # App doesn't exist in Apps section, need to add it
+        new_content = _insert_before_brace(content, spans.apps_end, [
+            f'"{app_id}"',
+            "{",
+            f'\t"LaunchOptions"\t\t"{value}"',
+            "}",
+        ])
+    else:
+        return False
 
     # Write the modified content
-    config_path.write_text(new_content)
+    write_atomic(config_path, new_content)
     return True
 
 
@@ -184,13 +219,7 @@ def get_original_launch_options(app_id: int) -> Optional[str]:
     if not backup_path.exists():
         return None
 
-    content = backup_path.read_text()
-    pattern = rf'"Apps"[^{{]*\{{[^}}]*"{app_id}"[^{{]*\{{[^}}]*"LaunchOptions"\s+"([^"]*)"'
-    match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-
-    if match:
-        return match.group(1)
-    return None
+    return _read_launch_options(backup_path.read_text(), app_id)
 
 
 def restore_launch_options(app_id: int) -> bool:
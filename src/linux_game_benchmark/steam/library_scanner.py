@@ -4,10 +4,14 @@ Steam Library Scanner.
 Finds and parses Steam's appmanifest files to get installed games.
 """
 
+import json
 import re
 from pathlib import Path
 from typing import Optional
 
+from linux_game_benchmark.config.settings import Settings
+from linux_game_benchmark.utils.files import write_atomic
+
 # Known games with builtin benchmarks
 GAMES_WITH_BUILTIN_BENCHMARK = {
     750920: {"name": "Shadow of the Tomb Raider", "args": ["-benchmark"]},
@@ -46,15 +50,24 @@ EXCLUDED_APP_IDS = {
 class SteamLibraryScanner:
     """Scans Steam library for installed games."""
 
-    def __init__(self, steam_path: Optional[Path] = None):
+    # Persistent scan result, reused while the library folders are unchanged
+    CACHE_FILE = Settings.CACHE_DIR / "library.json"
+    CACHE_VERSION = 2
+
+    def __init__(self, steam_path: Optional[Path] = None, cache_file: Optional[Path] = None):
         """
         Initialize scanner.
 
         Args:
             steam_path: Path to Steam installation. Auto-detected if None.
+            cache_file: Path of the scan cache file. Defaults to CACHE_FILE.
         """
         self.steam_path = steam_path or self._find_steam_path()
+        self.cache_file = cache_file or self.CACHE_FILE
         self._games_cache: list[dict] = []
+        # Lookup indexes over _games_cache, rebuilt by _set_games()
+        self._games_by_id: dict[int, dict] = {}
+        self._games_by_name: dict[str, dict] = {}
 
     def _find_steam_path(self) -> Path:
         """Find Steam installation path."""
@@ -74,26 +87,98 @@ class SteamLibraryScanner:
             "Please specify path with --steam-path"
         )
 
-    def scan(self) -> list[dict]:
+    def scan(self, refresh: bool = False) -> list[dict]:
         """
         Scan Steam library and return list of installed games.
 
+        Results are cached on disk per library folder. Only folders whose
+        modification times changed since the last scan have their
+        manifests parsed again.
+
+        Args:
+            refresh: Ignore the cache and rescan all manifests.
+
         Returns:
             List of game dictionaries with app_id, name, path, etc.
         """
         games_by_id: dict[int, dict] = {}
-        steamapps_dirs = self._get_steamapps_dirs()
+        cached_dirs = {} if refresh else self._load_cache()
+        scanned_dirs: dict[str, dict] = {}
+
+        for steamapps_dir in self._get_steamapps_dirs():
+            key = str(steamapps_dir)
+            fingerprint = self._fingerprint(steamapps_dir)
+            entry = cached_dirs.get(key)
+            if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+                entry = {"fingerprint": fingerprint, "games": self._scan_dir(steamapps_dir)}
+            scanned_dirs[key] = entry
+
+            for game in entry["games"]:
+                # Deduplicate by app_id
+                if game["app_id"] not in games_by_id:
+                    games_by_id[game["app_id"]] = game
+
+        self._set_games(list(games_by_id.values()))
+        if scanned_dirs != cached_dirs:
+            self._save_cache(scanned_dirs)
+        return self._games_cache
 
-        for steamapps_dir in steamapps_dirs:
-            for manifest_file in steamapps_dir.glob("appmanifest_*.acf"):
-                game = self._parse_manifest(manifest_file)
-                if game and game["app_id"] not in EXCLUDED_APP_IDS:
-                    # Deduplicate by app_id
-                    if game["app_id"] not in games_by_id:
-                        games_by_id[game["app_id"]] = game
+    def _scan_dir(self, steamapps_dir: Path) -> list[dict]:
+        """Parse all appmanifest files of one steamapps directory."""
+        games = []
+        for manifest_file in steamapps_dir.glob("appmanifest_*.acf"):
+            game = self._parse_manifest(manifest_file)
+            if game and game["app_id"] not in EXCLUDED_APP_IDS:
+                games.append(game)
+        return games
+
+    def _set_games(self, games: list[dict]) -> None:
+        """Store scan results and rebuild the id/name lookup indexes."""
+        self._games_cache = games
+        self._games_by_id = {game["app_id"]: game for game in games}
+        self._games_by_name = {}
+        for game in games:
+            # First game wins, like the linear search this replaces
+            self._games_by_name.setdefault(game["name"].lower(), game)
+
+    def _fingerprint(self, steamapps_dir: Path) -> str:
+        """
+        Build the cache key for one library folder.
 
-        self._games_cache = list(games_by_id.values())
-        return self._games_cache
+        Installing or removing a game adds or removes an appmanifest (and its
+        compatdata folder), which changes the mtime of the containing directory.
+        """
+        entries = []
+        for path in (
+            steamapps_dir,
+            steamapps_dir / "libraryfolders.vdf",
+            steamapps_dir / "compatdata",
+        ):
+            try:
+                entries.append(str(path.stat().st_mtime_ns))
+            except OSError:
+                entries.append("-")
+        return ":".join(entries)
+
+    def _load_cache(self) -> dict[str, dict]:
+        """Load cached scan results, keyed by steamapps directory."""
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.CACHE_VERSION:
+            return {}
+        dirs = data.get("dirs")
+        return dirs if isinstance(dirs, dict) else {}
+
+    def _save_cache(self, dirs: dict[str, dict]) -> None:
+        """Save scan results to the cache file (best effort)."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.cache_file, json.dumps({"version": self.CACHE_VERSION, "dirs": dirs}))
+        except IOError:
+            pass
 
     def _get_steamapps_dirs(self) -> list[Path]:
         """Get all steamapps directories (including library folders)."""
@@ -160,9 +245,26 @@ class SteamLibraryScanner:
         if not self._games_cache:
             self.scan()
 
-        for game in self._games_cache:
-            if game["app_id"] == app_id:
-                return game
+        return self._games_by_id.get(app_id)
+
+    def get_game_by_id_fast(self, app_id: int) -> Optional[dict]:
+        """
+        Get a game by its App ID without scanning the whole library.
+
+        Reads only appmanifest_<app_id>.acf from each library folder,
+        unless a scan has already loaded all games.
+        """
+        if self._games_cache:
+            return self._games_by_id.get(app_id)
+        if app_id in EXCLUDED_APP_IDS:
+            return None
+
+        for steamapps_dir in self._get_steamapps_dirs():
+            manifest = steamapps_dir / f"appmanifest_{app_id}.acf"
+            if manifest.exists():
+                game = self._parse_manifest(manifest)
+                if game and game["app_id"] == app_id:
+                    return game
         return None
 
     def get_game_by_name(self, name: str) -> Optional[dict]:
@@ -173,9 +275,9 @@ class SteamLibraryScanner:
         name_lower = name.lower().strip()
 
         # First: try exact match (case-insensitive)
-        for game in self._games_cache:
-            if game["name"].lower() == name_lower:
-                return game
+        game = self._games_by_name.get(name_lower)
+        if game:
+            return game
 
         # Second: try partial match, but prefer shorter names (more specific)
         # This prevents "Path of Exile" from matching "Path of Exile 2" first
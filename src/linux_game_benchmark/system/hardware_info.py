@@ -4,9 +4,11 @@ System Hardware Information.
 Gathers GPU, CPU, RAM, OS information for benchmarking context.
 """
 
+import copy
 import os
 import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -84,9 +86,18 @@ def get_system_info() -> dict:
     """
     Gather comprehensive system information.
 
+    The hardware probe runs once per process; each call returns its own
+    copy so callers can modify it freely.
+
     Returns:
         Dictionary with os, gpu, cpu, ram, steam info.
     """
+    return copy.deepcopy(_get_system_info())
+
+
+@lru_cache(maxsize=1)
+def _get_system_info() -> dict:
+    """Uncached system information probe."""
     return {
         "os": get_os_info(),
         "gpu": get_gpu_info(),
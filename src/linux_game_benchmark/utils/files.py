@@ -0,0 +1,28 @@
+"""File helpers."""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """
+    Replace a file's content in one step.
+
+    Writes a sibling temp file and renames it over the target, so a
+    crash or a concurrent reader never sees a half-written file. An
+    existing target keeps its permissions. The temp file name is unique
+    per process and thread, so concurrent writers don't clobber it.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(content.encode())
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass  # New file
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
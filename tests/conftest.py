@@ -4,12 +4,86 @@ Pytest configuration and fixtures for Linux Game Benchmark client tests.
 These are UNIT tests only - they test client-side functionality without
 requiring a server connection.
 
+Tests that invoke the full CLI are marked slow; run
+`pytest -m "not slow"` for a quicker local loop.
+
 For integration/E2E tests, see the server repository:
 https://github.com/taaderbe/linuxgamebenchserver
 """
 
+import socket
+
 import pytest
 from pathlib import Path
+from typer.testing import CliRunner
+
+from linux_game_benchmark.config.settings import Settings
+
+
+# =============================================================================
+# Network Guard
+# =============================================================================
+
+class NetworkAccessError(RuntimeError):
+    """Raised when a unit test tries to reach the network."""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_network():
+    """Fail fast on real network access instead of waiting for timeouts."""
+    def guard(real_connect):
+        def guarded_connect(sock, address):
+            if sock.family == socket.AF_UNIX:
+                return real_connect(sock, address)
+            raise NetworkAccessError(f"unit tests must not connect to {address!r}")
+        return guarded_connect
+
+    def blocked_getaddrinfo(host, *args, **kwargs):
+        raise NetworkAccessError(f"unit tests must not resolve {host!r}")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket.socket, "connect", guard(socket.socket.connect))
+        mp.setattr(socket.socket, "connect_ex", guard(socket.socket.connect_ex))
+        mp.setattr(socket, "getaddrinfo", blocked_getaddrinfo)
+        yield
+
+
+# =============================================================================
+# CLI and Settings Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def _plain_terminal():
+    """Render CLI output without colors at a fixed width (set up before help_outputs)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("NO_COLOR", "1")
+        mp.setenv("TERM", "dumb")
+        mp.setenv("COLUMNS", "120")
+        yield
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """CliRunner shared by all CLI tests (it keeps no state between invokes)."""
+    return CliRunner()
+
+
+# Commands whose --help output is rendered once per session
+HELP_COMMANDS = [(), ("login",)]
+
+
+@pytest.fixture(scope="session")
+def help_outputs(cli_runner: CliRunner) -> dict:
+    """--help results of HELP_COMMANDS, keyed by command tuple."""
+    from linux_game_benchmark.cli import app
+
+    return {cmd: cli_runner.invoke(app, [*cmd, "--help"]) for cmd in HELP_COMMANDS}
+
+
+@pytest.fixture(scope="session")
+def fresh_settings() -> Settings:
+    """A Settings instance created independently of the module singleton."""
+    return Settings()
 
 
 # =============================================================================
@@ -0,0 +1,112 @@
+"""
+Unit tests for the local Steam app catalog.
+
+The GetAppList download is replaced by a fake response; no network
+requests are made.
+"""
+
+import json
+import pytest
+from unittest.mock import Mock
+
+from linux_game_benchmark.steam import app_catalog, app_id_finder
+
+APP_LIST = {
+    "applist": {
+        "apps": [
+            {"appid": 1091500, "name": "Cyberpunk 2077"},
+            {"appid": 2138330, "name": "Cyberpunk 2077: Phantom Liberty"},
+            {"appid": 427520, "name": "Factorio"},
+            {"appid": 5, "name": ""},
+        ]
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def catalog_file(tmp_path, monkeypatch):
+    """Store the catalog in a temporary directory and start unloaded."""
+    path = tmp_path / "steam_applist.json"
+    monkeypatch.setattr(app_catalog, "CATALOG_FILE", path)
+    monkeypatch.setattr(app_catalog, "_catalog", None)
+    return path
+
+
+def _fake_get(calls: list, status_code: int = 200):
+    """requests.get replacement returning APP_LIST."""
+    def fake_get(url, params=None, timeout=None):
+        calls.append(url)
+        response = Mock(status_code=status_code)
+        response.json.return_value = APP_LIST
+        return response
+    return fake_get
+
+
+class TestCatalogCache:
+    """Tests for downloading and loading the catalog."""
+
+    def test_refresh_writes_cache(self, monkeypatch, catalog_file):
+        """A download is stored on disk without nameless apps."""
+        monkeypatch.setattr(app_catalog.requests, "get", _fake_get([]))
+
+        assert app_catalog.refresh_catalog()
+
+        data = json.loads(catalog_file.read_text())
+        assert data["ids"] == [1091500, 2138330, 427520]
+        assert data["names"][2] == "Factorio"
+
+    def test_load_reads_cache(self, monkeypatch):
+        """A fresh cache file is loaded without a download."""
+        monkeypatch.setattr(app_catalog.requests, "get", _fake_get([]))
+        app_catalog.refresh_catalog()
+        monkeypatch.setattr(app_catalog, "_catalog", None)
+
+        ids, names = app_catalog.load_catalog()
+
+        assert ids[names.index("Cyberpunk 2077")] == 1091500
+
+    def test_expired_cache_is_ignored(self, monkeypatch):
+        """Catalogs older than the TTL count as missing."""
+        monkeypatch.setattr(app_catalog.requests, "get", _fake_get([]))
+        app_catalog.refresh_catalog()
+        monkeypatch.setattr(app_catalog, "_catalog", None)
+
+        later = app_catalog.time.time() + app_catalog.CATALOG_TTL_SECONDS + 1
+        monkeypatch.setattr(app_catalog.time, "time", lambda: later)
+
+        assert app_catalog.load_catalog() is None
+
+    def test_failed_download(self, monkeypatch, catalog_file):
+        """A failed download leaves no catalog behind."""
+        monkeypatch.setattr(app_catalog.requests, "get", _fake_get([], status_code=503))
+
+        assert not app_catalog.refresh_catalog()
+        assert app_catalog.load_catalog() is None
+        assert not catalog_file.exists()
+
+
+class TestCatalogSearch:
+    """Tests for matching names against the catalog."""
+
+    def test_missing_catalog_falls_back_to_store(self, monkeypatch):
+        """Without a catalog, get_multiple_matches() uses the Store search."""
+        store = Mock(return_value={"items": [{"id": 1091500, "name": "Cyberpunk 2077"}]})
+        monkeypatch.setattr(app_id_finder, "_store_get", store)
+
+        assert app_catalog.search("Cyberpunk") is None
+        assert app_id_finder.get_multiple_matches("Cyberpunk")[0]["appid"] == 1091500
+        store.assert_called_once()
+
+    def test_local_search(self, monkeypatch):
+        """With rapidfuzz and a catalog, matches come from the catalog."""
+        pytest.importorskip("rapidfuzz")
+        monkeypatch.setattr(app_catalog.requests, "get", _fake_get([]))
+        app_catalog.refresh_catalog()
+        monkeypatch.setattr(
+            app_id_finder, "_store_get", Mock(side_effect=AssertionError("Store searched"))
+        )
+
+        matches = app_id_finder.get_multiple_matches("cyberpunk 2077")
+
+        assert matches[0] == {"appid": 1091500, "name": "Cyberpunk 2077", "similarity": 1.0}
+        assert 427520 not in [m["appid"] for m in matches]
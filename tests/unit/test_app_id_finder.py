@@ -0,0 +1,203 @@
+"""
+Unit tests for Steam App ID lookup helpers.
+
+Only covers offline helpers; no Steam Store requests are made.
+"""
+
+import pytest
+
+from linux_game_benchmark.steam import app_catalog, app_id_finder
+from linux_game_benchmark.steam.app_id_finder import similarity
+
+
+class TestSimilarity:
+    """Tests for the name similarity score."""
+
+    def test_identical_names_ignore_case(self):
+        """Names differing only in case are a perfect match."""
+        assert similarity("Cyberpunk 2077", "CYBERPUNK 2077") == 1.0
+
+    def test_unrelated_names_score_low(self):
+        """Unrelated names score well below the match thresholds."""
+        assert similarity("Factorio", "Baldur's Gate 3") < 0.3
+
+    def test_partial_name_score(self):
+        """A prefix scores 2 * matched / total characters."""
+        assert similarity("Path of Exile", "Path of Exile 2") == pytest.approx(26 / 28)
+
+    def test_difflib_fallback(self, monkeypatch):
+        """Without rapidfuzz the difflib matcher gives the same score on simple names."""
+        expected = similarity("Path of Exile", "Path of Exile 2")
+        monkeypatch.setattr(app_id_finder, "fuzz", None)
+        similarity.cache_clear()
+
+        assert similarity("Path of Exile", "Path of Exile 2") == pytest.approx(expected)
+        similarity.cache_clear()
+
+    def test_long_names_ignore_extra_words(self):
+        """Edition suffixes on long names score high, but below auto-select."""
+        score = similarity("Baldur's Gate 3 Deluxe", "Baldur's Gate 3 Digital Deluxe Edition")
+
+        assert score == app_id_finder.TOKEN_SET_SUBSET_SCORE
+        assert score < 0.95
+        assert similarity("Wild Hunt The Witcher 3", "The Witcher 3 Wild Hunt") == 1.0
+
+    @pytest.mark.parametrize("query,name", [
+        ("Cyberpunk", "Cyberpunk 2077: Phantom Liberty"),
+        ("Portal", "Portal 2 - The Final Hours"),
+        ("Half-Life", "Half-Life 2: Episode Two"),
+    ])
+    def test_short_query_against_long_dlc(self, query, name):
+        """A short query contained in a long DLC or sequel name stays a weak match."""
+        assert similarity(query, name) < 0.6
+
+    def test_long_names_difflib_fallback(self, monkeypatch):
+        """The difflib token set score agrees with rapidfuzz on simple names."""
+        pairs = [
+            ("Baldur's Gate 3 Deluxe", "Baldur's Gate 3 Digital Deluxe Edition"),
+            ("Red Dead Redemption 2", "Red Dead Redemption: Undead Nightmare"),
+            ("Factorio Space Age DLC", "Counter-Strike 2 Soundtrack"),
+        ]
+        monkeypatch.setattr(app_id_finder, "fuzz", None)
+        similarity.cache_clear()
+
+        scores = [similarity(a, b) for a, b in pairs]
+        similarity.cache_clear()
+
+        assert scores[0] == app_id_finder.TOKEN_SET_SUBSET_SCORE
+        assert scores[1] == pytest.approx(20 / 29)
+        assert scores[2] < 0.3
+
+    def test_find_app_id_rejects_containing_name(self, monkeypatch):
+        """find_steam_app_id() doesn't accept a DLC whose name contains the query."""
+        monkeypatch.setattr(
+            app_id_finder, "_store_get",
+            lambda url, params: {"items": [{"id": 2138330, "name": "Cyberpunk 2077: Phantom Liberty"}]},
+        )
+
+        assert app_id_finder.find_steam_app_id("Cyberpunk 2077") is None
+
+    def test_scores_are_memoized(self):
+        """Repeated pairs are served from the cache."""
+        similarity.cache_clear()
+        similarity("Factorio", "Factorio: Space Age")
+        similarity("Factorio", "Factorio: Space Age")
+
+        assert similarity.cache_info().hits == 1
+
+
+class TestStoreCache:
+    """Tests for the Steam Store response cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path, monkeypatch):
+        """Store cache in a temporary directory."""
+        path = tmp_path / "steam_store.json"
+        monkeypatch.setattr(app_id_finder, "STORE_CACHE_FILE", path)
+        monkeypatch.setattr(app_id_finder, "_store_cache", None)
+        # No local app catalog, so searches go to the Store
+        monkeypatch.setattr(app_catalog, "CATALOG_FILE", tmp_path / "steam_applist.json")
+        monkeypatch.setattr(app_catalog, "_catalog", None)
+        return path
+
+    @staticmethod
+    def _fake_get(calls: list, status_code: int = 200):
+        """Session.get replacement returning one search result."""
+        from unittest.mock import Mock
+
+        def fake_get(url, params=None, timeout=None):
+            calls.append(params["term"])
+            response = Mock(status_code=status_code)
+            response.json.return_value = {"items": [{"id": 1091500, "name": "Cyberpunk 2077"}]}
+            return response
+        return fake_get
+
+    def test_repeated_search_uses_cache(self, monkeypatch):
+        """The same search term is fetched once and then served from the cache."""
+        calls = []
+        monkeypatch.setattr(app_id_finder._session, "get", self._fake_get(calls))
+
+        assert app_id_finder.find_steam_app_id("Cyberpunk 2077") == 1091500
+        matches = app_id_finder.get_multiple_matches("Cyberpunk 2077")
+
+        assert matches[0]["appid"] == 1091500
+        assert calls == ["Cyberpunk 2077"]
+
+    def test_expired_entry_is_refetched(self, monkeypatch):
+        """Entries older than the TTL trigger a new request."""
+        calls = []
+        monkeypatch.setattr(app_id_finder._session, "get", self._fake_get(calls))
+        app_id_finder.find_steam_app_id("Cyberpunk 2077")
+
+        later = app_id_finder.time.time() + app_id_finder.STORE_CACHE_TTL_SECONDS + 1
+        monkeypatch.setattr(app_id_finder.time, "time", lambda: later)
+        app_id_finder.find_steam_app_id("Cyberpunk 2077")
+
+        assert len(calls) == 2
+
+    def test_errors_are_not_cached(self, monkeypatch, cache_file):
+        """Failed responses are neither returned from nor written to the cache."""
+        calls = []
+        monkeypatch.setattr(app_id_finder._session, "get", self._fake_get(calls, status_code=503))
+
+        assert app_id_finder.find_steam_app_id("Cyberpunk 2077") is None
+        assert app_id_finder.find_steam_app_id("Cyberpunk 2077") is None
+        assert len(calls) == 2
+        assert not cache_file.exists()
+
+    def test_hits_are_served_from_memory(self, monkeypatch, cache_file):
+        """After the first load, cache hits don't read the file again."""
+        calls = []
+        monkeypatch.setattr(app_id_finder._session, "get", self._fake_get(calls))
+        app_id_finder.find_steam_app_id("Cyberpunk 2077")
+        monkeypatch.setattr(app_id_finder, "_read_store_cache", lambda: pytest.fail("re-read"))
+
+        assert app_id_finder.find_steam_app_id("Cyberpunk 2077") == 1091500
+        assert calls == ["Cyberpunk 2077"]
+
+    def test_cache_survives_restart(self, monkeypatch, cache_file):
+        """Responses written atomically to disk are loaded by a fresh process."""
+        calls = []
+        monkeypatch.setattr(app_id_finder._session, "get", self._fake_get(calls))
+        app_id_finder.find_steam_app_id("Cyberpunk 2077")
+        monkeypatch.setattr(app_id_finder, "_store_cache", None)
+
+        assert app_id_finder.find_steam_app_id("Cyberpunk 2077") == 1091500
+        assert calls == ["Cyberpunk 2077"]
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+
+class TestAppDetailsMany:
+    """Tests for concurrent app details lookups."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_caches(self, tmp_path, monkeypatch):
+        """Start with empty in-memory and on-disk caches."""
+        monkeypatch.setattr(app_id_finder, "STORE_CACHE_FILE", tmp_path / "steam_store.json")
+        monkeypatch.setattr(app_id_finder, "_store_cache", None)
+        monkeypatch.setattr(app_id_finder, "_app_details_cache", {})
+
+    def test_details_for_each_id(self, monkeypatch):
+        """Every id is fetched once; unknown apps map to None."""
+        from unittest.mock import Mock
+
+        calls = []
+
+        def fake_get(url, params=None, timeout=None):
+            app_id = params["appids"]
+            calls.append(app_id)
+            response = Mock(status_code=200)
+            response.json.return_value = {
+                str(app_id): {"success": app_id != 1, "data": {"name": f"App {app_id}"}}
+            }
+            return response
+
+        monkeypatch.setattr(app_id_finder._session, "get", fake_get)
+
+        details = app_id_finder.get_steam_app_details_many([570, 1, 427520, 570])
+
+        assert details == {570: {"name": "App 570"}, 1: None, 427520: {"name": "App 427520"}}
+        assert sorted(calls) == [1, 570, 427520]
+        # All responses ended up in the shared disk cache
+        cache = app_id_finder._read_store_cache()
+        assert len(cache) == 3
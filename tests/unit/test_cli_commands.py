@@ -0,0 +1,150 @@
+"""
+Unit tests for CLI commands.
+
+Invokes commands through the Typer test runner; network calls are mocked.
+"""
+
+import pytest
+import typer
+from unittest.mock import Mock
+
+from linux_game_benchmark.cli import app
+
+
+@pytest.mark.slow
+class TestCLIHelp:
+    """Tests for CLI help output."""
+
+    @pytest.mark.parametrize("cmd,needles", [
+        ((), ("linux game benchmark", "lgb")),
+        (("login",), ("email", "login")),
+    ])
+    def test_subcommand_help(self, help_outputs, cmd, needles):
+        """Help should render and mention at least one of its needles."""
+        result = help_outputs[cmd]
+        assert result.exit_code == 0
+        output = result.output.lower()
+        assert any(needle in output for needle in needles)
+
+    def test_expected_commands_registered(self):
+        """Core commands should be registered without rendering their help."""
+        commands = typer.main.get_command(app).commands
+        for name in ("login", "logout", "status", "check", "benchmark"):
+            assert name in commands
+
+
+# get_status() results shared by the status command tests
+STATUS_LOGGED_OUT = {
+    "logged_in": False,
+    "api_url": "https://linuxgamebench.com/api/v1",
+    "stage": "prod",
+}
+STATUS_LOGGED_IN = {
+    **STATUS_LOGGED_OUT,
+    "logged_in": True,
+    "username": "testuser",
+    "email": "test@example.com",
+}
+
+
+class TestStatusCommand:
+    """Tests for status command."""
+
+    @pytest.fixture(autouse=True)
+    def auth_mocks(self, monkeypatch):
+        """Replace get_status and verify_auth for every test in the class."""
+        self.get_status = Mock()
+        self.verify_auth = Mock(return_value=(True, "testuser"))
+        monkeypatch.setattr("linux_game_benchmark.api.auth.get_status", self.get_status)
+        monkeypatch.setattr("linux_game_benchmark.api.client.verify_auth", self.verify_auth)
+
+    def test_status_not_logged_in(self, cli_runner):
+        """Status should show not logged in state."""
+        self.get_status.return_value = dict(STATUS_LOGGED_OUT)
+
+        result = cli_runner.invoke(app, ["status"])
+        assert result.exit_code == 0
+        # Output should contain status info
+        assert "stage" in result.output.lower() or "server" in result.output.lower() or "status" in result.output.lower()
+
+    def test_status_logged_in_valid(self, cli_runner):
+        """Status should show logged in state with valid token."""
+        self.get_status.return_value = dict(STATUS_LOGGED_IN)
+
+        result = cli_runner.invoke(app, ["status"])
+        assert result.exit_code == 0
+        self.verify_auth.assert_called_once()
+
+
+class TestLogoutCommand:
+    """Tests for logout command."""
+
+    def test_logout_success(self, monkeypatch, cli_runner):
+        """Logout should succeed when logged in."""
+        monkeypatch.setattr(
+            "linux_game_benchmark.api.auth.logout",
+            Mock(return_value=(True, "Logged out successfully")),
+        )
+
+        result = cli_runner.invoke(app, ["logout"])
+        assert result.exit_code == 0
+
+    def test_logout_not_logged_in(self, monkeypatch, cli_runner):
+        """Logout should handle not logged in state."""
+        monkeypatch.setattr(
+            "linux_game_benchmark.api.auth.logout",
+            Mock(return_value=(False, "Not logged in")),
+        )
+
+        result = cli_runner.invoke(app, ["logout"])
+        # Should not crash
+        assert result.exit_code == 0
+
+
+class TestLoginCommand:
+    """Tests for login command."""
+
+    @pytest.mark.slow
+    def test_login_success(self, monkeypatch, cli_runner):
+        """Login should succeed with valid credentials."""
+        mock_login = Mock(return_value=(True, "Logged in as testuser"))
+        monkeypatch.setattr("linux_game_benchmark.api.auth.login", mock_login)
+        monkeypatch.setattr(
+            "linux_game_benchmark.api.auth.get_status",
+            Mock(return_value={"user": {"email_verified": True}}),
+        )
+        monkeypatch.setattr(
+            "linux_game_benchmark.cli.typer.prompt",
+            Mock(side_effect=["test@example.com", "password123"]),
+        )
+
+        result = cli_runner.invoke(app, ["login"])
+        assert result.exit_code == 0
+        mock_login.assert_called_once_with("test@example.com", "password123")
+
+    @pytest.mark.slow
+    def test_login_failure(self, monkeypatch, cli_runner):
+        """Login should handle invalid credentials."""
+        monkeypatch.setattr(
+            "linux_game_benchmark.api.auth.login",
+            Mock(return_value=(False, "Invalid credentials")),
+        )
+        monkeypatch.setattr(
+            "linux_game_benchmark.cli.typer.prompt",
+            Mock(side_effect=["test@example.com", "wrongpass"]),
+        )
+
+        result = cli_runner.invoke(app, ["login"])
+        # Should exit with error code
+        assert result.exit_code == 1
+
+
+class TestVersionFlag:
+    """Tests for version flag."""
+
+    def test_version_flag(self, cli_runner):
+        """--version should show version."""
+        result = cli_runner.invoke(app, ["--version"])
+        # May show version or be handled by main callback
+        # Just ensure it doesn't crash
+        assert result.exit_code == 0
@@ -0,0 +1,138 @@
+"""
+Unit tests for the Steam game finder.
+
+Searches a fixed list of local games; no Steam installation or
+network access required.
+"""
+
+import threading
+
+import pytest
+
+from linux_game_benchmark.games import game_finder
+from linux_game_benchmark.games.game_finder import GameFinder
+from linux_game_benchmark.steam.app_id_finder import similarity
+
+
+LOCAL_GAMES = [
+    {"app_id": 2694490, "name": "Path of Exile 2"},
+    {"app_id": 238960, "name": "Path of Exile"},
+    {"app_id": 1091500, "name": "Cyberpunk 2077"},
+    {"app_id": 1245620, "name": "ELDEN RING"},
+]
+
+
+@pytest.fixture
+def finder() -> GameFinder:
+    """Finder with a preloaded local library."""
+    finder = GameFinder(prefetch=False)
+    finder._local_games_cache = list(LOCAL_GAMES)
+    return finder
+
+
+class TestSearchLocal:
+    """Tests for local library search."""
+
+    def test_exact_match_ignores_case(self, finder: GameFinder):
+        """An exact name wins regardless of case."""
+        result = finder._search_local("elden ring")
+
+        assert result.steam_app_id == 1245620
+
+    def test_partial_match_prefers_closest_name(self, finder: GameFinder):
+        """Among names containing the query, the shortest scores best."""
+        result = finder._search_local("Path of")
+
+        assert result.steam_app_id == 238960
+        assert result.similarity_score == pytest.approx(similarity("Path of", "Path of Exile"))
+
+    def test_too_short_query_does_not_match(self, finder: GameFinder):
+        """Queries far shorter than every containing name are rejected."""
+        assert finder._search_local("Path") is None
+        assert finder._search_local("Half-Life") is None
+
+    def test_names_lowered_once(self, finder: GameFinder):
+        """Lower-cased names are built once and reused across searches."""
+        names = finder.local_names_lower
+        finder._search_local("cyberpunk")
+        finder._search_local("elden")
+
+        assert finder.local_names_lower is names
+        assert names == [g["name"].lower() for g in LOCAL_GAMES]
+
+
+class TestPrefetch:
+    """Tests for the background library scan."""
+
+    def test_prefetch_fills_local_games(self, monkeypatch):
+        """The library is scanned in the background and picked up on first use."""
+        class FakeScanner:
+            def scan(self):
+                return list(LOCAL_GAMES)
+
+        monkeypatch.setattr(game_finder, "SteamLibraryScanner", FakeScanner)
+        finder = GameFinder()
+
+        assert finder._search_local("ELDEN RING").steam_app_id == 1245620
+        assert isinstance(finder.steam_scanner, FakeScanner)
+        assert finder.local_names_lower[0] == "path of exile 2"
+
+    def test_missing_steam(self, monkeypatch):
+        """Without a Steam installation the finder has no local games."""
+        def no_steam():
+            raise FileNotFoundError("Steam installation not found")
+
+        monkeypatch.setattr(game_finder, "SteamLibraryScanner", no_steam)
+        finder = GameFinder()
+
+        assert finder.local_games == []
+        assert finder.steam_scanner is None
+
+    def test_app_id_lookup_does_not_wait_for_scan(self, monkeypatch):
+        """An App ID query reads the manifest while the library scan is still running."""
+        scan_started = threading.Event()
+        release_scan = threading.Event()
+
+        class FakeScanner:
+            def scan(self):
+                scan_started.set()
+                release_scan.wait(timeout=5)
+                return list(LOCAL_GAMES)
+
+            def get_game_by_id_fast(self, app_id):
+                return next((g for g in LOCAL_GAMES if g["app_id"] == app_id), None)
+
+        monkeypatch.setattr(game_finder, "SteamLibraryScanner", FakeScanner)
+        finder = GameFinder()
+        scan_started.wait(timeout=5)
+        try:
+            result = finder._find_by_app_id(1245620)
+            assert not finder._scan_future.done()
+        finally:
+            release_scan.set()
+
+        assert result.name == "ELDEN RING"
+
+
+class TestAutoSelect:
+    """Tests for auto-selecting Steam Store results."""
+
+    def test_superset_dlc_is_not_auto_selected(self, monkeypatch):
+        """A DLC whose name only adds words to the query goes to the selection menu."""
+        query = "Cyberpunk 2077 Phantom"
+        names = ["Cyberpunk 2077 Phantom Liberty Soundtrack", "Cyberpunk 2077: Phantom Liberty"]
+        monkeypatch.setattr(game_finder, "get_multiple_matches", lambda q, limit: [
+            {"appid": i, "name": name, "similarity": similarity(q, name)}
+            for i, name in enumerate(names)
+        ])
+        finder = GameFinder(prefetch=False)
+        finder._local_games_cache = []
+        selected = []
+        monkeypatch.setattr(
+            finder, "_interactive_select", lambda games, q: selected.append(games) or games[1]
+        )
+
+        result = finder.find(query)
+
+        assert result.name == "Cyberpunk 2077: Phantom Liberty"
+        assert len(selected) == 1
@@ -0,0 +1,43 @@
+"""
+Unit tests for the benchmark import script.
+
+Only covers file loading and row building; no database or result
+directory is touched.
+"""
+
+import base64
+import gzip
+import json
+import math
+
+from import_benchmarks import build_run_row, compress_frametimes, load_json
+
+
+class TestLoadJson:
+    """Tests for reading run files."""
+
+    def test_nan_run_file(self, tmp_path):
+        """Run files written by json.dumps() with NaN/Infinity still load."""
+        path = tmp_path / "run_001.json"
+        path.write_text(json.dumps({"frametimes": [16.6, float("nan"), float("inf")]}))
+
+        frametimes = load_json(path)["frametimes"]
+
+        assert frametimes[0] == 16.6
+        assert math.isnan(frametimes[1]) and math.isinf(frametimes[2])
+
+
+class TestCompressFrametimes:
+    """Tests for frametime compression."""
+
+    def test_missing_frametimes(self):
+        """Runs saved without frametimes store null and compress to an empty string."""
+        assert compress_frametimes(None) == ""
+        # The compressed frametimes are the last column of a run row
+        assert build_run_row(1, {"frametimes": None, "metrics": {}})[-1] == ""
+
+    def test_round_trip_drops_invalid_values(self):
+        """Non-finite, non-numeric and boolean entries are dropped."""
+        encoded = compress_frametimes([16.7, float("nan"), "x", True, 17, float("inf")])
+
+        assert json.loads(gzip.decompress(base64.b64decode(encoded))) == [16.7, 17]
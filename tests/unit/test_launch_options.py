@@ -0,0 +1,114 @@
+"""
+Unit tests for the Steam launch options manager.
+
+Edits a minimal fake localconfig.vdf; no Steam installation required.
+"""
+
+import pytest
+from pathlib import Path
+
+from linux_game_benchmark.steam import launch_options
+from linux_game_benchmark.steam.launch_options import (
+    get_launch_options,
+    get_original_launch_options,
+    set_launch_options,
+)
+from linux_game_benchmark.utils import files
+
+
+LOCALCONFIG = """\
+"UserLocalConfigStore"
+{
+\t"Software"
+\t{
+\t\t"Valve"
+\t\t{
+\t\t\t"Steam"
+\t\t\t{
+\t\t\t\t"apps"
+\t\t\t\t{
+\t\t\t\t\t"1091500"
+\t\t\t\t\t{
+\t\t\t\t\t\t"LastPlayed"\t\t"1700000000"
+\t\t\t\t\t\t"LaunchOptions"\t\t"gamemoderun %command%"
+\t\t\t\t\t}
+\t\t\t\t\t"238960"
+\t\t\t\t\t{
+\t\t\t\t\t\t"LastPlayed"\t\t"1700000001"
+\t\t\t\t\t}
+\t\t\t\t}
+\t\t\t}
+\t\t}
+\t}
+}
+"""
+
+
+@pytest.fixture
+def localconfig(tmp_path: Path, monkeypatch) -> Path:
+    """Fake localconfig.vdf returned by find_localconfig()."""
+    path = tmp_path / "localconfig.vdf"
+    path.write_text(LOCALCONFIG)
+    monkeypatch.setattr(launch_options, "find_localconfig", lambda: path)
+    return path
+
+
+class TestLaunchOptions:
+    """Tests for reading and writing launch options."""
+
+    def test_get_existing_options(self, localconfig: Path):
+        """Existing launch options are read from the apps section."""
+        assert get_launch_options(1091500) == "gamemoderun %command%"
+
+    def test_replace_existing_options(self, localconfig: Path):
+        """Setting options replaces the current value and keeps a backup."""
+        set_launch_options(1091500, "MANGOHUD=1 %command%")
+
+        assert get_launch_options(1091500) == "MANGOHUD=1 %command%"
+        assert get_original_launch_options(1091500) == "gamemoderun %command%"
+        assert '"LastPlayed"\t\t"1700000001"' in localconfig.read_text()
+
+    def test_read_later_app(self, localconfig: Path):
+        """Apps after the first one in the apps section are found too."""
+        set_launch_options(238960, "MANGOHUD=1 %command%", backup=False)
+
+        assert get_launch_options(238960) == "MANGOHUD=1 %command%"
+        assert get_launch_options(1091500) == "gamemoderun %command%"
+
+    def test_add_app_entry(self, localconfig: Path):
+        """An app missing from the apps section gets its own block."""
+        set_launch_options(427520, "MANGOHUD=1 %command%", backup=False)
+
+        assert get_launch_options(427520) == "MANGOHUD=1 %command%"
+        assert get_launch_options(238960) is None
+        assert localconfig.read_text().count("{") == localconfig.read_text().count("}")
+
+    def test_quotes_are_escaped(self, localconfig: Path):
+        """Options containing quotes round-trip through the VDF escaping."""
+        options = 'PROTON_LOG=1 "%command%" -path C:\\Games'
+        set_launch_options(1091500, options, backup=False)
+
+        assert '\\"%command%\\"' in localconfig.read_text()
+        assert get_launch_options(1091500) == options
+
+    def test_no_apps_section(self, localconfig: Path):
+        """Without an apps section nothing is written."""
+        localconfig.write_text('"UserLocalConfigStore"\n{\n}\n')
+
+        assert set_launch_options(1091500, "MANGOHUD=1 %command%", backup=False) is False
+        assert get_launch_options(1091500) is None
+
+    def test_write_is_atomic(self, localconfig: Path, monkeypatch):
+        """A failed write leaves the original config and no temp file behind."""
+        original = localconfig.read_text()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files.os, "replace", fail_replace)
+
+        with pytest.raises(OSError):
+            set_launch_options(1091500, "MANGOHUD=1 %command%", backup=False)
+
+        assert localconfig.read_text() == original
+        assert sorted(p.name for p in localconfig.parent.iterdir()) == ["localconfig.vdf"]
@@ -0,0 +1,164 @@
+"""
+Unit tests for the Steam library scanner.
+
+Tests manifest scanning and the persistent scan cache against a fake
+Steam directory (no real Steam installation required).
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from linux_game_benchmark.steam.library_scanner import SteamLibraryScanner
+
+
+def _write_manifest(steamapps: Path, app_id: int, name: str) -> Path:
+    """Write a minimal appmanifest file."""
+    manifest = steamapps / f"appmanifest_{app_id}.acf"
+    manifest.write_text(
+        f'"AppState"\n{{\n\t"appid"\t\t"{app_id}"\n\t"name"\t\t"{name}"\n'
+        f'\t"installdir"\t\t"{name}"\n}}\n'
+    )
+    return manifest
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a path's mtime forward so cache invalidation is deterministic."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def steam_dir(tmp_path: Path) -> Path:
+    """Fake Steam installation with one installed game."""
+    steam = tmp_path / "Steam"
+    steamapps = steam / "steamapps"
+    steamapps.mkdir(parents=True)
+    _write_manifest(steamapps, 1091500, "Cyberpunk 2077")
+    return steam
+
+
+class TestScanCache:
+    """Tests for the persistent scan cache."""
+
+    def test_scan_writes_cache(self, steam_dir: Path, tmp_path: Path):
+        """A full scan should store its result in the cache file."""
+        cache_file = tmp_path / "cache" / "library.json"
+        scanner = SteamLibraryScanner(steam_dir, cache_file=cache_file)
+
+        games = scanner.scan()
+
+        assert [g["app_id"] for g in games] == [1091500]
+        assert cache_file.exists()
+
+    def test_unchanged_library_uses_cache(self, steam_dir: Path, tmp_path: Path, monkeypatch):
+        """A second scan should not parse manifests when nothing changed."""
+        cache_file = tmp_path / "library.json"
+        SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        def fail_parse(self, manifest_path):
+            raise AssertionError("manifest parsed despite valid cache")
+
+        monkeypatch.setattr(SteamLibraryScanner, "_parse_manifest", fail_parse)
+        games = SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        assert [g["name"] for g in games] == ["Cyberpunk 2077"]
+
+    def test_new_manifest_invalidates_cache(self, steam_dir: Path, tmp_path: Path):
+        """Installing a game should trigger a rescan."""
+        cache_file = tmp_path / "library.json"
+        SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        steamapps = steam_dir / "steamapps"
+        _write_manifest(steamapps, 427520, "Factorio")
+        _bump_mtime(steamapps)
+
+        games = SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        assert sorted(g["app_id"] for g in games) == [427520, 1091500]
+
+    def test_only_changed_library_is_rescanned(self, steam_dir: Path, tmp_path: Path, monkeypatch):
+        """Manifests of unchanged library folders are taken from the cache."""
+        library = tmp_path / "Games" / "steamapps"
+        library.mkdir(parents=True)
+        _write_manifest(library, 427520, "Factorio")
+        (steam_dir / "steamapps" / "libraryfolders.vdf").write_text(
+            f'"libraryfolders"\n{{\n\t"1"\n\t{{\n\t\t"path"\t\t"{library.parent}"\n\t}}\n}}\n'
+        )
+        cache_file = tmp_path / "library.json"
+        SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        _write_manifest(library, 570, "Dota 2")
+        _bump_mtime(library)
+        parsed = []
+        real_parse = SteamLibraryScanner._parse_manifest
+        monkeypatch.setattr(
+            SteamLibraryScanner, "_parse_manifest",
+            lambda self, path: parsed.append(path.parent) or real_parse(self, path),
+        )
+
+        games = SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        assert sorted(g["app_id"] for g in games) == [570, 427520, 1091500]
+        assert set(parsed) == {library}
+
+    def test_refresh_ignores_cache(self, steam_dir: Path, tmp_path: Path):
+        """refresh=True should rescan even when the cache is valid."""
+        cache_file = tmp_path / "library.json"
+        scanner = SteamLibraryScanner(steam_dir, cache_file=cache_file)
+        scanner.scan()
+
+        # Change a manifest in place (directory mtime stays the same)
+        _write_manifest(steam_dir / "steamapps", 1091500, "Cyberpunk 2077 Ultimate")
+
+        assert scanner.scan()[0]["name"] == "Cyberpunk 2077"
+        assert scanner.scan(refresh=True)[0]["name"] == "Cyberpunk 2077 Ultimate"
+
+    def test_corrupt_cache_is_ignored(self, steam_dir: Path, tmp_path: Path):
+        """An unreadable cache file should fall back to a full scan."""
+        cache_file = tmp_path / "library.json"
+        cache_file.write_text("{not json")
+
+        games = SteamLibraryScanner(steam_dir, cache_file=cache_file).scan()
+
+        assert [g["app_id"] for g in games] == [1091500]
+
+
+class TestGameLookup:
+    """Tests for game lookup by id and name."""
+
+    def test_lookup_by_id(self, steam_dir: Path, tmp_path: Path):
+        """get_game_by_id() should find scanned games and miss unknown ids."""
+        scanner = SteamLibraryScanner(steam_dir, cache_file=tmp_path / "library.json")
+        scanner.scan()
+
+        assert scanner.get_game_by_id(1091500)["name"] == "Cyberpunk 2077"
+        assert scanner.get_game_by_id(1) is None
+
+    def test_lookup_by_name_prefers_exact_match(self, steam_dir: Path, tmp_path: Path):
+        """Exact names win over partial matches; partial matches prefer shorter names."""
+        steamapps = steam_dir / "steamapps"
+        _write_manifest(steamapps, 238960, "Path of Exile")
+        _write_manifest(steamapps, 2694490, "Path of Exile 2")
+        scanner = SteamLibraryScanner(steam_dir, cache_file=tmp_path / "library.json")
+        scanner.scan()
+
+        assert scanner.get_game_by_name("path of exile 2")["app_id"] == 2694490
+        assert scanner.get_game_by_name("  Path of Exile ")["app_id"] == 238960
+        assert scanner.get_game_by_name("path of")["app_id"] == 238960
+        assert scanner.get_game_by_name("Factorio") is None
+
+    def test_fast_lookup_reads_one_manifest(self, steam_dir: Path, tmp_path: Path, monkeypatch):
+        """get_game_by_id_fast() parses only the requested app's manifest."""
+        _write_manifest(steam_dir / "steamapps", 427520, "Factorio")
+        scanner = SteamLibraryScanner(steam_dir, cache_file=tmp_path / "library.json")
+        parsed = []
+        real_parse = SteamLibraryScanner._parse_manifest
+        monkeypatch.setattr(
+            SteamLibraryScanner, "_parse_manifest",
+            lambda self, path: parsed.append(path.name) or real_parse(self, path),
+        )
+
+        assert scanner.get_game_by_id_fast(427520)["name"] == "Factorio"
+        assert scanner.get_game_by_id_fast(1) is None
+        assert parsed == ["appmanifest_427520.acf"]
@@ -0,0 +1,203 @@
+"""
+Unit tests for the MangoHud log watcher.
+
+Uses a temporary log directory; no MangoHud or game required.
+"""
+
+import os
+from pathlib import Path
+
+from linux_game_benchmark.mangohud import log_watcher
+from linux_game_benchmark.mangohud.log_watcher import LogWatcher
+
+
+def _write_log(path: Path, size: int) -> None:
+    """Write a fake log of the given size."""
+    path.write_bytes(b"x" * size)
+
+
+class TestLogWatcher:
+    """Tests for growing/completed log detection."""
+
+    def test_existing_logs_are_ignored(self, tmp_path: Path):
+        """Logs passed as ignore should never be reported."""
+        _write_log(tmp_path / "old.csv", 5000)
+        watcher = LogWatcher(tmp_path, ignore=["old.csv"], stable_seconds=0)
+
+        assert watcher.poll() == (None, [])
+        assert watcher.poll() == (None, [])
+
+    def test_skip_existing(self, tmp_path: Path):
+        """skip_existing ignores logs present at start but reports new ones."""
+        _write_log(tmp_path / "old.csv", 5000)
+        watcher = LogWatcher(tmp_path, stable_seconds=0, skip_existing=True)
+        new = tmp_path / "new.csv"
+        _write_log(new, 5000)
+
+        watcher.poll()
+        assert watcher.poll() == (None, [new])
+
+    def test_recreated_log_is_reported(self, tmp_path: Path):
+        """A processed log that was deleted and written again counts as new."""
+        log = tmp_path / "game.csv"
+        _write_log(log, 5000)
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+        watcher.poll()
+        assert watcher.poll() == (None, [log])
+        watcher.mark_processed(log)
+
+        log.unlink()
+        watcher.poll()
+        _write_log(log, 6000)
+
+        watcher.poll()
+        assert watcher.poll() == (None, [log])
+
+    def test_growing_then_completed(self, tmp_path: Path):
+        """A log is growing while its size changes and completed once stable."""
+        log = tmp_path / "game_2024-01-01_12-00-00.csv"
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+
+        _write_log(log, 2000)
+        assert watcher.poll() == (None, [])  # First sighting
+        _write_log(log, 4000)
+        assert watcher.poll() == (log, [])
+        assert watcher.poll() == (None, [log])
+
+        watcher.mark_processed(log)
+        assert watcher.poll() == (None, [])
+
+    def test_small_and_summary_logs_not_completed(self, tmp_path: Path):
+        """Tiny logs and MangoHud summary files are not reported as completed."""
+        _write_log(tmp_path / "tiny.csv", 10)
+        _write_log(tmp_path / "game_summary.csv", 5000)
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+
+        watcher.poll()
+        assert watcher.poll() == (None, [])
+
+    def test_small_log_reported_after_growing(self, tmp_path: Path):
+        """A log that sits at header size for a while is still reported once it grows."""
+        log = tmp_path / "game_2024-01-01_12-00-00.csv"
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+
+        _write_log(log, 330)
+        watcher.poll()
+        assert watcher.poll() == (None, [])  # Stable, but too small
+        _write_log(log, 8000)
+
+        assert watcher.poll() == (log, [])
+        assert watcher.poll() == (None, [log])
+
+    def test_stable_small_log_lets_wait_idle(self, tmp_path: Path, monkeypatch):
+        """A stable tiny log doesn't end wait() on every timeout."""
+        ticks = []
+
+        def fake_watch(*args, **kwargs):
+            while True:
+                ticks.append(1)
+                yield set() if len(ticks) < 3 else {("modified", "x.csv")}
+
+        monkeypatch.setattr(log_watcher, "watch", fake_watch)
+        _write_log(tmp_path / "tiny.csv", 10)
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+        watcher.poll()
+        watcher.poll()
+
+        watcher.wait()
+
+        assert len(ticks) == 3
+
+    def test_completed_in_write_order(self, tmp_path: Path):
+        """Completed logs are reported oldest write first, not by name."""
+        older = tmp_path / "zgame_2024-01-01_12-00-00.csv"
+        newer = tmp_path / "agame_2024-01-01_13-00-00.csv"
+        _write_log(older, 2000)
+        _write_log(newer, 2000)
+        os.utime(older, ns=(1_000_000_000, 1_000_000_000))
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+
+        watcher.poll()
+
+        assert watcher.poll() == (None, [older, newer])
+
+    def test_refresh_resets_growth(self, tmp_path: Path):
+        """After refresh() a log already seen growing is not reported again."""
+        log = tmp_path / "game.csv"
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+        _write_log(log, 2000)
+        watcher.poll()
+        _write_log(log, 4000)
+
+        watcher.refresh(log)
+
+        assert watcher.poll() == (None, [log])
+
+    def test_wait_without_watchfiles(self, tmp_path: Path, monkeypatch):
+        """Without watchfiles, wait() falls back to sleeping."""
+        monkeypatch.setattr(log_watcher, "watch", None)
+        slept = []
+        monkeypatch.setattr(log_watcher.time, "sleep", slept.append)
+
+        LogWatcher(tmp_path).wait(timeout=0.5)
+
+        assert slept == [0.5]
+
+    def test_directory_listed_only_when_changed(self, tmp_path: Path, monkeypatch):
+        """The log directory is re-read only after its mtime changes."""
+        import os
+
+        log = tmp_path / "game.csv"
+        _write_log(log, 2000)
+        # Pretend the directory was last modified long ago
+        now_ns = os.stat(tmp_path).st_mtime_ns + 10_000_000_000
+        monkeypatch.setattr(log_watcher.time, "time_ns", lambda: now_ns)
+        watcher = LogWatcher(tmp_path, stable_seconds=0)
+
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(log_watcher.os, "scandir", lambda p: scans.append(p) or real_scandir(p))
+
+        watcher.poll()
+        watcher.poll()
+        assert len(scans) == 1
+
+        _write_log(tmp_path / "game2.csv", 2000)
+        changed_ns = now_ns - 5_000_000_000
+        os.utime(tmp_path, ns=(changed_ns, changed_ns))
+        watcher.poll()
+        assert len(scans) == 2
+
+    def test_idle_wait_ignores_timeouts(self, tmp_path: Path, monkeypatch):
+        """With nothing pending, watcher timeouts don't end wait() early."""
+        ticks = []
+
+        def fake_watch(*args, **kwargs):
+            while True:
+                ticks.append(1)
+                yield set() if len(ticks) < 3 else {("added", "x.csv")}
+
+        monkeypatch.setattr(log_watcher, "watch", fake_watch)
+        watcher = LogWatcher(tmp_path)
+
+        watcher.wait()
+
+        assert len(ticks) == 3
+
+    def test_pending_log_ends_wait_on_timeout(self, tmp_path: Path, monkeypatch):
+        """A log waiting to become stable is re-checked after one timeout."""
+        ticks = []
+
+        def fake_watch(*args, **kwargs):
+            while True:
+                ticks.append(1)
+                yield set()
+
+        monkeypatch.setattr(log_watcher, "watch", fake_watch)
+        _write_log(tmp_path / "game.csv", 2000)
+        watcher = LogWatcher(tmp_path)
+        watcher.poll()
+
+        watcher.wait()
+
+        assert len(ticks) == 1
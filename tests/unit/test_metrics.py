@@ -0,0 +1,113 @@
+"""
+Unit tests for the frametime analyzer.
+
+Tests MangoHud CSV parsing against small handwritten logs.
+"""
+
+import pytest
+from pathlib import Path
+
+from linux_game_benchmark.analysis.metrics import FrametimeAnalyzer
+
+
+MANGOHUD_LOG = """\
+--------------------SYSTEM INFO--------------------
+os,cpu,gpu,ram,kernel,driver,cpuscheduler
+Arch Linux,AMD Ryzen 7 7800X3D,AMD Radeon RX 7900 XTX,32GB,6.9.1,Mesa 24.1.0,
+--------------------FRAME METRICS--------------------
+fps,frametime,cpu_load,gpu_load,cpu_temp,gpu_temp,gpu_core_clock,gpu_vram_used,gpu_power
+125.0,8.0,30,95,60,70,2500,6.5,300
+100.0,10.0,0,96,61,71,2510,6.6,310
+60.0,not-a-number,31,97,62,72,2520,6.7,320
+111.1,9.0,32,98
+"""
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    """A MangoHud v0.8+ log with a bad row and a truncated last row."""
+    path = tmp_path / "game_2024-01-01_12-00-00.csv"
+    path.write_text(MANGOHUD_LOG)
+    return path
+
+
+class TestLoadData:
+    """Tests for MangoHud CSV parsing."""
+
+    def test_frame_metrics_section(self, log_file: Path):
+        """Frametimes come from the FRAME METRICS section; bad rows are skipped."""
+        analyzer = FrametimeAnalyzer(log_file)
+
+        assert analyzer.frametimes == [8.0, 10.0, 9.0]
+        assert analyzer.fps_values == [125.0, 100.0, 1000.0 / 9.0]
+
+    def test_optional_columns(self, log_file: Path):
+        """Hardware columns are read where present; zero loads are ignored."""
+        analyzer = FrametimeAnalyzer(log_file)
+
+        assert analyzer.cpu_loads == [30.0, 32.0]
+        assert analyzer.gpu_temps == [70.0, 71.0]
+        assert analyzer.vram_usage == [6.5, 6.6]
+        assert analyzer.gpu_power == [300.0, 310.0]
+
+    def test_fps_only_log(self, tmp_path: Path):
+        """Logs without a frametime column derive frametimes from FPS."""
+        path = tmp_path / "fps_only.csv"
+        path.write_text("fps,gpu_temp\n50,60\n5,60\n100,61\n")
+
+        analyzer = FrametimeAnalyzer(path)
+
+        assert analyzer.frametimes == [20.0, 10.0]
+        assert analyzer.gpu_temps == [60.0, 60.0, 61.0]
+
+    def test_streaming_matches_full_parse(self, tmp_path: Path):
+        """Parsing a log while it is written gives the same result as parsing it at once."""
+        path = tmp_path / "game.csv"
+        log = MANGOHUD_LOG.rstrip("\n")
+        analyzer = None
+        # Append in uneven chunks, splitting lines and the section header
+        for i in range(0, len(log), 37):
+            with open(path, "a") as f:
+                f.write(log[i:i + 37])
+            if analyzer is None:
+                analyzer = FrametimeAnalyzer(path, streaming=True)
+            else:
+                analyzer.update()
+        # The unterminated last row is only parsed once the log is final
+        assert analyzer.frametimes == [8.0, 10.0]
+
+        analyzer.update(final=True)
+        full = FrametimeAnalyzer(path)
+
+        assert analyzer.frametimes == full.frametimes
+        assert analyzer.cpu_loads == full.cpu_loads
+        assert analyzer.gpu_power == full.gpu_power
+
+    def test_log_system_info(self, log_file: Path):
+        """The SYSTEM INFO header identifies the GPU used."""
+        info = FrametimeAnalyzer(log_file).log_system_info
+
+        assert info["gpu"] == "AMD Radeon RX 7900 XTX"
+        assert info["kernel"] == "6.9.1"
+
+
+class TestFpsMetrics:
+    """Tests for FPS metric calculation."""
+
+    def test_matches_statistics_module(self, tmp_path: Path):
+        """Fast mean/stdev/order statistics agree with the statistics module."""
+        import statistics
+
+        path = tmp_path / "game.csv"
+        frametimes = [6.9, 7.3, 8.1, 16.7, 7.0, 9.4, 12.2, 7.7, 8.8, 40.5] * 50
+        path.write_text("frametime\n" + "".join(f"{ft}\n" for ft in frametimes))
+
+        fps = FrametimeAnalyzer(path).calculate_fps_metrics()
+        expected_fps = [1000.0 / ft for ft in frametimes]
+
+        assert fps["average"] == round(1000.0 / statistics.mean(frametimes), 2)
+        assert fps["std_dev"] == round(statistics.stdev(expected_fps), 2)
+        assert fps["median"] == round(statistics.median(expected_fps), 2)
+        assert fps["minimum"] == round(min(expected_fps), 2)
+        assert fps["maximum"] == round(max(expected_fps), 2)
+        assert fps["1_percent_low"] == round(1000.0 / 40.5, 2)
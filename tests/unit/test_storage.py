@@ -0,0 +1,155 @@
+"""
+Unit tests for benchmark storage.
+
+Tests fingerprint persistence and the resolution cache using a
+temporary results directory.
+"""
+
+import pytest
+from pathlib import Path
+
+from linux_game_benchmark.benchmark.storage import BenchmarkStorage, SystemFingerprint
+
+
+SYSTEM_INFO = {
+    "gpu": {"model": "AMD Radeon RX 7900 XTX", "driver_version": "Mesa 24.1.0"},
+    "cpu": {"model": "AMD Ryzen 7 7800X3D"},
+    "os": {"name": "CachyOS", "kernel": "6.9.1"},
+    "ram": {"total_gb": 32},
+}
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch) -> BenchmarkStorage:
+    """Storage rooted in a temp dir, without overview report generation."""
+    monkeypatch.setattr(BenchmarkStorage, "regenerate_overview_report", lambda self: None)
+    return BenchmarkStorage(base_dir=tmp_path)
+
+
+class TestSaveFingerprint:
+    """Tests for fingerprint persistence."""
+
+    def test_unchanged_fingerprint_not_rewritten(self, storage: BenchmarkStorage):
+        """Saving the same system twice should leave the files untouched."""
+        fp = SystemFingerprint.from_system_info(SYSTEM_INFO)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+        fp_file = storage.get_system_dir(1091500, fp.get_system_id()) / "fingerprint.json"
+        first = fp_file.read_text()
+
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+
+        assert fp_file.read_text() == first
+
+    def test_changed_system_info_is_written(self, storage: BenchmarkStorage):
+        """A changed system info should still be persisted."""
+        fp = SystemFingerprint.from_system_info(SYSTEM_INFO)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+
+        updated = {**SYSTEM_INFO, "steam": {"proton": "9.0"}}
+        storage.save_fingerprint(1091500, fp, updated)
+
+        info_file = storage.get_system_dir(1091500, fp.get_system_id()) / "system_info.json"
+        assert '"proton": "9.0"' in info_file.read_text()
+
+
+    def test_repeat_save_skips_disk(self, storage: BenchmarkStorage, monkeypatch):
+        """Saving the same fingerprint again on one instance should not touch the files."""
+        fp = SystemFingerprint.from_system_info(SYSTEM_INFO)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+
+        def fail_read(self, *args, **kwargs):
+            raise AssertionError("fingerprint re-read within the same session")
+
+        monkeypatch.setattr(Path, "read_text", fail_read)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+
+class TestResolutionCache:
+    """Tests for get_all_resolutions() memoization."""
+
+    def test_save_run_invalidates_cache(self, storage: BenchmarkStorage):
+        """A saved run should show up in the next get_all_resolutions() call."""
+        fp = SystemFingerprint.from_system_info(SYSTEM_INFO)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+        assert storage.get_all_resolutions(1091500) == {}
+
+        storage.save_run(1091500, "1920x1080", {"fps": {"average": 90.0}})
+        storage.save_run(1091500, "1920x1080", {"fps": {"average": 92.0}})
+
+        runs = storage.get_all_resolutions(1091500)["1920x1080"]
+        assert [r["run_number"] for r in runs] == [1, 2]
+
+    def test_load_all_returns_runs_and_aggregates(self, storage: BenchmarkStorage):
+        """load_all() should match get_all_resolutions() plus aggregate_runs()."""
+        fp = SystemFingerprint.from_system_info(SYSTEM_INFO)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+        storage.save_run(1091500, "1920x1080", {"fps": {"average": 90.0}})
+        storage.save_run(1091500, "1920x1080", {"fps": {"average": 92.0}})
+        storage.save_run(1091500, "3840x2160", {"fps": {"average": 45.0}})
+
+        runs_data, aggregated = storage.load_all(1091500)
+
+        assert sorted(runs_data) == ["1920x1080", "3840x2160"]
+        assert aggregated["1920x1080"]["fps"]["average"] == 91.0
+        assert aggregated["3840x2160"] == {"fps": {"average": 45.0}}
+        assert all(r["system_id"] == fp.get_system_id() for r in runs_data["1920x1080"])
+
+    def test_load_all_caches_aggregates_until_save(self, storage: BenchmarkStorage, monkeypatch):
+        """Aggregates are reused across load_all() calls and recomputed after save_run()."""
+        fp = SystemFingerprint.from_system_info(SYSTEM_INFO)
+        storage.save_fingerprint(1091500, fp, SYSTEM_INFO)
+        storage.save_run(1091500, "1920x1080", {"fps": {"average": 90.0}})
+
+        calls = []
+        real_aggregate = storage.aggregate_runs
+        monkeypatch.setattr(storage, "aggregate_runs", lambda runs: calls.append(1) or real_aggregate(runs))
+
+        storage.load_all(1091500)
+        storage.load_all(1091500)
+        assert len(calls) == 1
+
+        storage.save_run(1091500, "1920x1080", {"fps": {"average": 92.0}})
+        _, aggregated = storage.load_all(1091500)
+        assert len(calls) == 2
+        assert aggregated["1920x1080"]["fps"]["average"] == 91.0
+
+
+class TestGameDisplayName:
+    """Tests for game display names from game_info.json."""
+
+    def test_display_name_from_game_info(self, storage: BenchmarkStorage):
+        """The display name comes from game_info.json and follows later edits."""
+        import json
+        import os
+
+        info_file = storage.get_game_dir(1091500) / "game_info.json"
+        info_file.write_text(json.dumps({"display_name": "Cyberpunk 2077"}))
+        assert storage.get_game_display_name(1091500) == "Cyberpunk 2077"
+
+        info_file.write_text(json.dumps({"display_name": "Cyberpunk 2077: Phantom Liberty"}))
+        stat = info_file.stat()
+        os.utime(info_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert storage.get_game_display_name(1091500) == "Cyberpunk 2077: Phantom Liberty"
+
+    def test_display_name_fallback(self, storage: BenchmarkStorage):
+        """Without a readable game_info.json the folder name is used."""
+        assert storage.get_game_display_name(1091500) == "Steam App 1091500"
+
+        (storage.get_game_dir(1091500) / "game_info.json").write_text("{broken")
+        assert storage.get_game_display_name(1091500) == "Steam App 1091500"
+
+
+class TestOverviewReport:
+    """Tests for overview report regeneration errors."""
+
+    def test_errors_are_silent_by_default(self, tmp_path: Path, monkeypatch):
+        """Report failures return None unless the caller asks for the error."""
+        storage = BenchmarkStorage(base_dir=tmp_path)
+
+        def broken():
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(storage, "get_all_games", broken)
+
+        assert storage.regenerate_overview_report() is None
+        with pytest.raises(RuntimeError, match="disk full"):
+            storage.regenerate_overview_report(raise_errors=True)